@@ -0,0 +1,126 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+Measures the cost of a single fluent setter call and of build() on the
+generated builders.
+"""
+
+import sys
+from argparse import ArgumentParser
+from os.path import dirname, join
+from timeit import Timer
+from typing import Any, Callable
+
+
+def _per_call(function: Callable[[], Any], number: int) -> float:
+    """
+    Returns the best time of five runs in nanoseconds per call.
+
+    Args:
+        function (Callable[[], Any]):
+        number (int):
+
+    Returns:
+        float:
+
+    """
+    timer = Timer(function)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> int:
+    """
+
+    Returns:
+        int: The exit code.
+
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=100_000)
+    parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help="Ignore the builders generated ahead of time",
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, join(dirname(dirname(__file__)), "src"))
+    if args.dynamic:
+        sys.modules["buildinfo_om._builder_gen"] = None  # type: ignore
+
+    # pylint: disable=C0415
+    from buildinfo_om import DependencyBuilder, ModuleBuilder
+
+    builder = DependencyBuilder().with_id("group:artifact:1.0")
+    builder.with_sha256("0" * 64).with_scopes("compile")
+    module = ModuleBuilder().with_id("module")
+
+    def build_dependency() -> Any:
+        return (
+            DependencyBuilder()
+            .with_id("group:artifact:1.0")
+            .with_sha256("0" * 64)
+            .with_scopes("compile")
+            .build()
+        )
+
+    cases: dict[str, Callable[[], Any]] = {
+        "with_id (scalar)": lambda: builder.with_id("x"),
+        "with_scopes (sequence)": lambda: builder.with_scopes("a", "b"),
+        "with_properties (mapping)": lambda: module.with_properties(a="1"),
+        "with_dependencies (builders)": lambda: module.with_dependencies(
+            builder
+        ),
+        "DependencyBuilder.build": builder.build,
+        "Dependency end-to-end": build_dependency,
+    }
+
+    print(f"{'case':<32}{'ns/call':>10}")
+    for name, function in cases.items():
+        print(f"{name:<32}{_per_call(function, args.number):>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
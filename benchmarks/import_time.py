@@ -0,0 +1,343 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+Measures the time to import buildinfo_om for typical use cases and for
+every submodule. Every measurement is taken in a fresh interpreter. The
+cost is broken down per imported module using -X importtime and can be
+compared with a stored baseline.
+"""
+
+import json
+import subprocess  # nosec B404
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from os import environ, listdir, pathsep
+from os.path import dirname, exists, join
+from statistics import median
+from typing import Any
+
+SCENARIOS: dict[str, str] = {
+    "package": "import buildinfo_om",
+    "load-only": "from buildinfo_om import load_from_file",
+    "builder-only": "from buildinfo_om import DependencyBuilder",
+    "everything": "from buildinfo_om import *",
+}
+
+BASELINE: str = join(dirname(__file__), "import_time_baseline.json")
+_MIN_PHASE_S: float = 0.001
+
+_PROBE: str = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = sorted(
+    m for m in ("dacite", "buildinfo_om._builder",
+                "buildinfo_om._loadsave", "buildinfo_om._merge")
+    if m in sys.modules
+)
+print(elapsed, ",".join(loaded))
+"""
+
+
+def _source_path() -> str:
+    """
+
+    Returns:
+        str: The source directory of the project.
+
+    """
+    return join(dirname(dirname(__file__)), "src")
+
+
+def submodule_scenarios() -> dict[str, str]:
+    """
+
+    Returns:
+        dict[str, str]: A scenario importing each submodule on its own.
+
+    """
+    package: str = join(_source_path(), "buildinfo_om")
+    return {
+        f"module {name[:-3]}": f"import buildinfo_om.{name[:-3]}"
+        for name in sorted(listdir(package))
+        if name.endswith(".py") and not name.startswith("__")
+    }
+
+
+def _environment() -> dict[str, str]:
+    """
+
+    Returns:
+        dict[str, str]: The environment of the measuring interpreters.
+
+    """
+    env: dict[str, str] = dict(environ)
+    env["PYTHONPATH"] = pathsep.join(
+        p for p in (_source_path(), environ.get("PYTHONPATH")) if p
+    )
+    return env
+
+
+def measure(statement: str, repetitions: int) -> tuple[list[float], str]:
+    """
+    Runs the import statement in fresh interpreters.
+
+    Args:
+        statement (str): The import statement to measure.
+        repetitions (int): The number of interpreters to start.
+
+    Returns:
+        tuple[list[float], str]: The durations in seconds and the modules
+            loaded by the statement.
+
+    """
+    env: dict[str, str] = _environment()
+    probe: str = _PROBE.format(statement=statement)
+    durations: list[float] = []
+    loaded: str = ""
+    for _ in range(repetitions):
+        output: str = subprocess.run(  # nosec B603
+            [sys.executable, "-c", probe],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        elapsed, _, loaded = output.strip().partition(" ")
+        durations.append(float(elapsed))
+    return durations, loaded
+
+
+def measure_phases(statement: str, repetitions: int) -> dict[str, float]:
+    """
+    Runs the import statement with -X importtime in fresh interpreters.
+
+    Args:
+        statement (str): The import statement to measure.
+        repetitions (int): The number of interpreters to start.
+
+    Returns:
+        dict[str, float]: The median time in seconds spent importing each
+            module itself, excluding the modules it imports and the modules
+            imported during the startup of the interpreter.
+
+    """
+    env: dict[str, str] = _environment()
+    samples: defaultdict[str, list[float]] = defaultdict(list)
+    startup: set[str] = (
+        set() if statement == "pass" else set(measure_phases("pass", 1))
+    )
+    for _ in range(repetitions):
+        output: str = subprocess.run(  # nosec B603
+            [sys.executable, "-X", "importtime", "-c", statement],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stderr
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            own, _, module = line[12:].split("|", 2)
+            if own.strip().isdigit() and module.strip() not in startup:
+                samples[module.strip()].append(int(own) / 1e6)
+    return {module: median(times) for module, times in samples.items()}
+
+
+def _regressed(old: float, new: float, tolerance: float) -> bool:
+    """
+
+    Args:
+        old (float): The stored duration.
+        new (float): The current duration.
+        tolerance (float): The accepted relative increase.
+
+    Returns:
+        bool: True, if the current duration exceeds the tolerance.
+
+    """
+    return new > old * (1 + tolerance)
+
+
+def _regressions(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Compares the minimal import time of every scenario and the time of
+    every import phase measured in both runs. As the phases are dominated
+    by noise below a millisecond, a phase has only regressed if it got
+    slower by more than the tolerance and by more than a millisecond.
+
+    Args:
+        report (dict[str, Any]): The current measurements.
+        baseline (dict[str, Any]): The stored measurements.
+        tolerance (float): The accepted relative increase.
+
+    Returns:
+        list[str]: The descriptions of the scenarios and phases which got
+            slower.
+
+    """
+    found: list[str] = []
+    for name, result in report["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            continue
+        if _regressed(old["min_s"], result["min_s"], tolerance):
+            found.append(
+                f"{name}: {old['min_s'] * 1000:.2f} ms -> "
+                f"{result['min_s'] * 1000:.2f} ms"
+            )
+        old_phases: dict[str, float] = old.get("phases", {})
+        for module, own in result.get("phases", {}).items():
+            before: float | None = old_phases.get(module)
+            if before is None or own - before < _MIN_PHASE_S:
+                continue
+            if _regressed(before, own, tolerance):
+                found.append(
+                    f"{name} / {module}: {before * 1000:.2f} ms -> "
+                    f"{own * 1000:.2f} ms"
+                )
+    return found
+
+
+def main() -> int:
+    """
+
+    Returns:
+        int: The exit code, 1 if a regression has been found.
+
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repetitions", type=int, default=20)
+    parser.add_argument(
+        "-m",
+        "--submodules",
+        action="store_true",
+        help="Measure importing every submodule on its own too",
+    )
+    parser.add_argument(
+        "-p",
+        "--phases",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Show the N most expensive imports of each scenario",
+    )
+    parser.add_argument(
+        "-o", "--output", help="The file to store the results as baseline"
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=BASELINE,
+        help="The stored results to compare with, the committed baseline "
+        "if omitted",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The accepted relative increase of the minimal import time "
+        "and of every import phase",
+    )
+    parser.add_argument("scenarios", nargs="*", default=[])
+    args = parser.parse_args()
+
+    scenarios: dict[str, str] = dict(SCENARIOS)
+    if args.submodules:
+        scenarios.update(submodule_scenarios())
+    unknown: list[str] = [s for s in args.scenarios if s not in scenarios]
+    if len(unknown) > 0:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    baseline: dict[str, Any] | None = None
+    if exists(args.baseline) and args.output != args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    report: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "repetitions": args.repetitions,
+        "scenarios": {},
+    }
+    print(f"{'scenario':<20}{'min ms':>9}{'median ms':>11}  loaded")
+    for name in args.scenarios or scenarios:
+        durations, loaded = measure(scenarios[name], args.repetitions)
+        print(
+            f"{name:<20}{min(durations) * 1000:>9.2f}"
+            f"{median(durations) * 1000:>11.2f}  {loaded or '-'}"
+        )
+        result: dict[str, Any] = {
+            "min_s": min(durations),
+            "median_s": median(durations),
+        }
+        stored: dict[str, Any] = (baseline or {}).get("scenarios", {})
+        if args.phases > 0 or "phases" in stored.get(name, {}):
+            phases = measure_phases(scenarios[name], args.repetitions)
+            result["phases"] = phases
+            for module, own in sorted(
+                phases.items(), key=lambda p: p[1], reverse=True
+            )[: args.phases]:
+                print(f"    {module:<36}{own * 1000:>9.2f}")
+        report["scenarios"][name] = result
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if baseline is not None:
+        regressions: list[str] = _regressions(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
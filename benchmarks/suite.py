@@ -0,0 +1,322 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+Measures duration and peak memory of building, saving, loading and
+merging synthetic build infos at several scales. The results are written
+as JSON, so that they can be compared across commits.
+"""
+
+import json
+import platform
+import subprocess  # nosec B404
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from os.path import dirname, exists, join
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+
+sys.path.insert(0, join(dirname(dirname(__file__)), "src"))
+
+# pylint: disable=C0413
+from synthetic import SCALES, Shape, generate, generate_fragments
+
+from buildinfo_om import load_from_file, merge_build_info, save_to_file
+
+_FRAGMENTS: int = 4
+BASELINE: str = join(dirname(__file__), "baseline.json")
+
+
+def _measure(
+    function: Callable[[], Any], repetitions: int
+) -> dict[str, float]:
+    """
+    Runs the function once with tracemalloc to determine the peak of the
+    allocated memory and repeatedly without it to measure the duration.
+
+    Args:
+        function (Callable[[], Any]):
+        repetitions (int):
+
+    Returns:
+        dict[str, float]: The minimum and median duration in seconds and
+            the peak of the allocated memory in bytes.
+
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations: list[float] = []
+    for _ in range(repetitions):
+        start: float = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+
+    return {
+        "min_s": min(durations),
+        "median_s": median(durations),
+        "peak_bytes": peak,
+    }
+
+
+def _operations(shape: Shape, directory: str) -> dict[str, Callable[[], Any]]:
+    """
+
+    Args:
+        shape (Shape): The size of the build infos to use.
+        directory (str): The directory to store files in.
+
+    Returns:
+        dict[str, Callable[[], Any]]: The operations by their names.
+
+    """
+    build_info = generate(shape)
+    fragments = generate_fragments(shape, _FRAGMENTS)
+    path: str = join(directory, "build-info.json")
+    save_to_file(build_info, path)  # type: ignore
+
+    return {
+        "build": lambda: generate(shape),
+        "save": lambda: save_to_file(
+            build_info, join(directory, "saved.json")  # type: ignore
+        ),
+        "load": lambda: load_from_file(path),  # type: ignore
+        "merge": lambda: merge_build_info(*fragments),
+    }
+
+
+def _commit() -> str | None:
+    """
+
+    Returns:
+        str | None: The current git commit, if available.
+
+    """
+    try:
+        return subprocess.run(  # nosec B603 B607
+            ["git", "rev-parse", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales: list[str], repetitions: int) -> dict[str, Any]:
+    """
+    Measures all operations at the specified scales.
+
+    Args:
+        scales (list[str]): The names of the scales to use.
+        repetitions (int): The number of timed runs per operation.
+
+    Returns:
+        dict[str, Any]: The results and the environment they were taken in.
+
+    """
+    results: list[dict[str, Any]] = []
+    with TemporaryDirectory() as directory:
+        for scale in scales:
+            for operation, function in _operations(
+                SCALES[scale], directory
+            ).items():
+                results.append(
+                    {
+                        "scale": scale,
+                        "operation": operation,
+                        **_measure(function, repetitions),
+                    }
+                )
+
+    return {
+        "commit": _commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repetitions": repetitions,
+        "results": results,
+    }
+
+
+def _print(report: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """
+
+    Args:
+        report (dict[str, Any]): The results to print.
+        baseline (dict[str, Any] | None): The results to compare with.
+
+    Returns:
+        None:
+
+    """
+    previous: dict[tuple[str, str], dict[str, Any]] = {
+        (r["scale"], r["operation"]): r
+        for r in (baseline or {}).get("results", [])
+    }
+    print(
+        f"{'scale':<8}{'operation':<11}{'min ms':>10}{'median ms':>11}"
+        f"{'peak KiB':>11}{'time':>9}{'memory':>9}"
+    )
+    for result in report["results"]:
+        line: str = (
+            f"{result['scale']:<8}{result['operation']:<11}"
+            f"{result['min_s'] * 1000:>10.2f}"
+            f"{result['median_s'] * 1000:>11.2f}"
+            f"{result['peak_bytes'] / 1024:>11.0f}"
+        )
+        old = previous.get((result["scale"], result["operation"]))
+        if old is not None:
+            line += (
+                f"{result['min_s'] / old['min_s']:>8.2f}x"
+                f"{result['peak_bytes'] / max(old['peak_bytes'], 1):>8.2f}x"
+            )
+        print(line)
+
+
+def _regressions(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Compares the minimal duration and the peak memory of every operation
+    at every scale on its own, so that a regression of a single phase is
+    not hidden by the others.
+
+    Args:
+        report (dict[str, Any]): The current results.
+        baseline (dict[str, Any]): The stored results.
+        tolerance (float): The accepted relative increase.
+
+    Returns:
+        list[str]: The descriptions of the operations which got worse.
+
+    """
+    previous: dict[tuple[str, str], dict[str, Any]] = {
+        (r["scale"], r["operation"]): r for r in baseline.get("results", [])
+    }
+    found: list[str] = []
+    for result in report["results"]:
+        old = previous.get((result["scale"], result["operation"]))
+        if old is None:
+            continue
+        name: str = f"{result['scale']} {result['operation']}"
+        if result["min_s"] > old["min_s"] * (1 + tolerance):
+            found.append(
+                f"{name}: {old['min_s'] * 1000:.2f} ms -> "
+                f"{result['min_s'] * 1000:.2f} ms"
+            )
+        if result["peak_bytes"] > old["peak_bytes"] * (1 + tolerance):
+            found.append(
+                f"{name}: {old['peak_bytes'] / 1024:.0f} KiB -> "
+                f"{result['peak_bytes'] / 1024:.0f} KiB"
+            )
+    return found
+
+
+def main() -> int:
+    """
+
+    Returns:
+        int: The exit code, 1 if a regression has been found.
+
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repetitions", type=int, default=5)
+    parser.add_argument(
+        "-s",
+        "--scale",
+        action="append",
+        choices=list(SCALES),
+        help="The scales to measure, all if omitted",
+    )
+    parser.add_argument(
+        "-o", "--output", help="The file to write the results to"
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        default=BASELINE,
+        help="The results of a previous run to compare, the committed "
+        "baseline if omitted",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The accepted relative increase of duration and peak memory",
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, Any] | None = None
+    if exists(args.compare) and args.output != args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    report: dict[str, Any] = run(args.scale or list(SCALES), args.repetitions)
+    _print(report, baseline)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if baseline is not None:
+        regressions: list[str] = _regressions(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+Creates deterministic synthetic build infos of configurable size using
+the builders of buildinfo_om.
+"""
+
+from dataclasses import dataclass
+from random import Random
+
+from buildinfo_om import (
+    ArtifactBuilder,
+    BuildInfo,
+    BuildInfoBuilder,
+    DependencyBuilder,
+    ModuleBuilder,
+)
+
+
+@dataclass(frozen=True)
+class Shape:
+    """
+    The size of a synthetic build info.
+    """
+
+    modules: int
+    """The number of modules"""
+    artifacts: int
+    """The number of artifacts per module"""
+    dependencies: int
+    """The number of dependencies per module"""
+    depth: int
+    """The maximum length of the requesting chains of a dependency"""
+    properties: int
+    """The number of build properties"""
+
+
+SCALES: dict[str, Shape] = {
+    "small": Shape(
+        modules=2, artifacts=10, dependencies=20, depth=2, properties=20
+    ),
+    "medium": Shape(
+        modules=10, artifacts=50, dependencies=200, depth=4, properties=200
+    ),
+    "large": Shape(
+        modules=40,
+        artifacts=100,
+        dependencies=1000,
+        depth=6,
+        properties=1000,
+    ),
+}
+
+
+def _digest(rng: Random, bits: int) -> str:
+    """
+
+    Args:
+        rng (Random):
+        bits (int):
+
+    Returns:
+        str: A random hex digest of the specified size.
+
+    """
+    return f"{rng.getrandbits(bits):0{bits // 4}x}"
+
+
+def _module(rng: Random, index: int, shape: Shape) -> ModuleBuilder:
+    """
+
+    Args:
+        rng (Random):
+        index (int):
+        shape (Shape):
+
+    Returns:
+        ModuleBuilder:
+
+    """
+    module_id: str = f"org.example:module-{index}:1.0.0"
+    module = ModuleBuilder().with_id(module_id).with_type("python")
+    for a in range(shape.artifacts):
+        module.add_artifact(
+            ArtifactBuilder()
+            .with_type("whl")
+            .with_name(f"module_{index}-{a}.whl")
+            .with_path(f"dist/module_{index}-{a}.whl")
+            .with_sha256(_digest(rng, 256))
+            .with_sha1(_digest(rng, 160))
+            .with_md5(_digest(rng, 128))
+        )
+
+    ids: list[str] = [
+        f"org.example:library-{d}:{rng.randint(1, 9)}.0"
+        for d in range(shape.dependencies)
+    ]
+    for d, dependency_id in enumerate(ids):
+        chain: list[str] = [
+            ids[rng.randrange(d)]
+            for _ in range(min(d, rng.randint(0, shape.depth)))
+        ]
+        dependency = (
+            DependencyBuilder()
+            .with_id(dependency_id)
+            .with_type("whl")
+            .with_sha256(_digest(rng, 256))
+            .with_sha1(_digest(rng, 160))
+            .with_md5(_digest(rng, 128))
+            .with_scopes(rng.choice(("compile", "runtime", "test")))
+        )
+        dependency.with_requested_by((*chain, module_id))
+        module.add_dependency(dependency)
+    return module
+
+
+def generate(
+    shape: Shape, seed: int = 0, name: str = "synthetic", number: str = "1"
+) -> BuildInfo:
+    """
+    Creates a build info of the specified shape. The same shape and seed
+    always result in the same build info.
+
+    Args:
+        shape (Shape): The size of the build info.
+        seed (int): The seed of the random number generator.
+        name (str): The name of the build.
+        number (str): The number of the build.
+
+    Returns:
+        BuildInfo:
+
+    """
+    rng = Random(seed)
+    builder = (
+        BuildInfoBuilder()
+        .with_name(name)
+        .with_number(number)
+        .with_started("2024-01-01T00:00:00.000+0000")
+        .with_properties(
+            **{
+                f"buildInfo.env.VARIABLE_{p}": _digest(rng, 64)
+                for p in range(shape.properties)
+            }
+        )
+    )
+    for index in range(shape.modules):
+        builder.add_module(_module(rng, index, shape))
+    return builder.build()
+
+
+def generate_fragments(
+    shape: Shape, count: int, seed: int = 0
+) -> list[BuildInfo]:
+    """
+    Creates build infos of the same build, whose modules overlap, to be
+    merged.
+
+    Args:
+        shape (Shape): The size of each fragment.
+        count (int): The number of fragments.
+        seed (int): The seed of the first fragment.
+
+    Returns:
+        list[BuildInfo]:
+
+    """
+    return [generate(shape, seed + i) for i in range(count)]
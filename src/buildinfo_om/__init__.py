@@ -44,70 +44,211 @@
 """
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from ._builder import (
-    AffectedIssueBuilder,
-    AgentBuilder,
-    ArtifactBuilder,
-    BuildAgentBuilder,
-    BuildInfoBuilder,
-    DependencyBuilder,
-    IssuesBuilder,
-    ModuleBuilder,
-    TrackerBuilder,
-    VCSBuilder,
-)
-from ._loadsave import (
-    load_from_buffer,
-    load_from_dict,
-    load_from_file,
-    load_from_str,
-    save_to_buffer,
-    save_to_file,
-    transform_to_mapping,
-    transform_to_str,
-)
-from ._merge import merge_build_info
-from ._model import (
-    AffectedIssue,
-    Agent,
-    Artifact,
-    BuildAgent,
-    Dependency,
-    Issues,
-    Module,
-    Tracker,
-)
-from ._vcs import VCS, BuildInfo
+if TYPE_CHECKING:
+    from ._builder import (
+        AffectedIssueBuilder,
+        AgentBuilder,
+        ArtifactBuilder,
+        BuildAgentBuilder,
+        BuildInfoBuilder,
+        DependencyBuilder,
+        IssuesBuilder,
+        ModuleBuilder,
+        TrackerBuilder,
+        VCSBuilder,
+    )
+    from ._cache import MergeCache
+    from ._compact import (
+        CompactArtifact,
+        CompactDependency,
+        DigestPool,
+        compact_digests,
+        expand_digests,
+    )
+    from ._delta import (
+        DeltaArchive,
+        apply_delta,
+        load_delta,
+        save_delta,
+        transform_to_delta,
+    )
+    from ._diff import (
+        BuildInfoChange,
+        BuildInfoDiff,
+        ChangeKind,
+        ChangeScope,
+        diff_build_info,
+        iter_build_info_diff,
+    )
+    from ._digest import (
+        DigestCache,
+        FileDigests,
+        artifacts_from_paths,
+        digest_file,
+        digest_files,
+    )
+    from ._environment import EnvironmentCapture, EnvironmentSnapshot
+    from ._footprint import Footprint, PeakMemoryRecorder, measure_footprint
+    from ._graph import DependencyGraph
+    from ._index import BuildInfoIndex, IndexEntry
+    from ._instrument import (
+        Observer,
+        PhaseStatistics,
+        Recorder,
+        add_observer,
+        observe,
+        remove_observer,
+    )
+    from ._loadsave import (
+        fingerprint_build_info,
+        load_from_buffer,
+        load_from_dict,
+        load_from_file,
+        load_from_str,
+        save_to_buffer,
+        save_to_file,
+        transform_to_mapping,
+        transform_to_str,
+    )
+    from ._lockfiles import (
+        dependencies_from_pdm_lock,
+        dependencies_from_requirements,
+    )
+    from ._merge import merge_build_info, merge_build_info_external
+    from ._model import (
+        AffectedIssue,
+        Agent,
+        Artifact,
+        BuildAgent,
+        Dependency,
+        Issues,
+        Module,
+        Tracker,
+    )
+    from ._store import BuildInfoStore, BuildReference
+    from ._trie import (
+        ChainTrie,
+        TrieChains,
+        compact_build_info,
+        compact_requested_by,
+        expand_build_info,
+        expand_requested_by,
+    )
+    from ._vcs import VCS, BuildInfo
 
-__all__ = [
-    Agent.__name__,
-    BuildAgent.__name__,
-    BuildInfo.__name__,
-    Issues.__name__,
-    AffectedIssue.__name__,
-    Module.__name__,
-    Tracker.__name__,
-    Artifact.__name__,
-    Dependency.__name__,
-    VCS.__name__,
-    load_from_file.__name__,
-    load_from_buffer.__name__,
-    save_to_file.__name__,
-    save_to_buffer.__name__,
-    transform_to_str.__name__,
-    transform_to_mapping.__name__,
-    load_from_dict.__name__,
-    load_from_str.__name__,
-    merge_build_info.__name__,
-    AffectedIssueBuilder.__name__,
-    AgentBuilder.__name__,
-    ArtifactBuilder.__name__,
-    BuildAgentBuilder.__name__,
-    BuildInfoBuilder.__name__,
-    DependencyBuilder.__name__,
-    IssuesBuilder.__name__,
-    ModuleBuilder.__name__,
-    TrackerBuilder.__name__,
-    VCSBuilder.__name__,
-]
+_EXPORTS: dict[str, str] = {
+    "Agent": "._model",
+    "BuildAgent": "._model",
+    "BuildInfo": "._vcs",
+    "Issues": "._model",
+    "AffectedIssue": "._model",
+    "Module": "._model",
+    "Tracker": "._model",
+    "Artifact": "._model",
+    "Dependency": "._model",
+    "VCS": "._vcs",
+    "load_from_file": "._loadsave",
+    "load_from_buffer": "._loadsave",
+    "save_to_file": "._loadsave",
+    "save_to_buffer": "._loadsave",
+    "transform_to_str": "._loadsave",
+    "transform_to_mapping": "._loadsave",
+    "load_from_dict": "._loadsave",
+    "load_from_str": "._loadsave",
+    "merge_build_info": "._merge",
+    "merge_build_info_external": "._merge",
+    "fingerprint_build_info": "._loadsave",
+    "MergeCache": "._cache",
+    "diff_build_info": "._diff",
+    "iter_build_info_diff": "._diff",
+    "BuildInfoDiff": "._diff",
+    "BuildInfoChange": "._diff",
+    "ChangeKind": "._diff",
+    "ChangeScope": "._diff",
+    "transform_to_delta": "._delta",
+    "apply_delta": "._delta",
+    "save_delta": "._delta",
+    "load_delta": "._delta",
+    "DeltaArchive": "._delta",
+    "FileDigests": "._digest",
+    "DigestCache": "._digest",
+    "digest_file": "._digest",
+    "digest_files": "._digest",
+    "artifacts_from_paths": "._digest",
+    "dependencies_from_pdm_lock": "._lockfiles",
+    "dependencies_from_requirements": "._lockfiles",
+    "EnvironmentCapture": "._environment",
+    "EnvironmentSnapshot": "._environment",
+    "Observer": "._instrument",
+    "PhaseStatistics": "._instrument",
+    "Recorder": "._instrument",
+    "add_observer": "._instrument",
+    "remove_observer": "._instrument",
+    "observe": "._instrument",
+    "Footprint": "._footprint",
+    "measure_footprint": "._footprint",
+    "PeakMemoryRecorder": "._footprint",
+    "BuildInfoStore": "._store",
+    "BuildReference": "._store",
+    "BuildInfoIndex": "._index",
+    "IndexEntry": "._index",
+    "DependencyGraph": "._graph",
+    "ChainTrie": "._trie",
+    "TrieChains": "._trie",
+    "compact_requested_by": "._trie",
+    "expand_requested_by": "._trie",
+    "compact_build_info": "._trie",
+    "expand_build_info": "._trie",
+    "CompactArtifact": "._compact",
+    "CompactDependency": "._compact",
+    "DigestPool": "._compact",
+    "compact_digests": "._compact",
+    "expand_digests": "._compact",
+    "AffectedIssueBuilder": "._builder",
+    "AgentBuilder": "._builder",
+    "ArtifactBuilder": "._builder",
+    "BuildAgentBuilder": "._builder",
+    "BuildInfoBuilder": "._builder",
+    "DependencyBuilder": "._builder",
+    "IssuesBuilder": "._builder",
+    "ModuleBuilder": "._builder",
+    "TrackerBuilder": "._builder",
+    "VCSBuilder": "._builder",
+}
+
+__all__: list[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the submodule defining the requested name on first access, so
+    importing the package does not import all submodules and their
+    dependencies.
+
+    Args:
+        name (str):
+
+    Returns:
+        Any:
+
+    """
+    module_name: str | None = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: Any = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+
+    Returns:
+        list[str]:
+
+    """
+    return sorted({*globals(), *__all__})
@@ -46,17 +46,20 @@
 
 import collections
 from abc import ABC, abstractmethod
-from dataclasses import Field, asdict, fields, is_dataclass
-from functools import partial
-from inspect import isclass
-from os import environ
+from dataclasses import Field, fields, is_dataclass
+from enum import IntEnum, auto
+from inspect import Parameter, Signature, isclass
+from itertools import repeat, starmap
+from os import PathLike, environ
+from pathlib import Path
 from re import sub as _substitute
+from threading import Lock
 from types import UnionType, new_class
 from typing import (
     Any,
     Callable,
     Generic,
-    Mapping,
+    Iterable,
     Self,
     Sequence,
     TypeAlias,
@@ -67,8 +70,18 @@ from typing import (
     get_origin,
 )
 
-from makefun import create_function  # type: ignore
-
+from ._digest import (
+    DigestCache,
+    _artifact_from_digests,
+    digest_file,
+    digest_files,
+)
+from ._environment import (
+    _DEFAULT_CAPTURE,
+    EnvironmentCapture,
+    EnvironmentSnapshot,
+)
+from ._instrument import count, phase
 from ._model import (
     AffectedIssue,
     Agent,
@@ -109,19 +122,76 @@ def _to_lower_snake_case(value: str) -> str:
     return _substitute(r'(?<!^)(?=[A-Z])', '_', value).lower()
 
 
+class _DeferredList(list[Any]):
+    """
+    A list of instances and builders collected by appending. The builders
+    are invoked when the list is resolved.
+    """
+
+    def resolve(self) -> list[Any]:
+        """
+
+        Returns:
+            list[Any]: The items with all builders replaced by their results.
+
+        """
+        count("items.resolved", len(self))
+        return [i.build() if isinstance(i, _Builder) else i for i in self]
+
+
 class _BuildArguments(dict[str, Any]):
     """ """
 
-    def get_build_items(self) -> Mapping[str, Any]:
+    def append_item(self, field_name: str, item: Any) -> None:
         """
+        Appends an item to the list stored for the field. A list set before
+        is copied once, so that it is never modified in place.
+
+        Args:
+            field_name (str): The name of the field.
+            item (Any): The instance or builder to append.
 
         Returns:
-            Mapping[str, Any]:
+            None:
+
+        """
+        items: Any = self.get(field_name)
+        if not isinstance(items, _DeferredList):
+            items = _DeferredList(items or ())
+            self[field_name] = items
+        items.append(item)
 
+    def snapshot(self) -> dict[str, Any]:
         """
-        ro_copy: dict[str, Any] = {}
-        ro_copy.update(self)
-        return ro_copy
+        Copies the arguments, so that the collected lists can be resolved
+        without being modified concurrently.
+
+        Returns:
+            dict[str, Any]:
+
+        """
+        return {
+            k: _DeferredList(v) if isinstance(v, _DeferredList) else v
+            for k, v in self.items()
+        }
+
+    @staticmethod
+    def resolve(arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+
+        Args:
+            arguments (dict[str, Any]): The snapshot of the arguments.
+
+        Returns:
+            dict[str, Any]: The arguments with all collected lists resolved.
+
+        """
+        for k, v in arguments.items():
+            if isinstance(v, _DeferredList):
+                arguments[k] = v.resolve()
+            elif isinstance(v, _Builder):
+                arguments[k] = v.build()
+        return arguments
 
 
 class _Builder(ABC, Generic[TModel]):  # pylint: disable=R0903
@@ -139,12 +209,28 @@ class _Builder(ABC, Generic[TModel]):  # pylint: disable=R0903
         """
         self._args: _BuildArguments = _BuildArguments(existing_items or {})
 
+    def _build_arguments(self) -> dict[str, Any]:
+        """
+        Invokes the builders set for nested entities.
+
+        Returns:
+            dict[str, Any]: The arguments to create the entity with.
+
+        """
+        return _BuildArguments.resolve(self._args.snapshot())
+
     @classmethod
     def from_instance(cls, instance: TModel) -> Self:
         """
         Creates a new instance of the builder class initializing it with data
         taken from an existing instance.
 
+        The values of the instance are taken over by reference. Nested
+        entities, lists and mappings are shared with the existing instance
+        until they are replaced by a setter or copied by appending items, so
+        the cost of deriving a new instance depends on the changed fields
+        only.
+
         Args:
             instance (TModel): The existing instance.
 
@@ -152,7 +238,10 @@ class _Builder(ABC, Generic[TModel]):  # pylint: disable=R0903
             Self: The new instance
 
         """
-        data: dict[str, Any] = asdict(instance)
+        data: dict[str, Any] = {
+            f.name: getattr(instance, f.name)
+            for f in fields(instance)  # type: ignore
+        }
         builder = cls(data)
 
         return builder
@@ -172,8 +261,7 @@ _BuilderCollection = dict[str, type[_Builder[TModel]]]
 __all_builders: _BuilderCollection = {}
 
 
-_FluentFunctArgsType = Any | tuple[Any, ...] | Mapping[Any, Any]
-_FluentFunctionType = Callable[[Any, str, _FluentFunctArgsType], Any]
+_FluentFunctionType = Callable[..., Any]
 
 
 def _make_non_optional_type(t: type) -> type:
@@ -198,62 +286,155 @@ def _make_non_optional_type(t: type) -> type:
     return t
 
 
-def _determine_fluent_function(
-    field: Field, additional_builders: _BuilderCollection
-) -> tuple[_FluentFunctionType, str, type]:
+class _SetterKind(IntEnum):
+    """ """
+
+    SCALAR = auto()
+    """
+    The value is set as it is.
+    """
+    BUILDER = auto()
+    """
+    The value is created by a builder.
+    """
+    SEQUENCE = auto()
+    """
+    The values are collected into a list.
+    """
+    MAPPING = auto()
+    """
+    The keyword arguments are used as mapping.
+    """
+    BUILDER_SEQUENCE = auto()
+    """
+    The values are created by a sequence of builders.
+    """
+
+
+def _scalar_setter(field_name: str) -> Callable[..., Any]:
     """
 
     Args:
-        field (Field):
-        additional_builders (_BuilderCollection):
+        field_name (str):
 
     Returns:
-        tuple[_FluentFunctionType, str, type]:
+        Callable[..., Any]: A setter assigning its argument.
+
     """
 
-    def with_scalar(self, value: Any, *, field_name: str):
-        my_args: _BuildArguments = self._args  # pylint: disable=W0212
-        my_args[field_name] = value
+    def with_scalar(self, value: Any):
+        self._args[field_name] = value  # pylint: disable=W0212
         return self
 
-    def with_builder(self, builder: _Builder, *, field_name: str):
-        my_args: _BuildArguments = self._args  # pylint: disable=W0212
-        my_args[field_name] = builder.build()
+    return with_scalar
+
+
+def _builder_setter(field_name: str) -> Callable[..., Any]:
+    """
+
+    Args:
+        field_name (str):
+
+    Returns:
+        Callable[..., Any]: A setter assigning a builder, which is invoked
+            when the entity is built.
+
+    """
+
+    def with_builder(self, builder: _Builder):
+        self._args[field_name] = builder  # pylint: disable=W0212
         return self
 
-    def with_sequence(self, *values: Any, field_name: str):
-        my_args: _BuildArguments = self._args  # pylint: disable=W0212
-        seq: Sequence = list(values)
-        my_args[field_name] = seq
+    return with_builder
+
+
+def _sequence_setter(field_name: str) -> Callable[..., Any]:
+    """
+
+    Args:
+        field_name (str):
+
+    Returns:
+        Callable[..., Any]: A setter assigning its arguments as list.
+
+    """
+
+    def with_sequence(self, *values: Any):
+        self._args[field_name] = list(values)  # pylint: disable=W0212
         return self
 
-    def with_mapping(self, field_name: str, **values: Any):
-        my_args: _BuildArguments = self._args  # pylint: disable=W0212
-        mapping: Mapping[str, Any] = values
-        my_args[field_name] = mapping
+    return with_sequence
+
+
+def _mapping_setter(field_name: str) -> Callable[..., Any]:
+    """
+
+    Args:
+        field_name (str):
+
+    Returns:
+        Callable[..., Any]: A setter assigning its keyword arguments.
+
+    """
+
+    def with_mapping(self, **values: Any):
+        self._args[field_name] = values  # pylint: disable=W0212
         return self
 
-    def with_builder_sequence(self, *builders: _Builder, field_name: str):
-        my_args: _BuildArguments = self._args  # pylint: disable=W0212
-        seq: Sequence = [b.build() for b in builders]
-        my_args[field_name] = seq
+    return with_mapping
+
+
+def _builder_sequence_setter(field_name: str) -> Callable[..., Any]:
+    """
+
+    Args:
+        field_name (str):
+
+    Returns:
+        Callable[..., Any]: A setter assigning builders, which are invoked
+            when the entity is built.
+
+    """
+
+    def with_builder_sequence(self, *builders: _Builder):
+        self._args[field_name] = _DeferredList(  # pylint: disable=W0212
+            builders
+        )
         return self
 
-    field_type: type = field.type
+    return with_builder_sequence
+
+
+_SETTER_FACTORIES: dict[_SetterKind, Callable[[str], Callable[..., Any]]] = {
+    _SetterKind.SCALAR: _scalar_setter,
+    _SetterKind.BUILDER: _builder_setter,
+    _SetterKind.SEQUENCE: _sequence_setter,
+    _SetterKind.MAPPING: _mapping_setter,
+    _SetterKind.BUILDER_SEQUENCE: _builder_sequence_setter,
+}
+
+
+def _classify_field(field: Field) -> tuple[_SetterKind, str, Any]:
+    """
+
+    Args:
+        field (Field):
+
+    Returns:
+        tuple[_SetterKind, str, Any]: The kind of the setter, the name of
+            its argument and the type of the argument. For builder kinds,
+            the type is the dataclass type to build.
+    """
+    field_type: type = field.type  # type: ignore
     field_type = _make_non_optional_type(field_type)
 
     if is_dataclass(field_type):
-        arg_type = _make_builder(
-            field_type,  # type: ignore
-            additional_builders,
-        )
-        arg_name = "builder"
-        return cast(_FluentFunctionType, with_builder), arg_name, arg_type
+        return _SetterKind.BUILDER, "builder", field_type
     if get_origin(field_type) is collections.abc.Mapping or (
         isclass(field_type) and issubclass(field_type, collections.abc.Mapping)
     ):
         args = get_args(field_type)
-        return cast(_FluentFunctionType, with_mapping), "**values", args[-1]
+        return _SetterKind.MAPPING, "**values", args[-1]
     if get_origin(field_type) is collections.abc.Sequence or (
         isclass(field_type)
         and issubclass(field_type, collections.abc.Sequence)
@@ -263,30 +444,78 @@ def _determine_fluent_function(
         if len(args) == 1:
             field_type = args[0]
             if is_dataclass(field_type):
-                arg_type = _make_builder(
-                    field_type,  # type: ignore
-                    additional_builders,
-                )
-                arg_name = "*builders"
-                return (
-                    cast(_FluentFunctionType, with_builder_sequence),
-                    arg_name,
-                    arg_type,
-                )
-
-            arg_name = "*values"
-            return (
-                cast(_FluentFunctionType, with_sequence),
-                arg_name,
-                field_type,
-            )
-        return (
-            cast(_FluentFunctionType, with_sequence),
-            "*values",
-            Any,
-        )  # type: ignore
-
-    return cast(_FluentFunctionType, with_scalar), "value", field_type
+                return _SetterKind.BUILDER_SEQUENCE, "*builders", field_type
+            return _SetterKind.SEQUENCE, "*values", field_type
+        return _SetterKind.SEQUENCE, "*values", Any
+
+    return _SetterKind.SCALAR, "value", field_type
+
+
+def _determine_fluent_function(
+    field: Field, additional_builders: _BuilderCollection
+) -> tuple[_FluentFunctionType, str, type]:
+    """
+
+    Args:
+        field (Field):
+        additional_builders (_BuilderCollection):
+
+    Returns:
+        tuple[_FluentFunctionType, str, type]: The setter, the name of its
+            argument and the type of its argument.
+    """
+    kind, arg_name, arg_type = _classify_field(field)
+    if kind in (_SetterKind.BUILDER, _SetterKind.BUILDER_SEQUENCE):
+        arg_type = _make_builder(arg_type, additional_builders)
+
+    return (
+        cast(_FluentFunctionType, _SETTER_FACTORIES[kind](field.name)),
+        arg_name,
+        arg_type,
+    )
+
+
+def _model_signature(entity_type: type) -> tuple[tuple[str, str], ...]:
+    """
+    Describes the fields of a dataclass to detect outdated generated
+    builders.
+
+    Args:
+        entity_type (type):
+
+    Returns:
+        tuple[tuple[str, str], ...]: The name and type of all fields.
+
+    """
+    return tuple((f.name, str(f.type)) for f in fields(entity_type))
+
+
+def _precompiled_builder(
+    entity_type: type[TModel],
+) -> type[_Builder[TModel]] | None:
+    """
+    Returns the builder generated ahead of time by the _codegen module, if
+    it exists and matches the current fields of the dataclass.
+
+    Args:
+        entity_type (type[TModel]):
+
+    Returns:
+        type[_Builder[TModel]] | None:
+
+    """
+    if _precompiled is None:
+        return None
+
+    builder_class: Any = getattr(
+        _precompiled, f"{entity_type.__name__}Builder", None
+    )
+    if builder_class is None or getattr(
+        builder_class, "__model_signature__", None
+    ) != _model_signature(entity_type):
+        return None
+
+    return cast(type[_Builder[TModel]], builder_class)
 
 
 def _make_builder(
@@ -310,11 +539,22 @@ def _make_builder(
     if entity_name in additional_builders:
         return additional_builders[entity_name]
 
+    precompiled_class = _precompiled_builder(entity_type)
+    if precompiled_class is not None:
+        additional_builders[entity_name] = cast(
+            type[_Builder], precompiled_class
+        )
+        return precompiled_class
+
     update_ns: dict = {}
 
-    def build(self) -> TModel:
-        my_builder_args: _BuildArguments = self._args  # pylint: disable=W0212
-        return cast(TModel, entity_type(**my_builder_args.get_build_items()))
+    def build(self) -> TModel:  # pylint: disable=W0212
+        result: TModel = entity_type(**self._build_arguments())
+        count("objects.built")
+        return result
+
+    build.__qualname__ = f"{builder_name}.build"
+    build.__annotations__["return"] = entity_type
 
     for field in fields(entity_type):
         function_name, target_func = _generate_field_setter_function(
@@ -325,9 +565,7 @@ def _make_builder(
 
         update_ns[function_name] = target_func
 
-    update_ns[build.__name__] = create_function(
-        f"build(self) -> {entity_type.__qualname__}", build
-    )
+    update_ns[build.__name__] = build
 
     builder_class = new_class(
         builder_name, [_Builder[TModel]], None, lambda ns: ns.update(update_ns)
@@ -387,7 +625,7 @@ def _gen_method_doc(
 
         In case the argument is an instance of the Builder base class or a
         sequence of this, the builder will be invoked to create a new instance
-        of the new class before setting the attribute.
+        of the new class when the resulting instance is built.
 
         Args:
             {arg_name} ({arg_type_name}): The value of the property / attribute to set or the builder to create these values.
@@ -417,19 +655,87 @@ def _generate_field_setter_function(
     target_func, arg_name, arg_type = _determine_fluent_function(
         field, additional_builders
     )
-    arg_type_name = (
-        arg_type.__name__ if isclass(arg_type) else str(arg_type)
-    )
-    arg: str = f"{arg_name}: {arg_type_name}"
+    annotation: Any = arg_type
     if field.name == "requestedBy":
-        arg = f"{arg_name}: tuple[str]"
-    signature: str = f"{function_name}(self, {arg}) -> Self"
-    target_func = partial(target_func, field_name=field.name)
+        annotation = tuple[str]
     doc = _gen_method_doc(class_name, field, arg_name, arg_type)
-    target_func = create_function(signature, target_func, doc=doc)
+
+    target_func.__name__ = function_name
+    target_func.__qualname__ = f"{class_name}Builder.{function_name}"
+    target_func.__doc__ = doc
+    target_func.__annotations__ = {
+        arg_name.lstrip("*"): annotation,
+        "return": Self,
+    }
+    setattr(
+        target_func,
+        "__signature__",
+        Signature(
+            [
+                Parameter("self", Parameter.POSITIONAL_OR_KEYWORD),
+                Parameter(
+                    arg_name.lstrip("*"),
+                    _PARAMETER_KINDS.get(
+                        arg_name.count("*"), Parameter.POSITIONAL_OR_KEYWORD
+                    ),
+                    annotation=annotation,
+                ),
+            ],
+            return_annotation=Self,
+        ),
+    )
     return function_name, target_func
 
 
+_PARAMETER_KINDS: dict[int, Any] = {
+    1: Parameter.VAR_POSITIONAL,
+    2: Parameter.VAR_KEYWORD,
+}
+
+
+def _build_from_columns(
+    entity_type: type[TModel], **columns: Iterable[Any] | None
+) -> list[TModel]:
+    """
+    Creates instances of the dataclass from column-oriented values without
+    using a builder per instance.
+
+    Args:
+        entity_type (type[TModel]): The dataclass to create.
+        columns (Mapping[str, Iterable[Any] | None]): The values of the
+            fields by the name of the field. Omitted columns are passed
+            as None.
+
+    Returns:
+        list[TModel]:
+
+    """
+    materialized: dict[str, Sequence[Any]] = {
+        name: column if isinstance(column, (list, tuple)) else list(column)
+        for name, column in columns.items()
+        if column is not None
+    }
+    lengths: set[int] = {len(c) for c in materialized.values()}
+    if len(lengths) == 0:
+        raise ValueError("At least one column must be specified")
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length", lengths)
+
+    length: int = lengths.pop()
+    ordered: list[Iterable[Any]] = [
+        materialized.get(f.name, repeat(None, length))
+        for f in fields(entity_type)  # type: ignore
+    ]
+    count("objects.built", length)
+    return list(starmap(entity_type, zip(*ordered)))
+
+
+try:
+    from . import _builder_gen as _precompiled  # pylint: disable=C0413
+except ImportError:  # pragma: no cover
+    _precompiled = None  # type: ignore  # pylint: disable=C0103
+
+
 _BuildAgentBuilder: TypeAlias = _make_builder(  # type: ignore
     BuildAgent, __all_builders
 )
@@ -455,6 +761,62 @@ _ArtifactBuilder: TypeAlias = _make_builder(  # type: ignore
 
 class ArtifactBuilder(_ArtifactBuilder):  # pylint: disable=R0903
     """ """
+
+    @classmethod
+    def from_file(cls, path: str | PathLike) -> Self:
+        """
+        Creates a new builder for the artifact stored in the specified file.
+        Name and type are taken from the file name and its extension. The
+        MD5, SHA-1 and SHA-256 digests are computed reading the file once.
+
+        Args:
+            path (str | PathLike): The path of the file.
+
+        Returns:
+            Self: The new instance
+
+        """
+        return cls.from_instance(
+            _artifact_from_digests(path, digest_file(path))
+        )
+
+    @classmethod
+    def build_many(  # pylint: disable=R0913
+        cls,
+        *,
+        names: Iterable[str | None] | None = None,
+        types: Iterable[str | None] | None = None,
+        paths: Iterable[str | None] | None = None,
+        sha256: Iterable[str | None] | None = None,
+        sha1: Iterable[str | None] | None = None,
+        md5: Iterable[str | None] | None = None,
+    ) -> list[Artifact]:
+        """
+        Creates many artifacts at once from column-oriented values. The
+        n-th artifact is created from the n-th value of every column.
+
+        Args:
+            names (Iterable[str | None] | None):
+            types (Iterable[str | None] | None):
+            paths (Iterable[str | None] | None):
+            sha256 (Iterable[str | None] | None):
+            sha1 (Iterable[str | None] | None):
+            md5 (Iterable[str | None] | None):
+
+        Returns:
+            list[Artifact]:
+
+        """
+        return _build_from_columns(
+            Artifact,
+            type=types,
+            name=names,
+            path=paths,
+            sha256=sha256,
+            sha1=sha1,
+            md5=md5,
+        )
+
     def with_hash_composite_value(self, hash_value: str) -> Self:
         """
 
@@ -499,6 +861,47 @@ _DependencyBuilder: TypeAlias = _make_builder(  # type: ignore
 class DependencyBuilder(_DependencyBuilder):  # pylint: disable=R0903
     """ """
 
+    @classmethod
+    def build_many(  # pylint: disable=R0913
+        cls,
+        *,
+        ids: Iterable[str | None] | None = None,
+        types: Iterable[str | None] | None = None,
+        sha256: Iterable[str | None] | None = None,
+        sha1: Iterable[str | None] | None = None,
+        md5: Iterable[str | None] | None = None,
+        scopes: Iterable[Sequence[str] | None] | None = None,
+        requested_by: Iterable[Sequence[Sequence[str]] | None] | None = None,
+    ) -> list[Dependency]:
+        """
+        Creates many dependencies at once from column-oriented values. The
+        n-th dependency is created from the n-th value of every column.
+        Sequences of scopes and requesting chains are used as they are.
+
+        Args:
+            ids (Iterable[str | None] | None):
+            types (Iterable[str | None] | None):
+            sha256 (Iterable[str | None] | None):
+            sha1 (Iterable[str | None] | None):
+            md5 (Iterable[str | None] | None):
+            scopes (Iterable[Sequence[str] | None] | None):
+            requested_by (Iterable[Sequence[Sequence[str]] | None] | None):
+
+        Returns:
+            list[Dependency]:
+
+        """
+        return _build_from_columns(
+            Dependency,
+            type=types,
+            id=ids,
+            sha256=sha256,
+            sha1=sha1,
+            md5=md5,
+            scopes=scopes,
+            requestedBy=requested_by,
+        )
+
     def with_hash_composite_value(self, hash_value: str) -> Self:
         """
 
@@ -540,9 +943,132 @@ _ModuleBuilder: TypeAlias = _make_builder(  # type: ignore
 )
 
 
-class ModuleBuilder(_ModuleBuilder):  # pylint: disable=R0903
+class _CollectingBuilder:  # pylint: disable=R0903
+    """
+    Provides thread-safe appending of items to list fields. The builders
+    of appended items are invoked when the owning builder is built.
+    """
+
+    _args: _BuildArguments
+
+    def __init__(self, existing_items: dict[str, Any] | None = None) -> None:
+        """
+
+        Args:
+            existing_items (dict[str, Any], optional):
+
+        Returns:
+            None:
+
+        """
+        super().__init__(existing_items)  # type: ignore
+        self._lock = Lock()
+
+    def _add_item(self, field_name: str, item: Any) -> Self:
+        """
+
+        Args:
+            field_name (str): The name of the list field.
+            item (Any): The instance or builder to append.
+
+        Returns:
+            Self:
+
+        """
+        with self._lock:
+            self._args.append_item(field_name, item)
+        return self
+
+    def _collected_items(self) -> dict[str, Any]:
+        """
+
+        Returns:
+            dict[str, Any]: The arguments to create the entity with.
+
+        """
+        with self._lock:
+            arguments: dict[str, Any] = self._args.snapshot()
+        with phase("build.resolve"):
+            return _BuildArguments.resolve(arguments)
+
+
+class ModuleBuilder(_CollectingBuilder, _ModuleBuilder):
     """ """
-    pass
+
+    def add_artifact(self, artifact: Artifact | ArtifactBuilder) -> Self:
+        """
+        Appends an artifact to the module. Builders are invoked when the
+        module is built. This method can be called from multiple threads.
+
+        Args:
+            artifact (Artifact | ArtifactBuilder): The artifact to add.
+
+        Returns:
+            Self:
+
+        """
+        return self._add_item("artifacts", artifact)
+
+    def add_dependency(
+        self, dependency: Dependency | DependencyBuilder
+    ) -> Self:
+        """
+        Appends a dependency to the module. Builders are invoked when the
+        module is built. This method can be called from multiple threads.
+
+        Args:
+            dependency (Dependency | DependencyBuilder): The dependency to
+                add.
+
+        Returns:
+            Self:
+
+        """
+        return self._add_item("dependencies", dependency)
+
+    def scan_directory(
+        self,
+        root: str | PathLike,
+        patterns: Iterable[str] = ("**/*",),
+        cache: DigestCache | None = None,
+        workers: int | None = None,
+    ) -> Self:
+        """
+        Adds an artifact for every file below the root directory matching
+        one of the glob patterns. The path of the artifacts is relative to
+        the root directory. Files are hashed concurrently; if a cache is
+        specified, only files which are new or changed are hashed.
+
+        Args:
+            root (str | PathLike): The directory to scan.
+            patterns (Iterable[str]): The glob patterns relative to root.
+            cache (DigestCache | None): The cache of previous digests.
+            workers (int | None): The number of threads to use for hashing.
+
+        Returns:
+            Self:
+
+        """
+        root_path = Path(root)
+        files: list[Path] = sorted(
+            {p for pattern in patterns for p in root_path.glob(pattern)}
+        )
+        files = [f for f in files if f.is_file()]
+        for file, digests in zip(files, digest_files(files, workers, cache)):
+            relative: str = file.relative_to(root_path).as_posix()
+            self.add_artifact(_artifact_from_digests(relative, digests))
+        return self
+
+    def build(self) -> Module:
+        """
+
+        Returns:
+            Module:
+
+        """
+        result: Module = Module(**self._collected_items())
+        count("objects.built")
+        return result
 
 
 _TrackerBuilder: TypeAlias = _make_builder(  # type: ignore
@@ -588,9 +1114,34 @@ _BuildInfoBuilder: TypeAlias = _make_builder(  # type: ignore
 )
 
 
-class BuildInfoBuilder(_BuildInfoBuilder):
+class BuildInfoBuilder(_CollectingBuilder, _BuildInfoBuilder):
     """ """
 
+    def add_module(self, module: Module | ModuleBuilder) -> Self:
+        """
+        Appends a module to the build info. Builders are invoked when the
+        build info is built. This method can be called from multiple threads.
+
+        Args:
+            module (Module | ModuleBuilder): The module to add.
+
+        Returns:
+            Self:
+
+        """
+        return self._add_item("modules", module)
+
+    def build(self) -> BuildInfo:
+        """
+
+        Returns:
+            BuildInfo:
+
+        """
+        result: BuildInfo = BuildInfo(**self._collected_items())
+        count("objects.built")
+        return result
+
     def collect_env(self, **additional_properties: Any) -> Self:
         """
 
@@ -623,5 +1174,39 @@ class BuildInfoBuilder(_BuildInfoBuilder):
         properties = {k: v for k, v in properties.items() if k not in keys}
         return self.with_properties(**properties)
 
+    def with_environment(
+        self,
+        capture: EnvironmentCapture | EnvironmentSnapshot | None = None,
+        **additional_properties: str,
+    ) -> Self:
+        """
+        Sets the properties to the captured environment variables. Unless
+        additional properties are specified, the snapshot is not copied but
+        shared with all other builders using it. Additional properties take
+        precedence over environment variables of the same name.
+
+        Args:
+            capture (EnvironmentCapture | EnvironmentSnapshot | None): The
+                capture to take the snapshot of the process environment
+                from or the snapshot to use. If None, all variables of the
+                process environment are used.
+            additional_properties (Mapping[str, str]):
+
+        Returns:
+            Self:
+
+        """
+        if capture is None:
+            capture = _DEFAULT_CAPTURE
+        snapshot: EnvironmentSnapshot = (
+            capture.snapshot()
+            if isinstance(capture, EnvironmentCapture)
+            else capture
+        )
+        if len(additional_properties) > 0:
+            snapshot = EnvironmentSnapshot(snapshot, **additional_properties)
+        self._args["properties"] = snapshot
+        return self
+
 
 del __all_builders
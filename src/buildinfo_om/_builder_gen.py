@@ -0,0 +1,1212 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+Generated by buildinfo_om._codegen. Do not edit.
+"""
+
+from typing import Any, Self
+
+from ._builder import _Builder, _DeferredList
+from ._instrument import count
+from ._model import (
+    AffectedIssue,
+    Agent,
+    Artifact,
+    BuildAgent,
+    Dependency,
+    Issues,
+    Module,
+    Tracker,
+)
+from ._vcs import VCS, BuildInfo
+
+
+class BuildAgentBuilder(_Builder[BuildAgent]):
+    """
+        The BuildAgentBuilder represents an implementation of the builder pattern
+        for the BuildAgent dataclass.
+    """
+
+    __model_signature__ = (
+        ('name', 'str | None'),
+        ('version', 'str | None'),
+    )
+
+    def with_name(self, value: str) -> Self:
+        """
+        Sets the value of the 'name' attribute of the resulting
+        BuildAgent instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["name"] = value
+        return self
+
+    def with_version(self, value: str) -> Self:
+        """
+        Sets the value of the 'version' attribute of the resulting
+        BuildAgent instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["version"] = value
+        return self
+
+    def build(self) -> BuildAgent:
+        result = BuildAgent(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class AgentBuilder(_Builder[Agent]):
+    """
+        The AgentBuilder represents an implementation of the builder pattern
+        for the Agent dataclass.
+    """
+
+    __model_signature__ = (
+        ('name', 'str | None'),
+        ('version', 'str | None'),
+    )
+
+    def with_name(self, value: str) -> Self:
+        """
+        Sets the value of the 'name' attribute of the resulting
+        Agent instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["name"] = value
+        return self
+
+    def with_version(self, value: str) -> Self:
+        """
+        Sets the value of the 'version' attribute of the resulting
+        Agent instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["version"] = value
+        return self
+
+    def build(self) -> Agent:
+        result = Agent(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class ArtifactBuilder(_Builder[Artifact]):
+    """
+        The ArtifactBuilder represents an implementation of the builder pattern
+        for the Artifact dataclass.
+    """
+
+    __model_signature__ = (
+        ('type', 'str | None'),
+        ('name', 'str | None'),
+        ('path', 'str | None'),
+        ('sha256', 'str | None'),
+        ('sha1', 'str | None'),
+        ('md5', 'str | None'),
+    )
+
+    def with_type(self, value: str) -> Self:
+        """
+        Sets the value of the 'type' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["type"] = value
+        return self
+
+    def with_name(self, value: str) -> Self:
+        """
+        Sets the value of the 'name' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["name"] = value
+        return self
+
+    def with_path(self, value: str) -> Self:
+        """
+        Sets the value of the 'path' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["path"] = value
+        return self
+
+    def with_sha256(self, value: str) -> Self:
+        """
+        Sets the value of the 'sha256' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["sha256"] = value
+        return self
+
+    def with_sha1(self, value: str) -> Self:
+        """
+        Sets the value of the 'sha1' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["sha1"] = value
+        return self
+
+    def with_md5(self, value: str) -> Self:
+        """
+        Sets the value of the 'md5' attribute of the resulting
+        Artifact instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["md5"] = value
+        return self
+
+    def build(self) -> Artifact:
+        result = Artifact(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class DependencyBuilder(_Builder[Dependency]):
+    """
+        The DependencyBuilder represents an implementation of the builder pattern
+        for the Dependency dataclass.
+    """
+
+    __model_signature__ = (
+        ('type', 'str | None'),
+        ('id', 'str | None'),
+        ('sha256', 'str | None'),
+        ('sha1', 'str | None'),
+        ('md5', 'str | None'),
+        ('scopes', 'collections.abc.Sequence[str] | None'),
+        ('requestedBy', 'collections.abc.Sequence[collections.abc.Sequence[str]] | None'),
+    )
+
+    def with_type(self, value: str) -> Self:
+        """
+        Sets the value of the 'type' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["type"] = value
+        return self
+
+    def with_id(self, value: str) -> Self:
+        """
+        Sets the value of the 'id' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["id"] = value
+        return self
+
+    def with_sha256(self, value: str) -> Self:
+        """
+        Sets the value of the 'sha256' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["sha256"] = value
+        return self
+
+    def with_sha1(self, value: str) -> Self:
+        """
+        Sets the value of the 'sha1' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["sha1"] = value
+        return self
+
+    def with_md5(self, value: str) -> Self:
+        """
+        Sets the value of the 'md5' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["md5"] = value
+        return self
+
+    def with_scopes(self, *values: str) -> Self:
+        """
+        Sets the value of the 'scopes' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            values (collections.abc.Sequence[str]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["scopes"] = list(values)
+        return self
+
+    def with_requested_by(self, *values: tuple[str]) -> Self:
+        """
+        Sets the value of the 'requestedBy' attribute of the resulting
+        Dependency instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            values (collections.abc.Sequence[collections.abc.Sequence[str]]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["requestedBy"] = list(values)
+        return self
+
+    def build(self) -> Dependency:
+        result = Dependency(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class ModuleBuilder(_Builder[Module]):
+    """
+        The ModuleBuilder represents an implementation of the builder pattern
+        for the Module dataclass.
+    """
+
+    __model_signature__ = (
+        ('properties', 'collections.abc.Mapping[str, str] | None'),
+        ('id', 'str | None'),
+        ('type', 'str | None'),
+        ('artifacts', 'collections.abc.Sequence[buildinfo_om._model.Artifact] | None'),
+        ('dependencies', 'collections.abc.Sequence[buildinfo_om._model.Dependency] | None'),
+    )
+
+    def with_properties(self, **values: str) -> Self:
+        """
+        Sets the value of the 'properties' attribute of the resulting
+        Module instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            values (collections.abc.Mapping[str, collections.abc.Sequence[str]]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["properties"] = values
+        return self
+
+    def with_id(self, value: str) -> Self:
+        """
+        Sets the value of the 'id' attribute of the resulting
+        Module instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["id"] = value
+        return self
+
+    def with_type(self, value: str) -> Self:
+        """
+        Sets the value of the 'type' attribute of the resulting
+        Module instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["type"] = value
+        return self
+
+    def with_artifacts(self, *builders: ArtifactBuilder) -> Self:
+        """
+        Sets the value of the 'artifacts' attribute of the resulting
+        Module instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builders (collections.abc.Sequence[ArtifactBuilder]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["artifacts"] = _DeferredList(builders)
+        return self
+
+    def with_dependencies(self, *builders: DependencyBuilder) -> Self:
+        """
+        Sets the value of the 'dependencies' attribute of the resulting
+        Module instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builders (collections.abc.Sequence[DependencyBuilder]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["dependencies"] = _DeferredList(builders)
+        return self
+
+    def build(self) -> Module:
+        result = Module(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class TrackerBuilder(_Builder[Tracker]):
+    """
+        The TrackerBuilder represents an implementation of the builder pattern
+        for the Tracker dataclass.
+    """
+
+    __model_signature__ = (
+        ('name', "<class 'str'>"),
+        ('version', "<class 'str'>"),
+    )
+
+    def with_name(self, value: str) -> Self:
+        """
+        Sets the value of the 'name' attribute of the resulting
+        Tracker instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["name"] = value
+        return self
+
+    def with_version(self, value: str) -> Self:
+        """
+        Sets the value of the 'version' attribute of the resulting
+        Tracker instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["version"] = value
+        return self
+
+    def build(self) -> Tracker:
+        result = Tracker(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class AffectedIssueBuilder(_Builder[AffectedIssue]):
+    """
+        The AffectedIssueBuilder represents an implementation of the builder pattern
+        for the AffectedIssue dataclass.
+    """
+
+    __model_signature__ = (
+        ('key', 'str | None'),
+        ('url', 'str | None'),
+        ('summary', 'str | None'),
+        ('aggregated', 'bool | None'),
+    )
+
+    def with_key(self, value: str) -> Self:
+        """
+        Sets the value of the 'key' attribute of the resulting
+        AffectedIssue instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["key"] = value
+        return self
+
+    def with_url(self, value: str) -> Self:
+        """
+        Sets the value of the 'url' attribute of the resulting
+        AffectedIssue instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["url"] = value
+        return self
+
+    def with_summary(self, value: str) -> Self:
+        """
+        Sets the value of the 'summary' attribute of the resulting
+        AffectedIssue instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["summary"] = value
+        return self
+
+    def with_aggregated(self, value: bool) -> Self:
+        """
+        Sets the value of the 'aggregated' attribute of the resulting
+        AffectedIssue instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (bool): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["aggregated"] = value
+        return self
+
+    def build(self) -> AffectedIssue:
+        result = AffectedIssue(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class IssuesBuilder(_Builder[Issues]):
+    """
+        The IssuesBuilder represents an implementation of the builder pattern
+        for the Issues dataclass.
+    """
+
+    __model_signature__ = (
+        ('tracker', 'buildinfo_om._model.Tracker | None'),
+        ('aggregateBuildIssues', 'bool | None'),
+        ('aggregationBuildStatus', 'str | None'),
+        ('affectedIssues', 'collections.abc.Sequence[buildinfo_om._model.AffectedIssue] | None'),
+    )
+
+    def with_tracker(self, builder: TrackerBuilder) -> Self:
+        """
+        Sets the value of the 'tracker' attribute of the resulting
+        Issues instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builder (TrackerBuilder): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["tracker"] = builder
+        return self
+
+    def with_aggregate_build_issues(self, value: bool) -> Self:
+        """
+        Sets the value of the 'aggregateBuildIssues' attribute of the resulting
+        Issues instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (bool): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["aggregateBuildIssues"] = value
+        return self
+
+    def with_aggregation_build_status(self, value: str) -> Self:
+        """
+        Sets the value of the 'aggregationBuildStatus' attribute of the resulting
+        Issues instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["aggregationBuildStatus"] = value
+        return self
+
+    def with_affected_issues(self, *builders: AffectedIssueBuilder) -> Self:
+        """
+        Sets the value of the 'affectedIssues' attribute of the resulting
+        Issues instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builders (collections.abc.Sequence[AffectedIssueBuilder]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["affectedIssues"] = _DeferredList(builders)
+        return self
+
+    def build(self) -> Issues:
+        result = Issues(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class VCSBuilder(_Builder[VCS]):
+    """
+        The VCSBuilder represents an implementation of the builder pattern
+        for the VCS dataclass.
+    """
+
+    __model_signature__ = (
+        ('url', 'str | None'),
+        ('branch', 'str | None'),
+        ('revision', 'str | None'),
+        ('message', 'str | None'),
+    )
+
+    def with_url(self, value: str) -> Self:
+        """
+        Sets the value of the 'url' attribute of the resulting
+        VCS instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["url"] = value
+        return self
+
+    def with_branch(self, value: str) -> Self:
+        """
+        Sets the value of the 'branch' attribute of the resulting
+        VCS instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["branch"] = value
+        return self
+
+    def with_revision(self, value: str) -> Self:
+        """
+        Sets the value of the 'revision' attribute of the resulting
+        VCS instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["revision"] = value
+        return self
+
+    def with_message(self, value: str) -> Self:
+        """
+        Sets the value of the 'message' attribute of the resulting
+        VCS instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["message"] = value
+        return self
+
+    def build(self) -> VCS:
+        result = VCS(**self._build_arguments())
+        count("objects.built")
+        return result
+
+
+class BuildInfoBuilder(_Builder[BuildInfo]):
+    """
+        The BuildInfoBuilder represents an implementation of the builder pattern
+        for the BuildInfo dataclass.
+    """
+
+    __model_signature__ = (
+        ('properties', 'collections.abc.Mapping[str, str] | None'),
+        ('version', 'str | None'),
+        ('name', 'str | None'),
+        ('number', 'str | None'),
+        ('type', 'str | None'),
+        ('buildAgent', 'buildinfo_om._model.BuildAgent | None'),
+        ('agent', 'buildinfo_om._model.Agent | None'),
+        ('started', 'str | None'),
+        ('durationMillis', 'int | None'),
+        ('principal', 'str | None'),
+        ('url', 'str | None'),
+        ('vcs', 'collections.abc.Sequence[buildinfo_om._vcs.VCS] | None'),
+        ('modules', 'collections.abc.Sequence[buildinfo_om._model.Module] | None'),
+        ('issues', 'buildinfo_om._model.Issues | None'),
+    )
+
+    def with_properties(self, **values: str) -> Self:
+        """
+        Sets the value of the 'properties' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            values (collections.abc.Mapping[str, collections.abc.Sequence[str]]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["properties"] = values
+        return self
+
+    def with_version(self, value: str) -> Self:
+        """
+        Sets the value of the 'version' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["version"] = value
+        return self
+
+    def with_name(self, value: str) -> Self:
+        """
+        Sets the value of the 'name' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["name"] = value
+        return self
+
+    def with_number(self, value: str) -> Self:
+        """
+        Sets the value of the 'number' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["number"] = value
+        return self
+
+    def with_type(self, value: str) -> Self:
+        """
+        Sets the value of the 'type' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["type"] = value
+        return self
+
+    def with_build_agent(self, builder: BuildAgentBuilder) -> Self:
+        """
+        Sets the value of the 'buildAgent' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builder (BuildAgentBuilder): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["buildAgent"] = builder
+        return self
+
+    def with_agent(self, builder: AgentBuilder) -> Self:
+        """
+        Sets the value of the 'agent' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builder (AgentBuilder): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["agent"] = builder
+        return self
+
+    def with_started(self, value: str) -> Self:
+        """
+        Sets the value of the 'started' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["started"] = value
+        return self
+
+    def with_duration_millis(self, value: int) -> Self:
+        """
+        Sets the value of the 'durationMillis' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (int): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["durationMillis"] = value
+        return self
+
+    def with_principal(self, value: str) -> Self:
+        """
+        Sets the value of the 'principal' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["principal"] = value
+        return self
+
+    def with_url(self, value: str) -> Self:
+        """
+        Sets the value of the 'url' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            value (str): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["url"] = value
+        return self
+
+    def with_vcs(self, *builders: VCSBuilder) -> Self:
+        """
+        Sets the value of the 'vcs' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builders (collections.abc.Sequence[VCSBuilder]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["vcs"] = _DeferredList(builders)
+        return self
+
+    def with_modules(self, *builders: ModuleBuilder) -> Self:
+        """
+        Sets the value of the 'modules' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builders (collections.abc.Sequence[ModuleBuilder]): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["modules"] = _DeferredList(builders)
+        return self
+
+    def with_issues(self, builder: IssuesBuilder) -> Self:
+        """
+        Sets the value of the 'issues' attribute of the resulting
+        BuildInfo instance to the specified argument
+        and returns the modified instance of the builder itself.
+
+        In case the argument is an instance of the Builder base class or a
+        sequence of this, the builder will be invoked to create a new instance
+        of the new class when the resulting instance is built.
+
+        Args:
+            builder (IssuesBuilder): The value of the property / attribute to set or the builder to create these values.
+
+        Returns:
+            Self: The modified instance of this builder.
+    """
+        self._args["issues"] = builder
+        return self
+
+    def build(self) -> BuildInfo:
+        result = BuildInfo(**self._build_arguments())
+        count("objects.built")
+        return result
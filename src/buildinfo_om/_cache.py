@@ -0,0 +1,682 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from dataclasses import dataclass, replace
+from hashlib import sha256
+from os import PathLike
+from pickle import HIGHEST_PROTOCOL, dump, load  # nosec B403
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    TypeVar,
+    cast,
+)
+
+from ._loadsave import fingerprint_build_info, load_from_str
+from ._merge import (
+    NonSameSetsOfProperties,
+    NonUniqueBuilds,
+    _artifact_key,
+    _combine_artifact,
+    _combine_dependency,
+    _combine_property_values,
+    _dependency_key,
+    _merge_headers,
+    _module_key,
+    _ModuleHeader,
+    _verify_builds,
+)
+from ._model import Artifact, Dependency, Module
+from ._vcs import BuildInfo
+
+_CACHE_FORMAT: int = 2
+
+_ModuleIdentity = object
+_Order = tuple[int, int]
+_EntryOrder = tuple[int, int, int]
+_E = TypeVar("_E")
+_BUCKET_SIZE: int = 32
+
+
+@dataclass
+class _Fragment:
+    """
+    A named input of the merge cache.
+    """
+
+    position: int
+    """The position of the fragment in the merge order"""
+    fingerprint: str
+    """The fingerprint of the fragment content"""
+    item: BuildInfo
+    """The fragment itself"""
+    header: BuildInfo
+    """The fragment without modules and properties"""
+
+
+class _ModuleEntries(Generic[_E]):
+    """
+    The artifacts or dependencies of all modules sharing the same key,
+    indexed by the key of the entry and the name of the contributing
+    fragment. As combining entries is associative, the contributions are
+    folded in buckets of neighbouring fragment positions first. Hence, a
+    changed fragment only requires its own bucket and the results of the
+    buckets to be combined again, instead of all contributions.
+    """
+
+    def __init__(
+        self,
+        key_of: Callable[[_E], Hashable],
+        combine: Callable[[_E, _E], _E],
+    ) -> None:
+        """
+
+        Args:
+            key_of (Callable[[_E], Hashable]): Determines the key of an
+                entry.
+            combine (Callable[[_E, _E], _E]): Combines two entries with the
+                same key.
+
+        Returns:
+            None:
+
+        """
+        self._key_of = key_of
+        self._combine = combine
+        self._contributions: dict[
+            Hashable, dict[int, dict[str, list[tuple[_EntryOrder, _E]]]]
+        ] = {}
+        self._buckets: dict[Hashable, dict[int, tuple[_EntryOrder, _E]]] = {}
+        self._merged: dict[Hashable, tuple[_EntryOrder, _E]] = {}
+        self._dirty: dict[Hashable, set[int]] = {}
+
+    def add(
+        self, name: str, order: _Order, entries: Iterable[_E] | None
+    ) -> None:
+        """
+
+        Args:
+            name (str): The name of the contributing fragment.
+            order (_Order): The position of the fragment and the index of
+                the module within the fragment.
+            entries (Iterable[_E] | None): The entries of the module.
+
+        Returns:
+            None:
+
+        """
+        bucket: int = order[0] // _BUCKET_SIZE
+        for index, entry in enumerate(entries or ()):
+            key: Hashable = self._key_of(entry)
+            self._contributions.setdefault(key, {}).setdefault(
+                bucket, {}
+            ).setdefault(name, []).append(((*order, index), entry))
+            self._dirty.setdefault(key, set()).add(bucket)
+
+    def remove(
+        self, name: str, position: int, entries: Iterable[_E] | None
+    ) -> None:
+        """
+
+        Args:
+            name (str): The name of the fragment to retract.
+            position (int): The position of the fragment.
+            entries (Iterable[_E] | None): The entries it contributed.
+
+        Returns:
+            None:
+
+        """
+        bucket: int = position // _BUCKET_SIZE
+        for entry in entries or ():
+            key: Hashable = self._key_of(entry)
+            contributors = self._contributions.get(key, {}).get(bucket)
+            if contributors is not None and name in contributors:
+                del contributors[name]
+                self._dirty.setdefault(key, set()).add(bucket)
+
+    def _fold(self, entries: Iterable[tuple[_EntryOrder, _E]]) -> _E:
+        """
+
+        Args:
+            entries (Iterable[tuple[_EntryOrder, _E]]): The entries ordered
+                by their position in the merge.
+
+        Returns:
+            _E: The combined entry.
+
+        """
+        iterator = iter(entries)
+        _, combined = next(iterator)
+        for _, entry in iterator:
+            combined = self._combine(combined, entry)
+        return combined
+
+    def _recompute(self, key: Hashable, dirty: set[int]) -> None:
+        """
+
+        Args:
+            key (Hashable): The key of the changed entries.
+            dirty (set[int]): The buckets with changed contributions.
+
+        Returns:
+            None:
+
+        """
+        contributions = self._contributions.get(key, {})
+        buckets = self._buckets.setdefault(key, {})
+        for bucket in dirty:
+            contributors = contributions.get(bucket)
+            if not contributors:
+                contributions.pop(bucket, None)
+                buckets.pop(bucket, None)
+                continue
+            ordered: list[tuple[_EntryOrder, _E]] = sorted(
+                (e for c in contributors.values() for e in c), key=_first
+            )
+            buckets[bucket] = (ordered[0][0], self._fold(ordered))
+
+        if len(buckets) == 0:
+            self._contributions.pop(key, None)
+            self._buckets.pop(key, None)
+            self._merged.pop(key, None)
+            return
+        ordered = sorted(buckets.values(), key=_first)
+        self._merged[key] = (ordered[0][0], self._fold(ordered))
+
+    def values(self) -> list[_E]:
+        """
+        Combines the changed entries in the order of the merge.
+
+        Returns:
+            list[_E]: The combined entries in the order of their first
+                occurrence.
+
+        """
+        for key, dirty in self._dirty.items():
+            self._recompute(key, dirty)
+        self._dirty.clear()
+        return [
+            entry for _, entry in sorted(self._merged.values(), key=_first)
+        ]
+
+
+def _first(entry: tuple[Any, ...]) -> Any:
+    """
+
+    Args:
+        entry (tuple[Any, ...]):
+
+    Returns:
+        Any: The first item of the entry.
+
+    """
+    return entry[0]
+
+
+class MergeCache:
+    """
+    Remembers the merged state of a set of named build info fragments
+    together with a fingerprint of every fragment. Adding, replacing or
+    removing a fragment only recomputes the properties and the artifacts
+    and dependencies of the modules the fragment contributes to. The
+    result equals merge_build_info invoked with all fragments in the order
+    they have been added first.
+
+    The cache can be saved to and loaded from disk using pickle. Hence,
+    only cache files from trusted sources must be loaded.
+    """
+
+    def __init__(
+        self,
+        different_data: NonUniqueBuilds = NonUniqueBuilds.SKIP,
+        different_props: NonSameSetsOfProperties = (
+            NonSameSetsOfProperties.SKIP
+        ),
+    ) -> None:
+        """
+
+        Args:
+            different_data (NonUniqueBuilds):
+            different_props (NonSameSetsOfProperties):
+
+        Returns:
+            None:
+
+        """
+        self._different_data: NonUniqueBuilds = different_data
+        self._different_props: NonSameSetsOfProperties = different_props
+        self._fragments: dict[str, _Fragment] = {}
+        self._next_position: int = 0
+        self._contributed: dict[str, _Fragment] = {}
+        self._modules: dict[
+            _ModuleIdentity, dict[str, list[tuple[int, Module]]]
+        ] = {}
+        self._entries: dict[
+            _ModuleIdentity,
+            tuple[_ModuleEntries[Artifact], _ModuleEntries[Dependency]],
+        ] = {}
+        self._merged_modules: dict[_ModuleIdentity, tuple[_Order, Module]] = {}
+        self._properties: dict[str, dict[str, tuple[int, str]]] = {}
+        self._merged_properties: dict[str, tuple[_Order, str]] = {}
+        self._dirty_modules: set[_ModuleIdentity] = set()
+        self._dirty_properties: set[str] = set()
+        self._result: BuildInfo | None = None
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of fragments.
+
+        """
+        return len(self._fragments)
+
+    def __contains__(self, name: object) -> bool:
+        """
+
+        Args:
+            name (object):
+
+        Returns:
+            bool: True, if a fragment with this name is cached.
+
+        """
+        return name in self._fragments
+
+    @property
+    def fingerprints(self) -> Mapping[str, str]:
+        """
+        The fingerprints of all fragments by their name.
+
+        Returns:
+            Mapping[str, str]:
+
+        """
+        return {name: f.fingerprint for name, f in self._fragments.items()}
+
+    def update(
+        self, name: str, bi: BuildInfo, fingerprint: str | None = None
+    ) -> bool:
+        """
+        Adds a new fragment or replaces the fragment with the same name.
+        A replaced fragment keeps its position in the merge order.
+
+        Args:
+            name (str): The name of the fragment, e.g. its path.
+            bi (BuildInfo): The content of the fragment.
+            fingerprint (str | None): The fingerprint of the fragment.
+                Calculated using fingerprint_build_info, if omitted.
+
+        Returns:
+            bool: True, if the cache has changed.
+
+        """
+        if fingerprint is None:
+            fingerprint = fingerprint_build_info(bi)
+
+        existing: _Fragment | None = self._fragments.get(name)
+        if existing is not None and existing.fingerprint == fingerprint:
+            return False
+
+        position: int = self._next_position
+        if existing is not None:
+            position = existing.position
+        else:
+            self._next_position += 1
+
+        self._fragments[name] = _Fragment(
+            position,
+            fingerprint,
+            bi,
+            replace(bi, modules=None, properties=None),
+        )
+        self._result = None
+        return True
+
+    def update_from_file(
+        self, path: str | PathLike, name: str | None = None
+    ) -> bool:
+        """
+        Adds or replaces a fragment from a file. The fingerprint is the
+        digest of the file content, so unchanged files are not parsed.
+
+        Args:
+            path (str | PathLike): The path of the fragment.
+            name (str | None): The name of the fragment. Defaults to the path.
+
+        Returns:
+            bool: True, if the cache has changed.
+
+        """
+        with open(path, "rb") as buffer:
+            data: bytes = buffer.read()
+
+        fragment_name: str = name if name is not None else str(path)
+        fingerprint: str = sha256(data).hexdigest()
+        existing: _Fragment | None = self._fragments.get(fragment_name)
+        if existing is not None and existing.fingerprint == fingerprint:
+            return False
+
+        return self.update(fragment_name, load_from_str(data), fingerprint)
+
+    def remove(self, name: str) -> bool:
+        """
+        Removes the fragment with the specified name.
+
+        Args:
+            name (str):
+
+        Returns:
+            bool: True, if the fragment has been removed.
+
+        """
+        if self._fragments.pop(name, None) is None:
+            return False
+
+        self._result = None
+        return True
+
+    def merge(self) -> BuildInfo:
+        """
+        Returns the merged build info of all cached fragments. The result
+        and its modules are shared with the cache and with later results,
+        so they must not be modified. Use copy.deepcopy to obtain a build
+        info that can be modified.
+
+        Returns:
+            BuildInfo:
+
+        """
+        if self._result is None:
+            self._result = self._assemble()
+
+        return self._result
+
+    def save(self, path: str | PathLike) -> None:
+        """
+        Saves the cache including its merged state.
+
+        Args:
+            path (str | PathLike):
+
+        Returns:
+            None:
+
+        """
+        with open(path, "wb") as buffer:
+            dump((_CACHE_FORMAT, self.__dict__), buffer, HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> "MergeCache":
+        """
+        Loads a cache previously saved. The file must be trusted.
+
+        Args:
+            path (str | PathLike):
+
+        Returns:
+            MergeCache:
+
+        """
+        with open(path, "rb") as buffer:
+            cache_format, state = load(buffer)  # nosec B301
+
+        if cache_format != _CACHE_FORMAT:
+            raise ValueError("Unsupported cache format", cache_format)
+
+        cache: MergeCache = cls.__new__(cls)
+        cache.__dict__.update(cast(dict[str, Any], state))
+        return cache
+
+    def _assemble(self) -> BuildInfo:
+        """
+
+        Returns:
+            BuildInfo:
+
+        """
+        headers: list[BuildInfo] = [f.header for f in self._fragments.values()]
+        filtered_items: tuple[BuildInfo, ...] = _verify_builds(
+            self._different_data, *headers
+        )
+        active_headers: set[int] = {id(h) for h in filtered_items}
+        active: dict[str, _Fragment] = {
+            name: fragment
+            for name, fragment in self._fragments.items()
+            if id(fragment.header) in active_headers
+        }
+
+        for name, fragment in list(self._contributed.items()):
+            if active.get(name) is not fragment:
+                self._retract(name, fragment)
+        for name, fragment in active.items():
+            if name not in self._contributed:
+                self._contribute(name, fragment)
+
+        for module_key in self._dirty_modules:
+            self._recompute_module(module_key)
+        self._dirty_modules.clear()
+        for property_key in self._dirty_properties:
+            self._recompute_property(property_key)
+        self._dirty_properties.clear()
+
+        result: BuildInfo = _merge_headers(
+            self._different_props, *filtered_items
+        )
+        if len(filtered_items) > 0:
+            result.properties = {
+                key: value
+                for key, (_, value) in sorted(
+                    self._merged_properties.items(), key=lambda e: e[1][0]
+                )
+            }
+        if any(f.item.modules is not None for f in active.values()):
+            result.modules = [
+                module
+                for _, module in sorted(
+                    self._merged_modules.values(), key=lambda e: e[0]
+                )
+            ]
+
+        return result
+
+    @staticmethod
+    def _module_identities(
+        name: str, fragment: _Fragment
+    ) -> dict[_ModuleIdentity, list[tuple[int, Module]]]:
+        """
+
+        Args:
+            name (str):
+            fragment (_Fragment):
+
+        Returns:
+            dict[_ModuleIdentity, list[tuple[int, Module]]]:
+
+        """
+        identities: dict[_ModuleIdentity, list[tuple[int, Module]]] = {}
+        for index, module in enumerate(fragment.item.modules or ()):
+            key: _ModuleIdentity = _module_key(module)
+            if key is None:
+                key = (name, index)
+            identities.setdefault(key, []).append((index, module))
+        return identities
+
+    def _contribute(self, name: str, fragment: _Fragment) -> None:
+        """
+
+        Args:
+            name (str):
+            fragment (_Fragment):
+
+        Returns:
+            None:
+
+        """
+        self._contributed[name] = fragment
+        for key, modules in self._module_identities(name, fragment).items():
+            self._modules.setdefault(key, {})[name] = modules
+            artifacts, dependencies = self._entries.setdefault(
+                key,
+                (
+                    _ModuleEntries(_artifact_key, _combine_artifact),
+                    _ModuleEntries(_dependency_key, _combine_dependency),
+                ),
+            )
+            for index, module in modules:
+                order: _Order = (fragment.position, index)
+                artifacts.add(name, order, module.artifacts)
+                dependencies.add(name, order, module.dependencies)
+            self._dirty_modules.add(key)
+        properties = fragment.item.properties or {}
+        for index, (key, value) in enumerate(properties.items()):
+            self._properties.setdefault(key, {})[name] = (index, value)
+            self._dirty_properties.add(key)
+
+    def _retract(self, name: str, fragment: _Fragment) -> None:
+        """
+
+        Args:
+            name (str):
+            fragment (_Fragment):
+
+        Returns:
+            None:
+
+        """
+        del self._contributed[name]
+        for key, modules in self._module_identities(name, fragment).items():
+            self._modules[key].pop(name, None)
+            artifacts, dependencies = self._entries[key]
+            for _, module in modules:
+                artifacts.remove(name, fragment.position, module.artifacts)
+                dependencies.remove(
+                    name, fragment.position, module.dependencies
+                )
+            self._dirty_modules.add(key)
+        for key in fragment.item.properties or {}:
+            self._properties[key].pop(name, None)
+            self._dirty_properties.add(key)
+
+    def _position(self, name: str) -> int:
+        """
+
+        Args:
+            name (str):
+
+        Returns:
+            int:
+
+        """
+        return self._fragments[name].position
+
+    def _recompute_module(self, key: _ModuleIdentity) -> None:
+        """
+
+        Args:
+            key (_ModuleIdentity):
+
+        Returns:
+            None:
+
+        """
+        contributors = self._modules.get(key)
+        if not contributors:
+            self._modules.pop(key, None)
+            self._entries.pop(key, None)
+            self._merged_modules.pop(key, None)
+            return
+
+        names: list[str] = sorted(contributors, key=self._position)
+        first_index, first_module = contributors[names[0]][0]
+        header = _ModuleHeader(first_module)
+        for name in names:
+            for _, module in contributors[name]:
+                header.add(module)
+
+        artifacts, dependencies = self._entries[key]
+        order: _Order = (self._position(names[0]), first_index)
+        self._merged_modules[key] = (
+            order,
+            header.build_with(artifacts.values(), dependencies.values()),
+        )
+
+    def _recompute_property(self, key: str) -> None:
+        """
+
+        Args:
+            key (str):
+
+        Returns:
+            None:
+
+        """
+        contributors = self._properties.get(key)
+        if not contributors:
+            self._properties.pop(key, None)
+            self._merged_properties.pop(key, None)
+            return
+
+        names: list[str] = sorted(contributors, key=self._position)
+        value: str | None = _combine_property_values(
+            self._different_props,
+            key,
+            (contributors[name][1] for name in names),
+        )
+        if value is None:
+            self._merged_properties.pop(key, None)
+            return
+
+        order: _Order = (
+            self._position(names[0]),
+            contributors[names[0]][0],
+        )
+        self._merged_properties[key] = (order, value)
@@ -0,0 +1,518 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, is_dataclass
+from json import dumps
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO, TypeVar
+
+from dacite import DaciteError  # type: ignore
+
+from ._diff import BuildInfoChange, _BuildIndex, _reduce
+from ._loadsave import (
+    fingerprint_build_info,
+    load_from_file,
+    save_to_buffer,
+    save_to_file,
+)
+from ._merge import (
+    NonSameSetsOfProperties,
+    NonUniqueBuilds,
+    merge_build_info_external,
+)
+from ._vcs import BuildInfo
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_LOAD_ERRORS: tuple[type[Exception], ...] = (
+    ValueError,
+    TypeError,
+    DaciteError,
+)
+
+
+class _InvalidInput(Exception):
+    """
+    An input file is not a valid build info or the inputs cannot be
+    processed together.
+    """
+
+
+def _map(
+    function: Callable[[_T], _R], items: Iterable[_T], workers: int
+) -> AbstractContextManager[Iterator[_R]]:
+    """
+    Applies the function to all items using a pool of processes, if more
+    than one worker is requested. The results are returned lazily in the
+    order of the items.
+
+    Args:
+        function (Callable[[_T], _R]): A function defined at module level.
+        items (Iterable[_T]):
+        workers (int): The number of processes to use.
+
+    Returns:
+        AbstractContextManager[Iterator[_R]]: The context the results are
+            available in.
+
+    """
+    if workers <= 1:
+        return nullcontext(map(function, items))
+    return _PooledMap(function, items, workers)
+
+
+class _PooledMap(AbstractContextManager[Iterator[Any]]):
+    """
+    Maps items in a process pool, that is shut down when leaving the
+    context. Only two items per worker are submitted ahead of the result
+    being consumed, so that neither the items nor the results of a long
+    list of files pile up in memory.
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Any], Any],
+        items: Iterable[Any],
+        workers: int,
+    ) -> None:
+        """
+
+        Args:
+            function (Callable[[Any], Any]):
+            items (Iterable[Any]):
+            workers (int):
+
+        Returns:
+            None:
+
+        """
+        self._function = function
+        self._items = items
+        self._window: int = 2 * workers
+        self._executor: Executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> Iterator[Any]:
+        """
+
+        Returns:
+            Iterator[Any]:
+
+        """
+        return self._results()
+
+    def _results(self) -> Iterator[Any]:
+        """
+
+        Yields:
+            Any: The results in the order of the items.
+
+        """
+        pending: deque[Future[Any]] = deque()
+        for item in self._items:
+            pending.append(self._executor.submit(self._function, item))
+            if len(pending) >= self._window:
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
+
+    def __exit__(self, *args: Any) -> None:
+        """
+
+        Args:
+            args (tuple[Any, ...]):
+
+        Returns:
+            None:
+
+        """
+        self._executor.shutdown(cancel_futures=True)
+
+
+def _load(path: str) -> BuildInfo:
+    """
+
+    Args:
+        path (str):
+
+    Returns:
+        BuildInfo:
+
+    Raises:
+        _InvalidInput: If the file does not contain a valid build info.
+
+    """
+    try:
+        return load_from_file(Path(path))
+    except _LOAD_ERRORS as error:
+        raise _InvalidInput(f"{path}: {error}") from error
+
+
+def _validate(path: str) -> str | None:
+    """
+
+    Args:
+        path (str):
+
+    Returns:
+        str | None: The error or None, if the file is a valid build info.
+
+    """
+    try:
+        load_from_file(Path(path))
+    except Exception as error:  # pylint: disable=W0718
+        return f"{type(error).__name__}: {error}"
+    return None
+
+
+def _fingerprint(path: str) -> str:
+    """
+
+    Args:
+        path (str):
+
+    Returns:
+        str: The fingerprint of the build info stored in the file.
+
+    """
+    return fingerprint_build_info(_load(path))
+
+
+def _convert(paths: tuple[str, str]) -> str:
+    """
+
+    Args:
+        paths (tuple[str, str]): The path of the source and the target.
+
+    Returns:
+        str: The path of the target.
+
+    """
+    source, target = paths
+    save_to_file(_load(source), Path(target))
+    return target
+
+
+def _run_merge(args: Namespace, output: TextIO) -> int:
+    """
+
+    Args:
+        args (Namespace):
+        output (TextIO):
+
+    Returns:
+        int: The exit code.
+
+    """
+    with _map(_load, args.files, args.workers) as items:
+        try:
+            result: BuildInfo = merge_build_info_external(
+                items,
+                different_data=NonUniqueBuilds[args.different_data.upper()],
+                different_props=NonSameSetsOfProperties[
+                    args.different_props.upper()
+                ],
+                memory_budget=args.memory_budget * 1024 * 1024,
+            )
+        except ValueError as error:
+            # the builds cannot be merged with the selected strategies
+            raise _InvalidInput(str(error)) from error
+
+    if args.output is None:
+        save_to_buffer(result, output)
+        output.write("\n")
+    else:
+        save_to_file(result, Path(args.output))
+    return 0
+
+
+def _run_validate(args: Namespace, output: TextIO) -> int:
+    """
+
+    Args:
+        args (Namespace):
+        output (TextIO):
+
+    Returns:
+        int: The exit code, 1 if a file is invalid.
+
+    """
+    exit_code: int = 0
+    with _map(_validate, args.files, args.workers) as errors:
+        for path, error in zip(args.files, errors):
+            if error is None:
+                if not args.quiet:
+                    output.write(f"OK {path}\n")
+            else:
+                output.write(f"INVALID {path}: {error}\n")
+                exit_code = 1
+            output.flush()
+    return exit_code
+
+
+def _run_convert(args: Namespace, output: TextIO) -> int:
+    """
+
+    Args:
+        args (Namespace):
+        output (TextIO):
+
+    Returns:
+        int: The exit code.
+
+    """
+    directory = Path(args.output_directory)
+    sources: dict[str, str] = {}
+    for f in args.files:
+        target: str = str(directory / Path(f).name)
+        other: str | None = sources.setdefault(target, f)
+        if other != f:
+            raise _InvalidInput(
+                f"{other} and {f} would both be converted to {target}"
+            )
+    directory.mkdir(parents=True, exist_ok=True)
+    pairs: list[tuple[str, str]] = [(f, t) for t, f in sources.items()]
+    with _map(_convert, pairs, args.workers) as targets:
+        for converted in targets:
+            output.write(f"{converted}\n")
+            output.flush()
+    return 0
+
+
+def _run_fingerprint(args: Namespace, output: TextIO) -> int:
+    """
+
+    Args:
+        args (Namespace):
+        output (TextIO):
+
+    Returns:
+        int: The exit code.
+
+    """
+    with _map(_fingerprint, args.files, args.workers) as fingerprints:
+        for path, fingerprint in zip(args.files, fingerprints):
+            output.write(f"{fingerprint}  {path}\n")
+            output.flush()
+    return 0
+
+
+def _to_json(value: Any) -> Any:
+    """
+
+    Args:
+        value (Any): A value of a change, which is not JSON serializable.
+
+    Returns:
+        Any: A JSON serializable representation.
+
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def _run_diff(args: Namespace, output: TextIO) -> int:
+    """
+
+    Args:
+        args (Namespace):
+        output (TextIO):
+
+    Returns:
+        int: The exit code, 1 if the build infos differ.
+
+    """
+    # the old build is reduced to its index before the new one is loaded
+    old_index = _BuildIndex(_load(args.old), _reduce)
+    changes: Iterator[BuildInfoChange] = old_index.compare(_load(args.new))
+
+    exit_code: int = 0
+    for change in changes:
+        exit_code = 1
+        record: dict[str, Any] = {
+            "kind": change.kind.name,
+            "scope": change.scope.name,
+            "module": change.module,
+            "key": change.key,
+            "old": change.old,
+            "new": change.new,
+            "old_checksums": change.old_checksums,
+        }
+        output.write(dumps(record, default=_to_json))
+        output.write("\n")
+    return exit_code
+
+
+def _add_workers(parser: ArgumentParser) -> None:
+    """
+
+    Args:
+        parser (ArgumentParser):
+
+    Returns:
+        None:
+
+    """
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of processes to load the files with",
+    )
+
+
+def _create_parser() -> ArgumentParser:
+    """
+
+    Returns:
+        ArgumentParser:
+
+    """
+    parser = ArgumentParser(
+        prog="buildinfo-om",
+        description="Processes many build info files in a single process.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    merge = commands.add_parser("merge", help="Merges build info files")
+    merge.add_argument("files", nargs="+", metavar="FILE")
+    merge.add_argument(
+        "-o", "--output", help="The file to write, stdout if omitted"
+    )
+    merge.add_argument(
+        "--different-data",
+        choices=[m.name.lower() for m in NonUniqueBuilds],
+        default=NonUniqueBuilds.SKIP.name.lower(),
+    )
+    merge.add_argument(
+        "--different-props",
+        choices=[m.name.lower() for m in NonSameSetsOfProperties],
+        default=NonSameSetsOfProperties.SKIP.name.lower(),
+    )
+    merge.add_argument(
+        "--memory-budget",
+        type=int,
+        default=64,
+        metavar="MIB",
+        help="The memory used to index modules before spilling to disk",
+    )
+    _add_workers(merge)
+    merge.set_defaults(run=_run_merge)
+
+    validate = commands.add_parser(
+        "validate", help="Checks that files are valid build infos"
+    )
+    validate.add_argument("files", nargs="+", metavar="FILE")
+    validate.add_argument(
+        "-q", "--quiet", action="store_true", help="Report invalid files only"
+    )
+    _add_workers(validate)
+    validate.set_defaults(run=_run_validate)
+
+    convert = commands.add_parser(
+        "convert",
+        help="Rewrites files in the normalized form written by this library",
+    )
+    convert.add_argument("files", nargs="+", metavar="FILE")
+    convert.add_argument(
+        "-d",
+        "--output-directory",
+        required=True,
+        help="The directory to write the converted files to",
+    )
+    _add_workers(convert)
+    convert.set_defaults(run=_run_convert)
+
+    fingerprint = commands.add_parser(
+        "fingerprint", help="Prints the content fingerprint of files"
+    )
+    fingerprint.add_argument("files", nargs="+", metavar="FILE")
+    _add_workers(fingerprint)
+    fingerprint.set_defaults(run=_run_fingerprint)
+
+    diff = commands.add_parser(
+        "diff", help="Prints the changes between two files as JSON lines"
+    )
+    diff.add_argument("old", metavar="OLD")
+    diff.add_argument("new", metavar="NEW")
+    diff.set_defaults(run=_run_diff)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (list[str] | None): The arguments without the program name. If
+            None, the arguments of the process are used.
+
+    Returns:
+        int: The exit code.
+
+    """
+    args: Namespace = _create_parser().parse_args(argv)
+    try:
+        return args.run(args, sys.stdout)
+    except BrokenPipeError:
+        # the reader has closed the output, e.g. head, so discard the rest
+        devnull: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, _InvalidInput) as error:
+        sys.stderr.write(f"buildinfo-om: {error}\n")
+        return 2
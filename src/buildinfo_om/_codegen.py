@@ -0,0 +1,252 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from argparse import ArgumentParser
+from dataclasses import Field, fields
+from inspect import isclass
+from os.path import dirname
+from os.path import join as _join_path
+from typing import Any, Sequence
+
+from ._builder import (
+    _classify_field,
+    _gen_class_doc,
+    _gen_method_doc,
+    _model_signature,
+    _SetterKind,
+    _to_lower_snake_case,
+)
+from ._model import (
+    AffectedIssue,
+    Agent,
+    Artifact,
+    BuildAgent,
+    Dependency,
+    Issues,
+    Module,
+    Tracker,
+)
+from ._vcs import VCS, BuildInfo
+
+BUILDER_MODELS: tuple[type, ...] = (
+    BuildAgent,
+    Agent,
+    Artifact,
+    Dependency,
+    Module,
+    Tracker,
+    AffectedIssue,
+    Issues,
+    VCS,
+    BuildInfo,
+)
+
+_GENERATED_MODULE: str = "_builder_gen.py"
+
+_SETTER_BODIES: dict[_SetterKind, str] = {
+    _SetterKind.SCALAR: "value",
+    _SetterKind.BUILDER: "builder",
+    _SetterKind.SEQUENCE: "list(values)",
+    _SetterKind.MAPPING: "values",
+    _SetterKind.BUILDER_SEQUENCE: "_DeferredList(builders)",
+}
+
+
+def _license_header() -> str:
+    """
+    Returns the license header of this module to be used for the generated
+    module.
+
+    Returns:
+        str:
+
+    """
+    lines: list[str] = []
+    with open(__file__, "r", encoding="utf-8") as source:
+        for line in source:
+            if not line.startswith("#"):
+                break
+            lines.append(line)
+    return "".join(lines)
+
+
+def _type_name(arg_type: Any) -> str:
+    """
+
+    Args:
+        arg_type (Any):
+
+    Returns:
+        str:
+
+    """
+    return arg_type.__name__ if isclass(arg_type) else str(arg_type)
+
+
+def _generate_setter(class_name: str, field: Field) -> str:
+    """
+
+    Args:
+        class_name (str):
+        field (Field):
+
+    Returns:
+        str: The source of the setter method.
+
+    """
+    kind, arg_name, arg_type = _classify_field(field)
+    if kind in (_SetterKind.BUILDER, _SetterKind.BUILDER_SEQUENCE):
+        arg_type = f"{arg_type.__name__}Builder"
+
+    arg_type_name: str = _type_name(arg_type)
+    if field.name == "requestedBy":
+        arg_type_name = "tuple[str]"
+
+    doc: str = _gen_method_doc(class_name, field, arg_name, arg_type)
+    function_name: str = f"with_{_to_lower_snake_case(field.name)}"
+    return (
+        f"    def {function_name}(self, {arg_name}: {arg_type_name}) "
+        "-> Self:\n"
+        f'        """{doc}"""\n'
+        f'        self._args["{field.name}"] = {_SETTER_BODIES[kind]}\n'
+        "        return self\n"
+    )
+
+
+def _generate_builder(entity_type: type) -> str:
+    """
+
+    Args:
+        entity_type (type):
+
+    Returns:
+        str: The source of the builder class.
+
+    """
+    entity_name: str = entity_type.__name__
+    builder_name: str = f"{entity_name}Builder"
+    doc: str = _gen_class_doc(builder_name, entity_name)
+    signature: str = "".join(
+        f"\n        {item!r}," for item in _model_signature(entity_type)
+    )
+    setters: str = "\n".join(
+        _generate_setter(entity_name, f) for f in fields(entity_type)
+    )
+    return (
+        f"class {builder_name}(_Builder[{entity_name}]):\n"
+        f'    """{doc}"""\n'
+        "\n"
+        f"    __model_signature__ = ({signature}\n    )\n"
+        "\n"
+        f"{setters}\n"
+        f"    def build(self) -> {entity_name}:\n"
+        f"        result = {entity_name}(**self._build_arguments())\n"
+        '        count("objects.built")\n'
+        "        return result\n"
+    )
+
+
+def generate_builder_source(models: Sequence[type] = BUILDER_MODELS) -> str:
+    """
+    Generates the source of a module containing the builder classes for
+    the models. The models must be ordered, so that nested models come
+    before the models using them.
+
+    Args:
+        models (Sequence[type]):
+
+    Returns:
+        str:
+
+    """
+    model_imports: str = "".join(
+        f"    {m.__name__},\n"
+        for m in sorted(models, key=lambda m: m.__name__)
+        if m not in (VCS, BuildInfo)
+    )
+    builders: str = "\n\n".join(_generate_builder(m) for m in models)
+    return (
+        f"{_license_header()}\n"
+        '"""\n'
+        "Generated by buildinfo_om._codegen. Do not edit.\n"
+        '"""\n'
+        "\n"
+        "from typing import Any, Self\n"
+        "\n"
+        "from ._builder import _Builder, _DeferredList\n"
+        "from ._instrument import count\n"
+        f"from ._model import (\n{model_imports})\n"
+        "from ._vcs import VCS, BuildInfo\n"
+        "\n\n"
+        f"{builders}"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Writes the generated builder module.
+
+    Args:
+        argv (Sequence[str] | None):
+
+    Returns:
+        int: The exit code.
+
+    """
+    parser = ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--output",
+        default=_join_path(dirname(__file__), _GENERATED_MODULE),
+        help="The path of the generated module",
+    )
+    args = parser.parse_args(argv)
+    with open(args.output, "w", encoding="utf-8") as target:
+        target.write(generate_builder_source())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,413 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from dataclasses import fields, replace
+from typing import Any, Callable, TypeVar, overload
+
+from ._model import Artifact, Dependency, Module
+from ._vcs import BuildInfo
+
+DIGEST_FIELDS: tuple[str, ...] = ("sha256", "sha1", "md5")
+
+_Digest = bytes | str
+_E = TypeVar("_E", Artifact, Dependency)
+
+
+@overload
+def digest_to_bytes(value: None) -> None: ...
+
+
+@overload
+def digest_to_bytes(value: _Digest) -> _Digest: ...
+
+
+def digest_to_bytes(value: _Digest | None) -> _Digest | None:
+    """
+    Converts a hexadecimal digest to its raw bytes. Values, that cannot be
+    restored from the raw bytes unchanged, e.g. upper case digests, are
+    kept as they are.
+
+    Args:
+        value (bytes | str | None):
+
+    Returns:
+        bytes | str | None:
+
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        raw: bytes = bytes.fromhex(value)
+    except ValueError:
+        return value
+    return raw if raw.hex() == value else value
+
+
+def digest_to_hex(value: _Digest | None) -> str | None:
+    """
+
+    Args:
+        value (bytes | str | None):
+
+    Returns:
+        str | None: The hexadecimal digest.
+
+    """
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def raw_digests(
+    entry: Artifact | Dependency,
+) -> tuple[_Digest | None, _Digest | None, _Digest | None]:
+    """
+    Returns the digests as stored, i.e. raw bytes for compact artifacts and
+    dependencies and strings otherwise, without converting them.
+
+    Args:
+        entry (Artifact | Dependency):
+
+    Returns:
+        tuple[bytes | str | None, bytes | str | None, bytes | str | None]:
+            The sha256, sha1 and md5 digests.
+
+    """
+    values: dict[str, Any] = vars(entry)
+    return values.get("sha256"), values.get("sha1"), values.get("md5")
+
+
+class _DigestField:
+    """
+    Stores a digest as raw bytes in the instance and returns it as
+    hexadecimal string on access.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._name: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """
+
+        Args:
+            owner (type):
+            name (str):
+
+        Returns:
+            None:
+
+        """
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """
+
+        Args:
+            instance (Any):
+            owner (type | None):
+
+        Returns:
+            Any: The hexadecimal digest.
+
+        """
+        if instance is None:
+            return None
+        return digest_to_hex(instance.__dict__.get(self._name))
+
+    def __set__(self, instance: Any, value: _Digest | None) -> None:
+        """
+
+        Args:
+            instance (Any):
+            value (bytes | str | None): The hexadecimal or raw digest.
+
+        Returns:
+            None:
+
+        """
+        instance.__dict__[self._name] = digest_to_bytes(value)
+
+
+class _CompactDigests:
+    """
+    Mixin for artifacts and dependencies storing their digests as raw
+    bytes. Equality is determined on the stored values, so the digests are
+    compared as bytes.
+    """
+
+    _plain_type: type
+
+    sha256 = _DigestField()
+    sha1 = _DigestField()
+    md5 = _DigestField()
+
+    def __eq__(self, other: object) -> bool:
+        """
+
+        Args:
+            other (object):
+
+        Returns:
+            bool: True, if all fields are equal, regardless of the
+                representation of the digests.
+
+        """
+        base: type = self._plain_type
+        if not isinstance(other, base):
+            return NotImplemented
+        mine: dict[str, Any] = vars(self)
+        theirs: dict[str, Any] = vars(other)
+        for f in fields(base):
+            value: Any = mine.get(f.name)
+            other_value: Any = theirs.get(f.name)
+            if f.name in DIGEST_FIELDS and type(value) is not type(
+                other_value
+            ):
+                value = digest_to_bytes(value)
+                other_value = digest_to_bytes(other_value)
+            if value != other_value:
+                return False
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+
+        Returns:
+            str: The representation of the plain model class.
+
+        """
+        base: type = self._plain_type
+        values: str = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}" for f in fields(base)
+        )
+        return f"{base.__qualname__}({values})"
+
+
+class CompactArtifact(_CompactDigests, Artifact):  # type: ignore[misc]
+    """
+    An artifact storing its digests as raw bytes. The attributes sha256,
+    sha1 and md5 return the hexadecimal digests like Artifact.
+    """
+
+    _plain_type = Artifact
+
+
+class CompactDependency(_CompactDigests, Dependency):  # type: ignore[misc]
+    """
+    A dependency storing its digests as raw bytes. The attributes sha256,
+    sha1 and md5 return the hexadecimal digests like Dependency.
+    """
+
+    _plain_type = Dependency
+
+
+class DigestPool:
+    """
+    Shares the raw bytes of equal digests, e.g. of the same dependency
+    used by several modules.
+    """
+
+    __slots__ = ("_digests",)
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._digests: dict[_Digest, _Digest] = {}
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of distinct digests.
+
+        """
+        return len(self._digests)
+
+    def intern(self, value: _Digest | None) -> _Digest | None:
+        """
+
+        Args:
+            value (bytes | str | None): The hexadecimal or raw digest.
+
+        Returns:
+            bytes | str | None: The shared raw digest.
+
+        """
+        converted: _Digest | None = digest_to_bytes(value)
+        if converted is None:
+            return None
+        return self._digests.setdefault(converted, converted)
+
+
+def _compact(entry: _E, compact_type: type, pool: DigestPool) -> _E:
+    """
+
+    Args:
+        entry (_E):
+        compact_type (type):
+        pool (DigestPool):
+
+    Returns:
+        _E: The compact copy of the entry.
+
+    """
+    compact: Any = object.__new__(compact_type)
+    values: dict[str, Any] = compact.__dict__
+    values.update(vars(entry))
+    for name in DIGEST_FIELDS:
+        values[name] = pool.intern(values.get(name))
+    return compact
+
+
+def _expand(entry: _E, plain_type: type[_E]) -> _E:
+    """
+
+    Args:
+        entry (_E):
+        plain_type (type[_E]):
+
+    Returns:
+        _E: The plain copy of the entry.
+
+    """
+    return plain_type(
+        **{f.name: getattr(entry, f.name) for f in fields(plain_type)}
+    )
+
+
+def _map_entries(
+    bi: BuildInfo,
+    artifact: Callable[[Artifact], Artifact],
+    dependency: Callable[[Dependency], Dependency],
+) -> BuildInfo:
+    """
+
+    Args:
+        bi (BuildInfo):
+        artifact (Callable[[Artifact], Artifact]): The conversion of the
+            artifacts.
+        dependency (Callable[[Dependency], Dependency]): The conversion of
+            the dependencies.
+
+    Returns:
+        BuildInfo: A copy of the build info with converted modules.
+
+    """
+    if bi.modules is None:
+        return bi
+    modules: list[Module] = [
+        replace(
+            m,
+            artifacts=(
+                None
+                if m.artifacts is None
+                else [artifact(a) for a in m.artifacts]
+            ),
+            dependencies=(
+                None
+                if m.dependencies is None
+                else [dependency(d) for d in m.dependencies]
+            ),
+        )
+        for m in bi.modules
+    ]
+    return replace(bi, modules=modules)
+
+
+def compact_digests(
+    bi: BuildInfo, pool: DigestPool | None = None
+) -> BuildInfo:
+    """
+    Stores the digests of all artifacts and dependencies as raw bytes
+    shared by equal digests. Saving the result writes the same
+    hexadecimal digests as saving the build info.
+
+    Args:
+        bi (BuildInfo): The build info to compact.
+        pool (DigestPool | None): The pool to share digests with, e.g.
+            with other build infos. A new pool is used, if omitted.
+
+    Returns:
+        BuildInfo: A copy of the build info using CompactArtifact and
+            CompactDependency.
+
+    """
+    digests: DigestPool = DigestPool() if pool is None else pool
+    return _map_entries(
+        bi,
+        lambda a: _compact(a, CompactArtifact, digests),
+        lambda d: _compact(d, CompactDependency, digests),
+    )
+
+
+def expand_digests(bi: BuildInfo) -> BuildInfo:
+    """
+
+    Args:
+        bi (BuildInfo): The build info to expand.
+
+    Returns:
+        BuildInfo: A copy of the build info using Artifact and Dependency
+            with hexadecimal digests.
+
+    """
+    return _map_entries(
+        bi,
+        lambda a: _expand(a, Artifact),
+        lambda d: _expand(d, Dependency),
+    )
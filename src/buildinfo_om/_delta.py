@@ -0,0 +1,627 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from json import dumps, loads
+from os import PathLike, listdir, makedirs
+from os.path import join as _join_path
+from typing import Any, Callable, Mapping, Sequence
+
+from ._loadsave import load_from_dict, transform_to_mapping
+from ._vcs import BuildInfo
+
+_DELTA_FORMAT: int = 1
+
+_SET: str = "$set"
+_DELETE: str = "$del"
+_PATCH: str = "$patch"
+_INSERT: str = "$insert"
+_KEYS: str = "$keys"
+
+_SAME: object = object()
+
+
+def _dependency_identity(item: Mapping[str, Any]) -> Any:
+    """
+
+    Args:
+        item (Mapping[str, Any]):
+
+    Returns:
+        Any:
+
+    """
+    if "id" in item:
+        return [item["id"]]
+    return [
+        None,
+        item.get("type"),
+        item.get("sha256"),
+        item.get("sha1"),
+        item.get("md5"),
+    ]
+
+
+_KEYED_LISTS: dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    "modules": lambda item: item.get("id"),
+    "artifacts": lambda item: [
+        item.get("type"),
+        item.get("name"),
+        item.get("path"),
+    ],
+    "dependencies": _dependency_identity,
+}
+
+
+def transform_to_delta(base: BuildInfo, bi: BuildInfo) -> Mapping[str, Any]:
+    """
+    Creates a structural patch, that transforms the base into the build
+    info. Modules, artifacts and dependencies are matched by the keys used
+    for merging, so only added, removed and changed entries are stored.
+
+    Args:
+        base (BuildInfo): The build info the patch is applied to.
+        bi (BuildInfo): The build info to encode.
+
+    Returns:
+        Mapping[str, Any]: A JSON compatible delta document.
+
+    """
+    return _delta_of_mappings(
+        transform_to_mapping(base), transform_to_mapping(bi)
+    )
+
+
+def apply_delta(base: BuildInfo, delta: Mapping[str, Any]) -> BuildInfo:
+    """
+    Reconstructs a build info from its base and a delta document.
+
+    Args:
+        base (BuildInfo): The base the delta has been created for.
+        delta (Mapping[str, Any]): The delta document.
+
+    Returns:
+        BuildInfo:
+
+    """
+    return load_from_dict(
+        _apply_delta_to_mapping(transform_to_mapping(base), delta)
+    )
+
+
+def save_delta(base: BuildInfo, bi: BuildInfo, path: PathLike | str) -> None:
+    """
+    Saves the build info as delta document against the base.
+
+    Args:
+        base (BuildInfo):
+        bi (BuildInfo):
+        path (PathLike | str):
+
+    Returns:
+        None:
+
+    """
+    _write_document(path, transform_to_delta(base, bi))
+
+
+def load_delta(base: BuildInfo, path: PathLike | str) -> BuildInfo:
+    """
+    Loads a build info from a delta document saved against the base.
+
+    Args:
+        base (BuildInfo):
+        path (PathLike | str):
+
+    Returns:
+        BuildInfo:
+
+    """
+    return apply_delta(base, _read_document(path))
+
+
+def _write_document(path: PathLike | str, data: Mapping[str, Any]) -> None:
+    """
+
+    Args:
+        path (PathLike | str):
+        data (Mapping[str, Any]):
+
+    Returns:
+        None:
+
+    """
+    with open(path, "w", encoding="utf-8") as buffer:
+        buffer.write(dumps(data, separators=(",", ":")))
+
+
+def _read_document(path: PathLike | str) -> Mapping[str, Any]:
+    """
+
+    Args:
+        path (PathLike | str):
+
+    Returns:
+        Mapping[str, Any]:
+
+    """
+    with open(path, "r", encoding="utf-8") as buffer:
+        return loads(buffer.read())
+
+
+def _delta_of_mappings(
+    base: Mapping[str, Any], data: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """
+
+    Args:
+        base (Mapping[str, Any]):
+        data (Mapping[str, Any]):
+
+    Returns:
+        Mapping[str, Any]:
+
+    """
+    patch: Any = _diff_dict(base, data)
+    return {
+        "format": _DELTA_FORMAT,
+        "patch": patch if patch is not _SAME else {},
+    }
+
+
+def _apply_delta_to_mapping(
+    base: Mapping[str, Any], delta: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """
+
+    Args:
+        base (Mapping[str, Any]):
+        delta (Mapping[str, Any]):
+
+    Returns:
+        Mapping[str, Any]:
+
+    """
+    if delta.get("format") != _DELTA_FORMAT:
+        raise ValueError("Unsupported delta format", delta.get("format"))
+
+    return _apply_dict(base, delta["patch"])
+
+
+def _diff_value(name: str, old: Any, new: Any) -> Any:
+    """
+
+    Args:
+        name (str): The name of the attribute holding the value.
+        old (Any):
+        new (Any):
+
+    Returns:
+        Any: The patch, _SAME if the values are equal or None, if the
+            value must be replaced.
+
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_dict(old, new)
+    if (
+        name in _KEYED_LISTS
+        and isinstance(old, list)
+        and isinstance(new, list)
+    ):
+        return _diff_keyed_list(_KEYED_LISTS[name], old, new)
+    return _SAME if old == new else None
+
+
+def _diff_dict(old: Mapping[str, Any], new: Mapping[str, Any]) -> Any:
+    """
+
+    Args:
+        old (Mapping[str, Any]):
+        new (Mapping[str, Any]):
+
+    Returns:
+        Any: The patch or _SAME.
+
+    """
+    values: dict[str, Any] = {}
+    patches: dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            values[key] = value
+            continue
+        patch = _diff_value(key, old[key], value)
+        if patch is None:
+            values[key] = value
+        elif patch is not _SAME:
+            patches[key] = patch
+
+    deleted: list[str] = [key for key in old if key not in new]
+
+    result: dict[str, Any] = {}
+    if len(values) > 0:
+        result[_SET] = values
+    if len(deleted) > 0:
+        result[_DELETE] = deleted
+    if len(patches) > 0:
+        result[_PATCH] = patches
+    return result if len(result) > 0 else _SAME
+
+
+def _list_keys(
+    key_of: Callable[[Mapping[str, Any]], Any], items: Sequence[Any]
+) -> list[str] | None:
+    """
+
+    Args:
+        key_of (Callable[[Mapping[str, Any]], Any]):
+        items (Sequence[Any]):
+
+    Returns:
+        list[str] | None: The keys of the items or None, if the items
+            cannot be identified uniquely.
+
+    """
+    if not all(isinstance(item, dict) for item in items):
+        return None
+    keys: list[str] = [dumps(key_of(item)) for item in items]
+    if len(set(keys)) != len(keys) or "null" in keys:
+        return None
+    return keys
+
+
+def _diff_keyed_list(
+    key_of: Callable[[Mapping[str, Any]], Any],
+    old: Sequence[Any],
+    new: Sequence[Any],
+) -> Any:
+    """
+
+    Args:
+        key_of (Callable[[Mapping[str, Any]], Any]):
+        old (Sequence[Any]):
+        new (Sequence[Any]):
+
+    Returns:
+        Any: The patch, _SAME or None, if the list must be replaced.
+
+    """
+    old_keys = _list_keys(key_of, old)
+    new_keys = _list_keys(key_of, new)
+    if old_keys is None or new_keys is None:
+        return _SAME if old == new else None
+
+    old_items: dict[str, Any] = dict(zip(old_keys, old))
+    new_key_set: set[str] = set(new_keys)
+
+    values: dict[str, Any] = {}
+    patches: dict[str, Any] = {}
+    inserted: list[tuple[int, str]] = []
+    for position, (key, item) in enumerate(zip(new_keys, new)):
+        if key not in old_items:
+            values[key] = item
+            inserted.append((position, key))
+            continue
+        patch = _diff_dict(old_items[key], item)
+        if patch is not _SAME:
+            patches[key] = patch
+
+    deleted: list[str] = [key for key in old_keys if key not in new_key_set]
+    kept_in_old_order: list[str] = [
+        key for key in old_keys if key in new_key_set
+    ]
+    kept_in_new_order: list[str] = [
+        key for key in new_keys if key in old_items
+    ]
+
+    result: dict[str, Any] = {}
+    if kept_in_old_order != kept_in_new_order:
+        result[_KEYS] = new_keys
+    else:
+        if len(deleted) > 0:
+            result[_DELETE] = deleted
+        if len(inserted) > 0:
+            result[_INSERT] = inserted
+    if len(values) > 0:
+        result[_SET] = values
+    if len(patches) > 0:
+        result[_PATCH] = patches
+    return result if len(result) > 0 else _SAME
+
+
+def _apply_value(name: str, old: Any, patch: Mapping[str, Any]) -> Any:
+    """
+
+    Args:
+        name (str):
+        old (Any):
+        patch (Mapping[str, Any]):
+
+    Returns:
+        Any:
+
+    """
+    if isinstance(old, dict):
+        return _apply_dict(old, patch)
+    if isinstance(old, list) and name in _KEYED_LISTS:
+        return _apply_keyed_list(_KEYED_LISTS[name], old, patch)
+    raise ValueError("Patch does not match its base", name)
+
+
+def _apply_dict(
+    old: Mapping[str, Any], patch: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    Applies the patch to a copy of the mapping. Unchanged values are shared
+    with the base.
+
+    Args:
+        old (Mapping[str, Any]):
+        patch (Mapping[str, Any]):
+
+    Returns:
+        dict[str, Any]:
+
+    """
+    result: dict[str, Any] = dict(old)
+    for key in patch.get(_DELETE, ()):
+        _ = result.pop(key, None)
+    for key, value in patch.get(_PATCH, {}).items():
+        result[key] = _apply_value(key, result[key], value)
+    result.update(patch.get(_SET, {}))
+    return result
+
+
+def _apply_keyed_list(
+    key_of: Callable[[Mapping[str, Any]], Any],
+    old: Sequence[Any],
+    patch: Mapping[str, Any],
+) -> list[Any]:
+    """
+
+    Args:
+        key_of (Callable[[Mapping[str, Any]], Any]):
+        old (Sequence[Any]):
+        patch (Mapping[str, Any]):
+
+    Returns:
+        list[Any]:
+
+    """
+    items: dict[str, Any] = {dumps(key_of(item)): item for item in old}
+    for key, value in patch.get(_PATCH, {}).items():
+        items[key] = _apply_dict(items[key], value)
+    items.update(patch.get(_SET, {}))
+
+    keys: list[str]
+    if _KEYS in patch:
+        keys = patch[_KEYS]
+    else:
+        deleted: set[str] = set(patch.get(_DELETE, ()))
+        keys = [key for key in items if key not in deleted]
+        inserted: list[list[Any]] = patch.get(_INSERT, [])
+        inserted_keys: set[str] = {key for _, key in inserted}
+        keys = [key for key in keys if key not in inserted_keys]
+        for position, key in inserted:
+            keys.insert(position, key)
+
+    return [items[key] for key in keys]
+
+
+class DeltaArchive:
+    """
+    Stores successive builds in a directory. Every n-th build is stored as
+    full snapshot, all other builds as delta against their predecessor.
+    Reconstructed builds are cached, so loading builds of the same chain
+    only applies the missing deltas.
+
+    The snapshots of an existing archive are determined from its files, so
+    it can be reopened with a different snapshot interval. The interval
+    applies to the builds appended afterwards.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike | str,
+        snapshot_interval: int = 16,
+        cache_size: int = 32,
+    ) -> None:
+        """
+
+        Args:
+            directory (PathLike | str): The directory of the archive.
+            snapshot_interval (int): The distance of full snapshots.
+            cache_size (int): The number of reconstructed builds to keep.
+
+        Returns:
+            None:
+
+        """
+        if snapshot_interval < 1:
+            raise ValueError("Invalid snapshot interval", snapshot_interval)
+
+        self._directory: str = str(directory)
+        self._snapshot_interval: int = snapshot_interval
+        self._cache_size: int = cache_size
+        self._cache: OrderedDict[int, Mapping[str, Any]] = OrderedDict()
+        makedirs(self._directory, exist_ok=True)
+        names: list[str] = [
+            name for name in listdir(self._directory) if name.endswith(".json")
+        ]
+        self._count: int = len(names)
+        self._snapshots: list[int] = sorted(
+            int(name.split(".", 1)[0])
+            for name in names
+            if not name.endswith(".delta.json")
+        )
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of builds in the archive.
+
+        """
+        return self._count
+
+    def _path(self, index: int, snapshot: bool) -> str:
+        """
+
+        Args:
+            index (int):
+            snapshot (bool): Whether the build is stored as full snapshot.
+
+        Returns:
+            str:
+
+        """
+        suffix: str = "json" if snapshot else "delta.json"
+        return _join_path(self._directory, f"{index:08d}.{suffix}")
+
+    def _snapshot_of(self, index: int) -> int:
+        """
+
+        Args:
+            index (int):
+
+        Returns:
+            int: The index of the snapshot the build is reconstructed from.
+
+        """
+        position: int = bisect_right(self._snapshots, index)
+        if position == 0:
+            raise IndexError("No snapshot for build", index)
+        return self._snapshots[position - 1]
+
+    def _remember(self, index: int, data: Mapping[str, Any]) -> None:
+        """
+
+        Args:
+            index (int):
+            data (Mapping[str, Any]):
+
+        Returns:
+            None:
+
+        """
+        self._cache[index] = data
+        self._cache.move_to_end(index)
+        while len(self._cache) > self._cache_size:
+            _ = self._cache.popitem(last=False)
+
+    def append(self, bi: BuildInfo) -> int:
+        """
+        Appends the build info to the archive.
+
+        Args:
+            bi (BuildInfo):
+
+        Returns:
+            int: The index of the build within the archive.
+
+        """
+        index: int = self._count
+        data: Mapping[str, Any] = transform_to_mapping(bi)
+        if (
+            len(self._snapshots) == 0
+            or index - self._snapshots[-1] >= self._snapshot_interval
+        ):
+            _write_document(self._path(index, True), data)
+            self._snapshots.append(index)
+        else:
+            previous: Mapping[str, Any] = self._load_mapping(index - 1)
+            _write_document(
+                self._path(index, False), _delta_of_mappings(previous, data)
+            )
+
+        self._count += 1
+        self._remember(index, data)
+        return index
+
+    def load(self, index: int) -> BuildInfo:
+        """
+        Reconstructs the build with the specified index.
+
+        Args:
+            index (int):
+
+        Returns:
+            BuildInfo:
+
+        """
+        return load_from_dict(self._load_mapping(index))
+
+    def _load_mapping(self, index: int) -> Mapping[str, Any]:
+        """
+
+        Args:
+            index (int):
+
+        Returns:
+            Mapping[str, Any]:
+
+        """
+        if index < 0 or index >= self._count:
+            raise IndexError("No such build", index)
+
+        snapshot: int = self._snapshot_of(index)
+        start: int = next(
+            (i for i in range(index, snapshot - 1, -1) if i in self._cache),
+            snapshot,
+        )
+        data: Mapping[str, Any] = (
+            self._cache[start]
+            if start in self._cache
+            else _read_document(self._path(start, True))
+        )
+        self._remember(start, data)
+        for current in range(start + 1, index + 1):
+            data = _apply_delta_to_mapping(
+                data, _read_document(self._path(current, False))
+            )
+            self._remember(current, data)
+
+        return data
@@ -0,0 +1,825 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from dataclasses import asdict, dataclass, field, is_dataclass
+from enum import IntEnum, auto
+from hashlib import blake2b
+from json import dumps
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+from ._loadsave import load_from_file
+from ._merge import (
+    _artifact_key,
+    _combine_artifact,
+    _combine_dependency,
+    _dependency_key,
+    _module_key,
+    _ModuleCombiner,
+)
+from ._model import Module
+from ._vcs import BuildInfo
+
+
+class ChangeKind(IntEnum):
+    """ """
+
+    ADDED = auto()
+    """
+    The element exists in the new build only.
+    """
+    REMOVED = auto()
+    """
+    The element exists in the old build only.
+    """
+    CHANGED = auto()
+    """
+    The element exists in both builds with different values.
+    """
+
+
+class ChangeScope(IntEnum):
+    """ """
+
+    ATTRIBUTE = auto()
+    """
+    A scalar or nested attribute of the build info, e.g. its number.
+    """
+    PROPERTY = auto()
+    """
+    A property of the build info.
+    """
+    MODULE = auto()
+    """
+    A module identified by its id.
+    """
+    MODULE_PROPERTY = auto()
+    """
+    A property of a module.
+    """
+    ARTIFACT = auto()
+    """
+    An artifact of a module identified by its type, name and path.
+    """
+    DEPENDENCY = auto()
+    """
+    A dependency of a module identified by its id.
+    """
+
+
+@dataclass
+class BuildInfoChange:
+    """
+    A single difference between two build infos.
+    """
+
+    kind: ChangeKind
+    """The kind of the change"""
+    scope: ChangeScope
+    """The type of the changed element"""
+    key: Any
+    """The identity of the changed element within its scope"""
+    module: str | None = None
+    """The id of the module containing the element"""
+    old: Any = None
+    """The old value. Not reported for artifacts and dependencies by
+    iter_build_info_diff"""
+    new: Any = None
+    """The new value"""
+    old_checksums: tuple[str | None, str | None, str | None] | None = None
+    """The sha256, sha1 and md5 digests of a changed or removed artifact or
+    dependency, also reported by iter_build_info_diff"""
+
+
+@dataclass
+class BuildInfoDiff:
+    """
+    The differences between two build infos.
+    """
+
+    changes: list[BuildInfoChange] = field(default_factory=list)
+    """All changes in the order they have been detected"""
+
+    def __bool__(self) -> bool:
+        """
+
+        Returns:
+            bool: True, if there are any changes.
+
+        """
+        return len(self.changes) > 0
+
+    def of_scope(self, scope: ChangeScope) -> list[BuildInfoChange]:
+        """
+
+        Args:
+            scope (ChangeScope):
+
+        Returns:
+            list[BuildInfoChange]: All changes of the specified scope.
+
+        """
+        return [c for c in self.changes if c.scope == scope]
+
+    @property
+    def modules(self) -> list[BuildInfoChange]:
+        """
+        The added, removed and changed modules.
+
+        Returns:
+            list[BuildInfoChange]:
+
+        """
+        return self.of_scope(ChangeScope.MODULE)
+
+    @property
+    def properties(self) -> list[BuildInfoChange]:
+        """
+        The changes of the build properties.
+
+        Returns:
+            list[BuildInfoChange]:
+
+        """
+        return self.of_scope(ChangeScope.PROPERTY)
+
+    @property
+    def changed_checksums(self) -> list[BuildInfoChange]:
+        """
+        The artifacts existing in both builds having different checksums.
+
+        Returns:
+            list[BuildInfoChange]:
+
+        """
+        return [
+            c
+            for c in self.of_scope(ChangeScope.ARTIFACT)
+            if c.kind == ChangeKind.CHANGED
+            and c.old_checksums != _checksums(c.new)
+        ]
+
+    @property
+    def new_transitive_dependencies(self) -> list[BuildInfoChange]:
+        """
+        The added dependencies, that are requested by other dependencies.
+
+        Returns:
+            list[BuildInfoChange]:
+
+        """
+        return [
+            c
+            for c in self.of_scope(ChangeScope.DEPENDENCY)
+            if c.kind == ChangeKind.ADDED and c.new.requestedBy
+        ]
+
+
+def diff_build_info(old: BuildInfo, new: BuildInfo) -> BuildInfoDiff:
+    """
+    Computes the differences between two build infos. Modules, artifacts
+    and dependencies are matched using the keys merge_build_info uses,
+    so the runtime is linear in the size of both builds.
+
+    Args:
+        old (BuildInfo):
+        new (BuildInfo):
+
+    Returns:
+        BuildInfoDiff:
+
+    """
+    old_index = _BuildIndex(old, _keep)
+    return BuildInfoDiff(list(old_index.compare(new)))
+
+
+def iter_build_info_diff(
+    old: BuildInfo | str | PathLike, new: BuildInfo | str | PathLike
+) -> Iterator[BuildInfoChange]:
+    """
+    Computes the differences between two build infos lazily. If paths are
+    passed, the old build is loaded completely and reduced to an index of
+    entry digests and checksums before the new build is loaded, so both
+    builds are never held in memory at the same time. Therefore, the old
+    values of modules, artifacts and dependencies are not reported.
+
+    Args:
+        old (BuildInfo | str | PathLike): The old build or its path.
+        new (BuildInfo | str | PathLike): The new build or its path.
+
+    Yields:
+        BuildInfoChange:
+
+    """
+    old_index = _BuildIndex(_load(old), _reduce)
+    yield from old_index.compare(_load(new))
+
+
+_ATTRIBUTES: tuple[str, ...] = (
+    "version",
+    "name",
+    "number",
+    "type",
+    "buildAgent",
+    "agent",
+    "started",
+    "durationMillis",
+    "principal",
+    "url",
+    "vcs",
+    "issues",
+)
+
+_ValueOf = Callable[[Any], Any]
+
+
+def _load(item: BuildInfo | str | PathLike) -> BuildInfo:
+    """
+
+    Args:
+        item (BuildInfo | str | PathLike):
+
+    Returns:
+        BuildInfo:
+
+    """
+    if isinstance(item, BuildInfo):
+        return item
+    return load_from_file(Path(item))
+
+
+def _keep(value: Any) -> Any:
+    """
+
+    Args:
+        value (Any):
+
+    Returns:
+        Any: The value itself.
+
+    """
+    return value
+
+
+def _canonical(value: Any) -> str:
+    """
+    Serializes the value like it is saved, so sequences compare equal
+    regardless of being stored as lists or tuples.
+
+    Args:
+        value (Any):
+
+    Returns:
+        str: The JSON representation of the value.
+
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    return dumps(value, sort_keys=True, default=str)
+
+
+def _equal(old: Any, new: Any) -> bool:
+    """
+
+    Args:
+        old (Any):
+        new (Any):
+
+    Returns:
+        bool: True, if both values would be saved equally.
+
+    """
+    return bool(old == new) or _canonical(old) == _canonical(new)
+
+
+def _digest(value: Any) -> bytes:
+    """
+
+    Args:
+        value (Any):
+
+    Returns:
+        bytes: A compact digest of the saved representation of the value.
+
+    """
+    return blake2b(_canonical(value).encode("utf-8"), digest_size=16).digest()
+
+
+def _reduce(value: Any) -> tuple[bytes, Any]:
+    """
+
+    Args:
+        value (Any): An artifact or dependency.
+
+    Returns:
+        tuple[bytes, Any]: The digest and the checksums of the value.
+
+    """
+    return _digest(value), _checksums(value)
+
+
+def _checksums(
+    entry: Any,
+) -> tuple[str | None, str | None, str | None] | None:
+    """
+
+    Args:
+        entry (Any): An artifact, a dependency or None.
+
+    Returns:
+        tuple[str | None, str | None, str | None] | None:
+
+    """
+    if entry is None:
+        return None
+    return entry.sha256, entry.sha1, entry.md5
+
+
+def _index_modules(bi: BuildInfo) -> dict[object, Module]:
+    """
+    Indexes the modules by their keys. Modules with the same key are
+    combined like merge_build_info does, modules without key are matched
+    by their order.
+
+    Args:
+        bi (BuildInfo):
+
+    Returns:
+        dict[object, Module]:
+
+    """
+    modules: dict[object, list[Module]] = {}
+    anonymous: int = 0
+    for module in bi.modules or ():
+        key: object = _module_key(module)
+        if key is None:
+            key = (None, anonymous)
+            anonymous += 1
+        modules.setdefault(key, []).append(module)
+
+    return {
+        key: (
+            same_modules[0]
+            if len(same_modules) == 1
+            else _combine_modules(same_modules)
+        )
+        for key, same_modules in modules.items()
+    }
+
+
+def _combine_modules(modules: Sequence[Module]) -> Module:
+    """
+
+    Args:
+        modules (Sequence[Module]): Modules sharing the same key.
+
+    Returns:
+        Module:
+
+    """
+    combiner = _ModuleCombiner(modules[0])
+    for module in modules:
+        combiner.add(module)
+    return combiner.build()
+
+
+def _index_entries(
+    entries: Sequence[Any] | None,
+    key_of: Callable[[Any], Any],
+    combine: Callable[[Any, Any], Any],
+) -> dict[Any, Any]:
+    """
+
+    Args:
+        entries (Sequence[Any] | None):
+        key_of (Callable[[Any], Any]):
+        combine (Callable[[Any, Any], Any]):
+
+    Returns:
+        dict[Any, Any]:
+
+    """
+    index: dict[Any, Any] = {}
+    for entry in entries or ():
+        key = key_of(entry)
+        existing = index.get(key)
+        index[key] = entry if existing is None else combine(existing, entry)
+    return index
+
+
+class _ModuleIndex:
+    """
+    The artifacts, dependencies and properties of a single module.
+    """
+
+    def __init__(self, module: Module, value_of: _ValueOf) -> None:
+        """
+
+        Args:
+            module (Module):
+            value_of (_ValueOf): Transforms the entries before storing.
+
+        Returns:
+            None:
+
+        """
+        self.id: str | None = module.id
+        self.module: Module | None = module if value_of is _keep else None
+        self.type: str | None = module.type
+        self.properties: dict[str, str] = dict(module.properties or {})
+        self.artifacts: dict[Any, Any] = {
+            key: value_of(artifact)
+            for key, artifact in _index_entries(
+                module.artifacts, _artifact_key, _combine_artifact
+            ).items()
+        }
+        self.dependencies: dict[Any, Any] = {
+            key: value_of(dependency)
+            for key, dependency in _index_entries(
+                module.dependencies, _dependency_key, _combine_dependency
+            ).items()
+        }
+
+
+class _BuildIndex:
+    """
+    The index of the old build info, the new build is compared with.
+    """
+
+    def __init__(self, bi: BuildInfo, value_of: _ValueOf) -> None:
+        """
+
+        Args:
+            bi (BuildInfo):
+            value_of (_ValueOf): Either keeps the entries or reduces them
+                to a digest.
+
+        Returns:
+            None:
+
+        """
+        self._value_of: _ValueOf = value_of
+        self._keeps_values: bool = value_of is _keep
+        self._attributes: dict[str, Any] = {
+            name: getattr(bi, name) for name in _ATTRIBUTES
+        }
+        self._properties: dict[str, str] = dict(bi.properties or {})
+        self._modules: dict[object, _ModuleIndex] = {
+            key: _ModuleIndex(module, value_of)
+            for key, module in _index_modules(bi).items()
+        }
+
+    def _old(self, value: Any) -> Any:
+        """
+
+        Args:
+            value (Any): The stored value.
+
+        Returns:
+            Any: The value, if it has not been reduced to a digest.
+
+        """
+        return value if self._keeps_values else None
+
+    def _old_checksums(
+        self, value: Any
+    ) -> tuple[str | None, str | None, str | None] | None:
+        """
+
+        Args:
+            value (Any): The stored value of an artifact or dependency.
+
+        Returns:
+            tuple[str | None, str | None, str | None] | None:
+
+        """
+        return _checksums(value) if self._keeps_values else value[1]
+
+    def compare(self, new: BuildInfo) -> Iterator[BuildInfoChange]:
+        """
+        Compares the new build with this index. The index is consumed.
+
+        Args:
+            new (BuildInfo):
+
+        Yields:
+            BuildInfoChange:
+
+        """
+        for name in _ATTRIBUTES:
+            old_value = self._attributes[name]
+            new_value = getattr(new, name)
+            if not _equal(old_value, new_value):
+                kind = (
+                    ChangeKind.ADDED
+                    if old_value is None
+                    else (
+                        ChangeKind.REMOVED
+                        if new_value is None
+                        else ChangeKind.CHANGED
+                    )
+                )
+                yield BuildInfoChange(
+                    kind,
+                    ChangeScope.ATTRIBUTE,
+                    name,
+                    None,
+                    old_value,
+                    new_value,
+                )
+
+        yield from _compare_properties(
+            ChangeScope.PROPERTY, None, self._properties, new.properties
+        )
+
+        for key, module in _index_modules(new).items():
+            old_module: _ModuleIndex | None = self._modules.pop(key, None)
+            if old_module is None:
+                yield from self._added_module(module)
+            else:
+                yield from self._compare_module(old_module, module)
+
+        for old_module in self._modules.values():
+            yield from self._removed_module(old_module)
+        self._modules.clear()
+
+    def _added_module(self, module: Module) -> Iterator[BuildInfoChange]:
+        """
+
+        Args:
+            module (Module):
+
+        Yields:
+            BuildInfoChange:
+
+        """
+        yield BuildInfoChange(
+            ChangeKind.ADDED,
+            ChangeScope.MODULE,
+            module.id,
+            module.id,
+            None,
+            module,
+        )
+        for key, value in (module.properties or {}).items():
+            yield BuildInfoChange(
+                ChangeKind.ADDED,
+                ChangeScope.MODULE_PROPERTY,
+                key,
+                module.id,
+                None,
+                value,
+            )
+        for artifact in module.artifacts or ():
+            yield BuildInfoChange(
+                ChangeKind.ADDED,
+                ChangeScope.ARTIFACT,
+                _artifact_key(artifact),
+                module.id,
+                None,
+                artifact,
+            )
+        for dependency in module.dependencies or ():
+            yield BuildInfoChange(
+                ChangeKind.ADDED,
+                ChangeScope.DEPENDENCY,
+                _dependency_key(dependency),
+                module.id,
+                None,
+                dependency,
+            )
+
+    def _removed_module(
+        self, module: _ModuleIndex
+    ) -> Iterator[BuildInfoChange]:
+        """
+
+        Args:
+            module (_ModuleIndex):
+
+        Yields:
+            BuildInfoChange:
+
+        """
+        module_id: str | None = module.id
+        yield BuildInfoChange(
+            ChangeKind.REMOVED,
+            ChangeScope.MODULE,
+            module_id,
+            module_id,
+            module.module,
+            None,
+        )
+        for key, value in module.properties.items():
+            yield BuildInfoChange(
+                ChangeKind.REMOVED,
+                ChangeScope.MODULE_PROPERTY,
+                key,
+                module_id,
+                value,
+                None,
+            )
+        for key, value in module.artifacts.items():
+            yield BuildInfoChange(
+                ChangeKind.REMOVED,
+                ChangeScope.ARTIFACT,
+                key,
+                module_id,
+                self._old(value),
+                None,
+                self._old_checksums(value),
+            )
+        for key, value in module.dependencies.items():
+            yield BuildInfoChange(
+                ChangeKind.REMOVED,
+                ChangeScope.DEPENDENCY,
+                key,
+                module_id,
+                self._old(value),
+                None,
+                self._old_checksums(value),
+            )
+
+    def _compare_module(
+        self, old: _ModuleIndex, new: Module
+    ) -> Iterator[BuildInfoChange]:
+        """
+
+        Args:
+            old (_ModuleIndex):
+            new (Module):
+
+        Yields:
+            BuildInfoChange:
+
+        """
+        changes: list[BuildInfoChange] = list(
+            _compare_properties(
+                ChangeScope.MODULE_PROPERTY,
+                new.id,
+                old.properties,
+                new.properties,
+            )
+        )
+        changes.extend(
+            self._compare_entries(
+                ChangeScope.ARTIFACT,
+                new.id,
+                old.artifacts,
+                _index_entries(
+                    new.artifacts, _artifact_key, _combine_artifact
+                ),
+            )
+        )
+        changes.extend(
+            self._compare_entries(
+                ChangeScope.DEPENDENCY,
+                new.id,
+                old.dependencies,
+                _index_entries(
+                    new.dependencies, _dependency_key, _combine_dependency
+                ),
+            )
+        )
+        if len(changes) > 0 or old.type != new.type:
+            yield BuildInfoChange(
+                ChangeKind.CHANGED,
+                ChangeScope.MODULE,
+                new.id,
+                new.id,
+                old.module,
+                new,
+            )
+        yield from changes
+
+    def _compare_entries(
+        self,
+        scope: ChangeScope,
+        module_id: str | None,
+        old: dict[Any, Any],
+        new: dict[Any, Any],
+    ) -> Iterator[BuildInfoChange]:
+        """
+
+        Args:
+            scope (ChangeScope):
+            module_id (str | None):
+            old (dict[Any, Any]): The stored old entries. Consumed.
+            new (dict[Any, Any]): The new entries by their keys.
+
+        Yields:
+            BuildInfoChange:
+
+        """
+        for key, entry in new.items():
+            if key not in old:
+                yield BuildInfoChange(
+                    ChangeKind.ADDED, scope, key, module_id, None, entry
+                )
+                continue
+
+            old_value = old.pop(key)
+            if (
+                not _equal(old_value, entry)
+                if self._keeps_values
+                else old_value != self._value_of(entry)
+            ):
+                yield BuildInfoChange(
+                    ChangeKind.CHANGED,
+                    scope,
+                    key,
+                    module_id,
+                    self._old(old_value),
+                    entry,
+                    self._old_checksums(old_value),
+                )
+
+        for key, old_value in old.items():
+            yield BuildInfoChange(
+                ChangeKind.REMOVED,
+                scope,
+                key,
+                module_id,
+                self._old(old_value),
+                None,
+                self._old_checksums(old_value),
+            )
+
+
+def _compare_properties(
+    scope: ChangeScope,
+    module_id: str | None,
+    old: dict[str, str],
+    new: Mapping[str, str] | None,
+) -> Iterator[BuildInfoChange]:
+    """
+
+    Args:
+        scope (ChangeScope):
+        module_id (str | None):
+        old (dict[str, str]):
+        new (Mapping[str, str] | None):
+
+    Yields:
+        BuildInfoChange:
+
+    """
+    new_properties: Mapping[str, str] = new or {}
+    for key, value in new_properties.items():
+        if key not in old:
+            yield BuildInfoChange(
+                ChangeKind.ADDED, scope, key, module_id, None, value
+            )
+        elif old[key] != value:
+            yield BuildInfoChange(
+                ChangeKind.CHANGED, scope, key, module_id, old[key], value
+            )
+    for key, value in old.items():
+        if key not in new_properties:
+            yield BuildInfoChange(
+                ChangeKind.REMOVED, scope, key, module_id, value, None
+            )
@@ -0,0 +1,329 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from dataclasses import astuple, dataclass
+from hashlib import md5, sha1, sha256
+from json import dump, load
+from os import PathLike, fspath, replace, stat_result
+from os.path import abspath
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from ._model import Artifact
+
+_BUFFER_SIZE: int = 1024 * 1024
+_CACHE_FORMAT: int = 1
+
+_FileState = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class FileDigests:
+    """
+    The digests of the content of a file.
+    """
+
+    md5: str
+    """The MD5 digest as hex string"""
+    sha1: str
+    """The SHA-1 digest as hex string"""
+    sha256: str
+    """The SHA-256 digest as hex string"""
+
+
+def digest_file(
+    path: str | PathLike, buffer_size: int = _BUFFER_SIZE
+) -> FileDigests:
+    """
+    Computes the MD5, SHA-1 and SHA-256 digests of a file reading its
+    content only once.
+
+    Args:
+        path (str | PathLike): The file to hash.
+        buffer_size (int): The number of bytes to read at once.
+
+    Returns:
+        FileDigests: The digests of the file content.
+
+    """
+    md5_hash = md5(usedforsecurity=False)
+    sha1_hash = sha1(usedforsecurity=False)
+    sha256_hash = sha256()
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while (count := file.readinto(view)) > 0:
+            chunk = view[:count]
+            md5_hash.update(chunk)
+            sha1_hash.update(chunk)
+            sha256_hash.update(chunk)
+
+    return FileDigests(
+        md5=md5_hash.hexdigest(),
+        sha1=sha1_hash.hexdigest(),
+        sha256=sha256_hash.hexdigest(),
+    )
+
+
+class DigestCache:
+    """
+    Remembers the digests of files together with the inode, size and
+    modification time of the file. A file is only hashed again, if one of
+    these has changed since its digests have been computed. The cache can
+    be used by multiple threads concurrently and saved as JSON file to be
+    reused by later builds.
+    """
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._entries: dict[str, tuple[_FileState, FileDigests]] = {}
+        self._lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of cached files.
+
+        """
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of files whose digests have been taken from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of files which have been hashed.
+        """
+        return self._misses
+
+    def digest(self, path: str | PathLike) -> FileDigests:
+        """
+        Returns the digests of the file, hashing it only if it is not known
+        or has changed.
+
+        Args:
+            path (str | PathLike): The file to hash.
+
+        Returns:
+            FileDigests: The digests of the file content.
+
+        """
+        key: str = abspath(path)
+        stat: stat_result = Path(key).stat()
+        state: _FileState = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == state:
+                self._hits += 1
+                return entry[1]
+
+        digests: FileDigests = digest_file(key)
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = (state, digests)
+        return digests
+
+    def save(self, path: str | PathLike) -> None:
+        """
+        Writes the cache to a JSON file. The file is replaced atomically.
+
+        Args:
+            path (str | PathLike): The file to write.
+
+        Returns:
+            None:
+
+        """
+        with self._lock:
+            entries: dict[str, list[Any]] = {
+                k: [*state, *astuple(digests)]
+                for k, (state, digests) in self._entries.items()
+            }
+
+        temporary: str = f"{fspath(path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            dump({"format": _CACHE_FORMAT, "entries": entries}, file)
+        replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> "DigestCache":
+        """
+        Reads a cache written by save. If the file does not exist or has an
+        unknown format, an empty cache is returned.
+
+        Args:
+            path (str | PathLike): The file to read.
+
+        Returns:
+            DigestCache:
+
+        """
+        cache = cls()
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data: dict[str, Any] = load(file)
+        except FileNotFoundError:
+            return cache
+
+        if data.get("format") != _CACHE_FORMAT:
+            return cache
+
+        for key, (ino, size, mtime, *digests) in data["entries"].items():
+            cache._entries[key] = ((ino, size, mtime), FileDigests(*digests))
+        return cache
+
+
+def digest_files(
+    paths: Iterable[str | PathLike],
+    workers: int | None = None,
+    cache: DigestCache | None = None,
+) -> list[FileDigests]:
+    """
+    Computes the digests of many files concurrently. As hashlib releases
+    the GIL while hashing, the files are processed by a pool of threads.
+
+    Args:
+        paths (Iterable[str | PathLike]): The files to hash.
+        workers (int | None): The number of threads to use. If None, the
+            default of ThreadPoolExecutor is used.
+        cache (DigestCache | None): The cache to take unchanged files from.
+
+    Returns:
+        list[FileDigests]: The digests in the order of the paths.
+
+    """
+    paths = list(paths)
+    digest: Callable[[str | PathLike], FileDigests] = (
+        digest_file if cache is None else cache.digest
+    )
+    if workers == 1 or len(paths) < 2:
+        return [digest(p) for p in paths]
+
+    # imported here, as it imports logging and is only needed for many files
+    # pylint: disable=C0415
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(digest, paths))
+
+
+def _artifact_type(path: Path) -> str | None:
+    """
+
+    Args:
+        path (Path):
+
+    Returns:
+        str | None: The file extension without leading dot.
+
+    """
+    return path.suffix[1:] or None
+
+
+def _artifact_from_digests(
+    path: str | PathLike, digests: FileDigests
+) -> Artifact:
+    """
+    Creates an artifact for a file using the name and extension of the file
+    as name and type.
+
+    Args:
+        path (str | PathLike): The path of the file.
+        digests (FileDigests): The digests of the file content.
+
+    Returns:
+        Artifact:
+
+    """
+    file_path = Path(path)
+    return Artifact(
+        type=_artifact_type(file_path),
+        name=file_path.name,
+        path=fspath(path),
+        sha256=digests.sha256,
+        sha1=digests.sha1,
+        md5=digests.md5,
+    )
+
+
+def artifacts_from_paths(
+    paths: Iterable[str | PathLike],
+    workers: int | None = None,
+    cache: DigestCache | None = None,
+) -> list[Artifact]:
+    """
+    Creates artifacts for many files hashing them concurrently.
+
+    Args:
+        paths (Iterable[str | PathLike]): The files to create artifacts for.
+        workers (int | None): The number of threads to use for hashing.
+        cache (DigestCache | None): The cache to take unchanged files from.
+
+    Returns:
+        list[Artifact]: The artifacts in the order of the paths.
+
+    """
+    paths = list(paths)
+    return [
+        _artifact_from_digests(p, d)
+        for p, d in zip(paths, digest_files(paths, workers, cache))
+    ]
@@ -0,0 +1,241 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from fnmatch import translate
+from os import environ
+from re import Pattern
+from re import compile as _compile_regex
+from threading import Lock
+from typing import Any, Iterable, Mapping, NoReturn
+
+_PatternSpec = str | Pattern[str]
+
+
+class EnvironmentSnapshot(dict[str, str]):
+    """
+    An immutable copy of environment variables. As it cannot be modified,
+    the same snapshot can be shared by all build infos created in a process
+    instead of copying the environment for every one of them.
+    """
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """
+
+        Raises:
+            TypeError: Always.
+
+        """
+        raise TypeError("EnvironmentSnapshot instances are immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __copy__(self) -> "EnvironmentSnapshot":
+        """
+
+        Returns:
+            EnvironmentSnapshot: The instance itself.
+
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "EnvironmentSnapshot":
+        """
+
+        Args:
+            memo (dict[int, Any]):
+
+        Returns:
+            EnvironmentSnapshot: The instance itself.
+
+        """
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+
+        Returns:
+            tuple[Any, ...]:
+
+        """
+        return (type(self), (dict(self),))
+
+
+def _compile_patterns(patterns: Iterable[_PatternSpec]) -> Pattern[str] | None:
+    """
+    Combines glob patterns and regular expressions into a single regular
+    expression. Glob patterns must match the whole name, regular
+    expressions must match at the start of the name.
+
+    Args:
+        patterns (Iterable[str | Pattern[str]]):
+
+    Returns:
+        Pattern[str] | None: The combined expression or None, if no pattern
+            has been specified.
+
+    """
+    expressions: list[str] = [
+        translate(p) if isinstance(p, str) else p.pattern for p in patterns
+    ]
+    if len(expressions) == 0:
+        return None
+    return _compile_regex("|".join(f"(?:{e})" for e in expressions))
+
+
+class EnvironmentCapture:
+    """
+    Captures environment variables selected by include and exclude rules.
+    A rule is either a glob pattern or a compiled regular expression. A
+    variable is captured, if it matches an include rule and no exclude
+    rule. The prefix to strip is removed from the names of the captured
+    variables starting with it.
+
+    The snapshot of the process environment is taken once and shared by
+    all callers until it is refreshed.
+    """
+
+    def __init__(
+        self,
+        include: Iterable[_PatternSpec] = ("*",),
+        exclude: Iterable[_PatternSpec] = (),
+        strip_prefix: str | None = None,
+    ) -> None:
+        """
+
+        Args:
+            include (Iterable[str | Pattern[str]]): The rules of variables
+                to capture.
+            exclude (Iterable[str | Pattern[str]]): The rules of variables
+                to skip.
+            strip_prefix (str | None): The prefix to remove from names.
+
+        Returns:
+            None:
+
+        """
+        self._include: Pattern[str] | None = _compile_patterns(include)
+        self._exclude: Pattern[str] | None = _compile_patterns(exclude)
+        self._strip_prefix: str | None = strip_prefix or None
+        self._snapshot: EnvironmentSnapshot | None = None
+        self._lock = Lock()
+
+    def capture(
+        self, environment: Mapping[str, str] | None = None
+    ) -> EnvironmentSnapshot:
+        """
+        Captures the selected variables of the environment.
+
+        Args:
+            environment (Mapping[str, str] | None): The variables to select
+                from. If None, the environment of the process is used.
+
+        Returns:
+            EnvironmentSnapshot:
+
+        """
+        source: Mapping[str, str] = (
+            environ if environment is None else environment
+        )
+        items: Iterable[tuple[str, str]] = source.items()
+
+        include: Pattern[str] | None = self._include
+        if include is None:
+            return EnvironmentSnapshot()
+        exclude: Pattern[str] | None = self._exclude
+        items = ((k, v) for k, v in items if include.match(k))
+        if exclude is not None:
+            items = ((k, v) for k, v in items if not exclude.match(k))
+
+        prefix: str | None = self._strip_prefix
+        if prefix is not None:
+            length: int = len(prefix)
+            items = (
+                (k[length:] if k.startswith(prefix) else k, v)
+                for k, v in items
+            )
+
+        return EnvironmentSnapshot(items)
+
+    def snapshot(self) -> EnvironmentSnapshot:
+        """
+        Returns the snapshot of the process environment, capturing it on
+        the first call.
+
+        Returns:
+            EnvironmentSnapshot:
+
+        """
+        snapshot: EnvironmentSnapshot | None = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self.capture()
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self) -> EnvironmentSnapshot:
+        """
+        Captures the process environment again, e.g. after it has been
+        modified.
+
+        Returns:
+            EnvironmentSnapshot: The new snapshot.
+
+        """
+        snapshot: EnvironmentSnapshot = self.capture()
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
+
+
+_DEFAULT_CAPTURE = EnvironmentCapture()
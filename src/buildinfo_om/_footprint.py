@@ -0,0 +1,327 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+import tracemalloc
+from dataclasses import dataclass, fields, is_dataclass
+from sys import getsizeof
+from threading import Lock
+from types import TracebackType
+from typing import Any
+
+from ._instrument import Observer, add_observer, remove_observer
+from ._vcs import BuildInfo
+
+_CHECKSUM_FIELDS: frozenset[str] = frozenset({"sha256", "sha1", "md5"})
+_CATEGORY_FIELDS: dict[str, str] = {
+    "modules": "modules",
+    "artifacts": "artifacts",
+    "dependencies": "dependencies",
+    "properties": "properties",
+}
+
+
+@dataclass
+class Footprint:  # pylint: disable=R0902
+    """
+    The memory used by a build info in bytes. Every object is counted once,
+    even if it is referenced multiple times. Objects are attributed to the
+    category they are reached first in.
+    """
+
+    total: int = 0
+    """The memory used by all objects"""
+    modules: int = 0
+    """The memory used by the modules except artifacts, dependencies and
+    properties"""
+    artifacts: int = 0
+    """The memory used by the artifacts of all modules"""
+    dependencies: int = 0
+    """The memory used by the dependencies of all modules"""
+    properties: int = 0
+    """The memory used by the properties of the build and the modules"""
+    other: int = 0
+    """The memory used by everything else"""
+    strings: int = 0
+    """The memory used by strings and raw digests, included in the
+    categories above"""
+    shared: int = 0
+    """The memory of the objects referenced more than once"""
+    duplicated_checksums: int = 0
+    """The memory of checksum strings equal to another checksum string, but
+    stored as a separate object"""
+    duplicated_strings: int = 0
+    """The memory of all strings equal to another string, but stored as a
+    separate object, including duplicated checksums"""
+    duplicated_chains: int = 0
+    """The memory of requestedBy chains equal to another chain, but stored
+    as separate objects"""
+
+
+def _chain_key(chains: Any) -> Any:
+    """
+
+    Args:
+        chains (Any): The requesting chains of a dependency.
+
+    Returns:
+        Any: A hashable representation of the chains.
+
+    """
+    return tuple(tuple(c) for c in chains)
+
+
+def measure_footprint(bi: BuildInfo) -> Footprint:
+    """
+    Determines the memory used by the build info and how much of it is
+    shared or duplicated. The sizes are taken from sys.getsizeof, so they
+    are approximate. Digests are measured as stored, i.e. as raw bytes for
+    compact build infos.
+
+    Args:
+        bi (BuildInfo): The build info to measure.
+
+    Returns:
+        Footprint:
+
+    """
+    footprint = Footprint()
+    seen: set[int] = set()
+    shared: set[int] = set()
+    strings: dict[str | bytes, int] = {}
+    checksums: dict[str | bytes, int] = {}
+    chains: dict[Any, int] = {}
+    pending: list[tuple[Any, str, str | None]] = [(bi, "other", None)]
+
+    while len(pending) > 0:
+        value, category, field_name = pending.pop()
+        identity: int = id(value)
+        if identity in seen:
+            if identity not in shared:
+                shared.add(identity)
+                footprint.shared += getsizeof(value)
+            continue
+        seen.add(identity)
+
+        size: int = getsizeof(value)
+        if is_dataclass(value):
+            stored: dict[str, Any] = vars(value)
+            size += getsizeof(stored)
+            for f in fields(value):
+                pending.append(
+                    (
+                        stored.get(f.name),
+                        _CATEGORY_FIELDS.get(f.name, category),
+                        f.name,
+                    )
+                )
+        elif isinstance(value, (str, bytes)):
+            footprint.strings += size
+            if strings.setdefault(value, identity) != identity:
+                footprint.duplicated_strings += size
+            if field_name in _CHECKSUM_FIELDS and (
+                checksums.setdefault(value, identity) != identity
+            ):
+                footprint.duplicated_checksums += size
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                pending.append((k, category, None))
+                pending.append((v, category, None))
+        elif isinstance(value, (list, tuple)):
+            if field_name == "requestedBy" and (
+                chains.setdefault(_chain_key(value), identity) != identity
+            ):
+                footprint.duplicated_chains += _deep_size(value)
+            for item in value:
+                pending.append((item, category, None))
+        elif hasattr(type(value), "__slots__"):
+            for name in type(value).__slots__:
+                pending.append((getattr(value, name), category, None))
+
+        footprint.total += size
+        setattr(footprint, category, getattr(footprint, category) + size)
+
+    return footprint
+
+
+def _deep_size(value: Any) -> int:
+    """
+
+    Args:
+        value (Any): Nested lists and tuples of strings.
+
+    Returns:
+        int: The size of the value and all items.
+
+    """
+    size: int = getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(_deep_size(v) for v in value)
+    return size
+
+
+@dataclass
+class _OpenPhase:
+    """
+    A phase whose memory peak is being tracked.
+    """
+
+    name: str
+    """The name of the phase"""
+    start: int
+    """The traced memory when the phase started"""
+    peak: int
+    """The highest traced memory seen while the phase is running"""
+
+
+class PeakMemoryRecorder(Observer):
+    """
+    Records the peak memory allocated by each instrumented phase, e.g. by
+    load_from_file (load), save_to_file (save) or merge_build_info (merge),
+    using tracemalloc. The peak is the highest traced memory during the
+    phase minus the traced memory at its start.
+
+    Used as context manager, the recorder starts tracemalloc, if it is not
+    running, and registers itself while the context is active. As
+    tracemalloc traces all threads, phases should not run concurrently
+    while recording.
+    """
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self.peaks: dict[str, int] = {}
+        self._open: list[_OpenPhase] = []
+        self._lock = Lock()
+        self._started_tracing: bool = False
+
+    def _fold_peak(self) -> int:
+        """
+        Adds the peak since the last reset to all open phases.
+
+        Returns:
+            int: The currently traced memory.
+
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        for open_phase in self._open:
+            open_phase.peak = max(open_phase.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def phase_started(self, name: str) -> None:
+        """
+
+        Args:
+            name (str):
+
+        Returns:
+            None:
+
+        """
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            current: int = self._fold_peak()
+            self._open.append(_OpenPhase(name, current, current))
+
+    def phase_finished(self, name: str, duration: float) -> None:
+        """
+
+        Args:
+            name (str):
+            duration (float):
+
+        Returns:
+            None:
+
+        """
+        with self._lock:
+            if len(self._open) == 0 or self._open[-1].name != name:
+                return
+            self._fold_peak()
+            open_phase: _OpenPhase = self._open.pop()
+            self.peaks[name] = max(
+                self.peaks.get(name, 0), open_phase.peak - open_phase.start
+            )
+
+    def __enter__(self) -> "PeakMemoryRecorder":
+        """
+
+        Returns:
+            PeakMemoryRecorder: The instance itself.
+
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        add_observer(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+
+        Args:
+            exc_type (type[BaseException] | None):
+            exc_value (BaseException | None):
+            traceback (TracebackType | None):
+
+        Returns:
+            None:
+
+        """
+        remove_observer(self)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -0,0 +1,414 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+from ._model import Module
+
+
+def _compress(
+    count: int, sources: array, targets: array
+) -> tuple[array, array]:
+    """
+    Creates the compressed sparse row representation of the edges.
+
+    Args:
+        count (int): The number of nodes.
+        sources (array): The source node of every edge.
+        targets (array): The target node of every edge.
+
+    Returns:
+        tuple[array, array]: The offsets of the adjacent nodes of each node
+            and the adjacent nodes.
+
+    """
+    offsets = array("l", [0]) * (count + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(count):
+        offsets[node + 1] += offsets[node]
+
+    adjacent = array("l", [0]) * len(targets)
+    positions = array("l", offsets[:-1])
+    for source, target in zip(sources, targets):
+        adjacent[positions[source]] = target
+        positions[source] += 1
+    return offsets, adjacent
+
+
+class DependencyGraph:
+    """
+    The graph of the dependencies of a module derived from the requesting
+    chains of the dependencies. A dependency is a child of the first entry
+    of each of its requesting chains, each entry of a chain is a child of
+    the next entry. The module is the parent of dependencies without
+    requesting chains and of the last entries of all chains, unless these
+    are the module itself.
+
+    Node ids are interned to integers and the edges are stored as
+    adjacency arrays in both directions. Transitive closures are memoized.
+    """
+
+    def __init__(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module): The module to create the graph for.
+
+        Returns:
+            None:
+
+        """
+        self._ids: list[str] = []
+        self._nodes: dict[str, int] = {}
+        self._root: int = self._intern(module.id or "")
+
+        edges: set[tuple[int, int]] = set()
+        for dependency in module.dependencies or ():
+            if dependency.id is None:
+                continue
+            node: int = self._intern(dependency.id)
+            chains = dependency.requestedBy or ()
+            if len(chains) == 0:
+                edges.add((self._root, node))
+            for chain in chains:
+                child: int = node
+                for ancestor in chain:
+                    parent: int = self._intern(ancestor)
+                    edges.add((parent, child))
+                    child = parent
+                if child != self._root:
+                    edges.add((self._root, child))
+        edges.discard((self._root, self._root))
+
+        ordered: list[tuple[int, int]] = sorted(edges)
+        sources = array("l", (s for s, _ in ordered))
+        targets = array("l", (t for _, t in ordered))
+        count: int = len(self._ids)
+        self._child_offsets, self._children = _compress(
+            count, sources, targets
+        )
+        self._parent_offsets, self._parents = _compress(
+            count, targets, sources
+        )
+        self._descendants: dict[int, frozenset[int]] = {}
+        self._ancestors: dict[int, frozenset[int]] = {}
+
+    def _intern(self, node_id: str) -> int:
+        """
+
+        Args:
+            node_id (str):
+
+        Returns:
+            int: The number of the node.
+
+        """
+        node: int | None = self._nodes.get(node_id)
+        if node is None:
+            node = len(self._ids)
+            self._nodes[node_id] = node
+            self._ids.append(node_id)
+        return node
+
+    def _node(self, node_id: str) -> int:
+        """
+
+        Args:
+            node_id (str):
+
+        Returns:
+            int:
+
+        Raises:
+            KeyError: If the id is not part of the graph.
+
+        """
+        return self._nodes[node_id]
+
+    @property
+    def root(self) -> str:
+        """
+        The id of the module, that is the root of the graph.
+        """
+        return self._ids[self._root]
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of nodes including the module.
+
+        """
+        return len(self._ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        """
+
+        Args:
+            node_id (object):
+
+        Returns:
+            bool:
+
+        """
+        return node_id in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        """
+
+        Returns:
+            Iterator[str]: The ids of all nodes.
+
+        """
+        return iter(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """
+        The number of distinct edges.
+        """
+        return len(self._children)
+
+    def _adjacent(self, offsets: array, adjacent: array, node: int) -> array:
+        """
+
+        Args:
+            offsets (array):
+            adjacent (array):
+            node (int):
+
+        Returns:
+            array: The adjacent nodes.
+
+        """
+        start: int = offsets[node]
+        end: int = offsets[node + 1]
+        return adjacent[start:end]
+
+    def children(self, node_id: str) -> list[str]:
+        """
+
+        Args:
+            node_id (str):
+
+        Returns:
+            list[str]: The ids of the nodes requested by the node directly.
+
+        """
+        ids: list[str] = self._ids
+        return [
+            ids[n]
+            for n in self._adjacent(
+                self._child_offsets, self._children, self._node(node_id)
+            )
+        ]
+
+    def parents(self, node_id: str) -> list[str]:
+        """
+
+        Args:
+            node_id (str):
+
+        Returns:
+            list[str]: The ids of the nodes requesting the node directly.
+
+        """
+        ids: list[str] = self._ids
+        return [
+            ids[n]
+            for n in self._adjacent(
+                self._parent_offsets, self._parents, self._node(node_id)
+            )
+        ]
+
+    def _closure(
+        self,
+        node: int,
+        offsets: array,
+        adjacent: array,
+        memo: dict[int, frozenset[int]],
+    ) -> frozenset[int]:
+        """
+        Determines all nodes reachable from the node, reusing closures
+        determined before.
+
+        Args:
+            node (int):
+            offsets (array):
+            adjacent (array):
+            memo (dict[int, frozenset[int]]):
+
+        Returns:
+            frozenset[int]: The reachable nodes excluding the node itself.
+
+        """
+        known: frozenset[int] | None = memo.get(node)
+        if known is not None:
+            return known
+
+        reached: set[int] = set()
+        pending: list[int] = [node]
+        while len(pending) > 0:
+            current: int = pending.pop()
+            for n in self._adjacent(offsets, adjacent, current):
+                if n in reached:
+                    continue
+                reached.add(n)
+                closure: frozenset[int] | None = memo.get(n)
+                if closure is None:
+                    pending.append(n)
+                else:
+                    reached.update(closure)
+        reached.discard(node)
+        result = frozenset(reached)
+        memo[node] = result
+        return result
+
+    def descendants(self, node_id: str) -> frozenset[str]:
+        """
+        Determines what the node depends on transitively. For the root,
+        this is every dependency of the module.
+
+        Args:
+            node_id (str):
+
+        Returns:
+            frozenset[str]:
+
+        """
+        ids: list[str] = self._ids
+        return frozenset(
+            ids[n]
+            for n in self._closure(
+                self._node(node_id),
+                self._child_offsets,
+                self._children,
+                self._descendants,
+            )
+        )
+
+    def ancestors(self, node_id: str) -> frozenset[str]:
+        """
+        Determines everything pulling in the node transitively, including
+        the module.
+
+        Args:
+            node_id (str):
+
+        Returns:
+            frozenset[str]:
+
+        """
+        ids: list[str] = self._ids
+        return frozenset(
+            ids[n]
+            for n in self._closure(
+                self._node(node_id),
+                self._parent_offsets,
+                self._parents,
+                self._ancestors,
+            )
+        )
+
+    def why(self, node_id: str) -> list[str] | None:
+        """
+        Determines the shortest chain from the module to the node, i.e.
+        why the node is a dependency of the module.
+
+        Args:
+            node_id (str):
+
+        Returns:
+            list[str] | None: The ids from the module to the node or None,
+                if the node cannot be reached from the module.
+
+        """
+        target: int = self._node(node_id)
+        previous: dict[int, int] = {self._root: self._root}
+        pending: deque[int] = deque((self._root,))
+        offsets: array = self._child_offsets
+        children: array = self._children
+        while len(pending) > 0 and target not in previous:
+            current: int = pending.popleft()
+            for n in self._adjacent(offsets, children, current):
+                if n not in previous:
+                    previous[n] = current
+                    pending.append(n)
+
+        if target not in previous:
+            return None
+
+        path: list[int] = [target]
+        while path[-1] != self._root:
+            path.append(previous[path[-1]])
+        return [self._ids[n] for n in reversed(path)]
+
+    def roots_of(self, node_ids: Iterable[str]) -> set[str]:
+        """
+        Determines the direct dependencies of the module pulling in any of
+        the nodes.
+
+        Args:
+            node_ids (Iterable[str]):
+
+        Returns:
+            set[str]:
+
+        """
+        direct: set[int] = set(
+            self._adjacent(self._child_offsets, self._children, self._root)
+        )
+        found: set[str] = set()
+        for node_id in node_ids:
+            node: int = self._node(node_id)
+            candidates = self._closure(
+                node, self._parent_offsets, self._parents, self._ancestors
+            )
+            found.update(self._ids[n] for n in direct & {node, *candidates})
+        return found
@@ -0,0 +1,337 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from dataclasses import dataclass
+from sys import getsizeof
+from typing import Any, Hashable, Iterator
+
+from ._compact import digest_to_bytes, raw_digests
+from ._model import Artifact, Dependency, Module
+from ._vcs import BuildInfo
+
+_BuildKey = Hashable
+_Postings = dict[_BuildKey, list["IndexEntry"]]
+_Digest = bytes | str
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """
+    An artifact or dependency found in the index.
+    """
+
+    build: _BuildKey
+    """The key of the build containing the entry"""
+    module: Module
+    """The module containing the entry"""
+    entry: Artifact | Dependency
+    """The artifact or dependency"""
+
+
+class BuildInfoIndex:
+    """
+    Maps checksums and dependency ids to the artifacts and dependencies of
+    many build infos. Builds are added and removed incrementally; only the
+    entries of the affected build are touched. Checksums are indexed as raw
+    bytes, which are shared with build infos loaded in compact mode.
+
+    A build is identified by a key, which is its name and number unless
+    specified otherwise.
+    """
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._builds: dict[_BuildKey, BuildInfo] = {}
+        self._checksums: dict[_Digest, _Postings] = {}
+        self._dependency_ids: dict[str, _Postings] = {}
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of indexed builds.
+
+        """
+        return len(self._builds)
+
+    def __contains__(self, key: object) -> bool:
+        """
+
+        Args:
+            key (object): The key of a build.
+
+        Returns:
+            bool:
+
+        """
+        return key in self._builds
+
+    def __iter__(self) -> Iterator[_BuildKey]:
+        """
+
+        Returns:
+            Iterator[_BuildKey]: The keys of the indexed builds.
+
+        """
+        return iter(self._builds)
+
+    def get(self, key: _BuildKey) -> BuildInfo | None:
+        """
+
+        Args:
+            key (_BuildKey): The key of the build.
+
+        Returns:
+            BuildInfo | None: The indexed build.
+
+        """
+        return self._builds.get(key)
+
+    def add(self, bi: BuildInfo, key: _BuildKey | None = None) -> _BuildKey:
+        """
+        Indexes the artifacts and dependencies of a build. A build indexed
+        with the same key before is replaced.
+
+        Args:
+            bi (BuildInfo): The build to index.
+            key (_BuildKey | None): The key to identify the build by. If
+                None, the name and number of the build are used.
+
+        Returns:
+            _BuildKey: The key of the build.
+
+        """
+        if key is None:
+            key = (bi.name, bi.number)
+        self.remove(key)
+        self._builds[key] = bi
+
+        for module in bi.modules or ():
+            for artifact in module.artifacts or ():
+                posting = IndexEntry(key, module, artifact)
+                for checksum in _checksums_of(artifact):
+                    _post(self._checksums, checksum, posting)
+            for dependency in module.dependencies or ():
+                posting = IndexEntry(key, module, dependency)
+                for checksum in _checksums_of(dependency):
+                    _post(self._checksums, checksum, posting)
+                if dependency.id is not None:
+                    _post(self._dependency_ids, dependency.id, posting)
+        return key
+
+    def remove(self, key: _BuildKey) -> bool:
+        """
+        Removes a build from the index.
+
+        Args:
+            key (_BuildKey): The key of the build.
+
+        Returns:
+            bool: True, if the build has been indexed.
+
+        """
+        bi: BuildInfo | None = self._builds.pop(key, None)
+        if bi is None:
+            return False
+
+        for module in bi.modules or ():
+            for artifact in module.artifacts or ():
+                for checksum in _checksums_of(artifact):
+                    _unpost(self._checksums, checksum, key)
+            for dependency in module.dependencies or ():
+                for checksum in _checksums_of(dependency):
+                    _unpost(self._checksums, checksum, key)
+                if dependency.id is not None:
+                    _unpost(self._dependency_ids, dependency.id, key)
+        return True
+
+    def find_checksum(self, checksum: _Digest) -> list[IndexEntry]:
+        """
+        Finds the artifacts and dependencies having the specified SHA-256,
+        SHA-1 or MD5 digest.
+
+        Args:
+            checksum (bytes | str): The hexadecimal or raw digest.
+
+        Returns:
+            list[IndexEntry]: The entries in the order the builds have been
+                added.
+
+        """
+        return _collect(self._checksums, digest_to_bytes(checksum))
+
+    def find_dependency(self, dependency_id: str) -> list[IndexEntry]:
+        """
+        Finds the dependencies having the specified id.
+
+        Args:
+            dependency_id (str): The id of the dependency.
+
+        Returns:
+            list[IndexEntry]: The entries in the order the builds have been
+                added.
+
+        """
+        return _collect(self._dependency_ids, dependency_id)
+
+    def builds_with_checksum(self, checksum: _Digest) -> list[_BuildKey]:
+        """
+
+        Args:
+            checksum (bytes | str): The hexadecimal or raw digest.
+
+        Returns:
+            list[_BuildKey]: The keys of the builds containing an artifact
+                or dependency with the digest.
+
+        """
+        return list(self._checksums.get(digest_to_bytes(checksum), {}))
+
+    def builds_with_dependency(self, dependency_id: str) -> list[_BuildKey]:
+        """
+
+        Args:
+            dependency_id (str): The id of the dependency.
+
+        Returns:
+            list[_BuildKey]: The keys of the builds using the dependency.
+
+        """
+        return list(self._dependency_ids.get(dependency_id, {}))
+
+    def memory_usage(self) -> int:
+        """
+        Determines the memory used by the index itself, not including the
+        indexed builds and the ids shared with them. The raw digests are
+        counted, even if they are shared with compact build infos.
+
+        Returns:
+            int: The approximate size in bytes.
+
+        """
+        size: int = getsizeof(self._builds)
+        size += sum(getsizeof(c) for c in self._checksums)
+        for mapping in (self._checksums, self._dependency_ids):
+            size += getsizeof(mapping)
+            for postings in mapping.values():
+                size += getsizeof(postings)
+                for entries in postings.values():
+                    size += getsizeof(entries)
+                    size += sum(getsizeof(e) for e in entries)
+        return size
+
+
+def _checksums_of(entry: Artifact | Dependency) -> set[_Digest]:
+    """
+
+    Args:
+        entry (Artifact | Dependency):
+
+    Returns:
+        set[bytes | str]: The distinct raw digests of the entry.
+
+    """
+    return {digest_to_bytes(c) for c in raw_digests(entry) if c is not None}
+
+
+def _post(
+    mapping: dict[Any, _Postings], value: _Digest, posting: IndexEntry
+) -> None:
+    """
+
+    Args:
+        mapping (dict[Any, _Postings]):
+        value (bytes | str):
+        posting (IndexEntry):
+
+    Returns:
+        None:
+
+    """
+    mapping.setdefault(value, {}).setdefault(posting.build, []).append(posting)
+
+
+def _unpost(
+    mapping: dict[Any, _Postings], value: _Digest, key: _BuildKey
+) -> None:
+    """
+
+    Args:
+        mapping (dict[Any, _Postings]):
+        value (bytes | str):
+        key (_BuildKey):
+
+    Returns:
+        None:
+
+    """
+    postings: _Postings | None = mapping.get(value)
+    if postings is None:
+        return
+    postings.pop(key, None)
+    if len(postings) == 0:
+        del mapping[value]
+
+
+def _collect(
+    mapping: dict[Any, _Postings], value: _Digest
+) -> list[IndexEntry]:
+    """
+
+    Args:
+        mapping (dict[Any, _Postings]):
+        value (bytes | str):
+
+    Returns:
+        list[IndexEntry]: The entries of all builds.
+
+    """
+    return [e for entries in mapping.get(value, {}).values() for e in entries]
@@ -0,0 +1,343 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from types import TracebackType
+from typing import Iterator
+
+_observers: tuple["Observer", ...] = ()
+_observers_lock = Lock()
+_DISABLED_PHASE: AbstractContextManager[None] = nullcontext()
+
+
+class Observer:
+    """
+    Receives the events of the instrumented operations. The default
+    implementation ignores all events, so subclasses only need to override
+    the events they are interested in.
+
+    Observers are invoked from the thread running the operation, so they
+    must be thread-safe, if operations are run concurrently.
+    """
+
+    def phase_started(self, name: str) -> None:
+        """
+        Invoked when a phase of an operation starts.
+
+        Args:
+            name (str): The name of the phase, e.g. load.parse.
+
+        Returns:
+            None:
+
+        """
+
+    def phase_finished(self, name: str, duration: float) -> None:
+        """
+        Invoked when a phase of an operation has finished.
+
+        Args:
+            name (str): The name of the phase, e.g. load.parse.
+            duration (float): The duration of the phase in seconds.
+
+        Returns:
+            None:
+
+        """
+
+    def counted(self, name: str, amount: int) -> None:
+        """
+        Invoked when a counter is increased.
+
+        Args:
+            name (str): The name of the counter, e.g. bytes.read.
+            amount (int): The amount the counter is increased by.
+
+        Returns:
+            None:
+
+        """
+
+
+def add_observer(observer: Observer) -> None:
+    """
+    Registers an observer for the events of all threads.
+
+    Args:
+        observer (Observer): The observer to add.
+
+    Returns:
+        None:
+
+    """
+    global _observers  # pylint: disable=W0603
+    with _observers_lock:
+        _observers = (*_observers, observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """
+    Unregisters an observer. Unknown observers are ignored.
+
+    Args:
+        observer (Observer): The observer to remove.
+
+    Returns:
+        None:
+
+    """
+    global _observers  # pylint: disable=W0603
+    with _observers_lock:
+        _observers = tuple(o for o in _observers if o is not observer)
+
+
+@contextmanager
+def observe(*observers: Observer) -> Iterator[None]:
+    """
+    Registers the observers while the context is active.
+
+    Args:
+        observers (tuple[Observer, ...]): The observers to add.
+
+    Returns:
+        Iterator[None]:
+
+    """
+    for observer in observers:
+        add_observer(observer)
+    try:
+        yield
+    finally:
+        for observer in observers:
+            remove_observer(observer)
+
+
+class _Phase:
+    """
+    Reports the start and end of a phase to the observers registered when
+    the phase has been created.
+    """
+
+    __slots__ = ("_name", "_observers", "_start")
+
+    def __init__(self, name: str, observers: tuple[Observer, ...]) -> None:
+        """
+
+        Args:
+            name (str):
+            observers (tuple[Observer, ...]):
+
+        Returns:
+            None:
+
+        """
+        self._name: str = name
+        self._observers: tuple[Observer, ...] = observers
+        self._start: float = 0.0
+
+    def __enter__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        for observer in self._observers:
+            observer.phase_started(self._name)
+        self._start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+
+        Args:
+            exc_type (type[BaseException] | None):
+            exc_value (BaseException | None):
+            traceback (TracebackType | None):
+
+        Returns:
+            None:
+
+        """
+        duration: float = perf_counter() - self._start
+        for observer in self._observers:
+            observer.phase_finished(self._name, duration)
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """
+    Creates a context reporting a phase to the registered observers. If no
+    observer is registered, a shared context doing nothing is returned.
+
+    Args:
+        name (str): The name of the phase.
+
+    Returns:
+        AbstractContextManager[None]:
+
+    """
+    observers: tuple[Observer, ...] = _observers
+    if len(observers) == 0:
+        return _DISABLED_PHASE
+    return _Phase(name, observers)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """
+    Increases a counter of the registered observers.
+
+    Args:
+        name (str): The name of the counter.
+        amount (int): The amount to add.
+
+    Returns:
+        None:
+
+    """
+    for observer in _observers:
+        observer.counted(name, amount)
+
+
+@dataclass
+class PhaseStatistics:
+    """
+    The accumulated durations of a phase.
+    """
+
+    calls: int = 0
+    """The number of times the phase has been run"""
+    total: float = 0.0
+    """The sum of all durations in seconds"""
+    maximum: float = 0.0
+    """The longest duration in seconds"""
+
+
+class Recorder(Observer):
+    """
+    Accumulates the durations of all phases and the values of all counters.
+    Used as context manager, the recorder registers itself while the
+    context is active.
+    """
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self.phases: dict[str, PhaseStatistics] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = Lock()
+
+    def phase_finished(self, name: str, duration: float) -> None:
+        """
+
+        Args:
+            name (str):
+            duration (float):
+
+        Returns:
+            None:
+
+        """
+        with self._lock:
+            statistics: PhaseStatistics = self.phases.setdefault(
+                name, PhaseStatistics()
+            )
+            statistics.calls += 1
+            statistics.total += duration
+            statistics.maximum = max(statistics.maximum, duration)
+
+    def counted(self, name: str, amount: int) -> None:
+        """
+
+        Args:
+            name (str):
+            amount (int):
+
+        Returns:
+            None:
+
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def __enter__(self) -> "Recorder":
+        """
+
+        Returns:
+            Recorder: The instance itself.
+
+        """
+        add_observer(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+
+        Args:
+            exc_type (type[BaseException] | None):
+            exc_value (BaseException | None):
+            traceback (TracebackType | None):
+
+        Returns:
+            None:
+
+        """
+        remove_observer(self)
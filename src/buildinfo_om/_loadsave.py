@@ -45,65 +45,83 @@
 """
 from collections.abc import Sequence
 from dataclasses import asdict
+from hashlib import sha256
 from json import dumps, loads
 from os import PathLike
 from typing import Any, Mapping, TextIO, cast, AnyStr, IO
 
 from dacite import Config, from_dict  # type: ignore
 
+from ._compact import compact_digests
+from ._instrument import count, phase
 from ._vcs import BuildInfo
 
 
-def load_from_file(path: PathLike) -> BuildInfo:
+def load_from_file(path: PathLike, compact: bool = False) -> BuildInfo:
     """
 
     Args:
         path (PathLike):
+        compact (bool): Whether to store the digests as raw bytes, see
+            compact_digests.
 
     Returns:
         BuildInfo:
 
     """
-    with open(path, "r", encoding="utf-8") as buffer:
-        return load_from_buffer(buffer)
+    with phase("load"), open(path, "r", encoding="utf-8") as buffer:
+        return load_from_buffer(buffer, compact)
 
 
-def load_from_buffer(buf: TextIO) -> BuildInfo:
+def load_from_buffer(buf: TextIO, compact: bool = False) -> BuildInfo:
     """
 
     Args:
         buf (TextIO):
+        compact (bool): Whether to store the digests as raw bytes, see
+            compact_digests.
 
     Returns:
         BuildInfo:
 
     """
-    data: str | bytes = buf.read()
-    return load_from_str(data)
+    with phase("load.read"):
+        data: str | bytes = buf.read()
+    count("bytes.read", len(data))
+    return load_from_str(data, compact)
 
 
-def load_from_str(value: str | bytes | bytearray) -> BuildInfo:
+def load_from_str(
+    value: str | bytes | bytearray, compact: bool = False
+) -> BuildInfo:
     """
 
     Args:
         value (str | bytes | bytearray):
+        compact (bool): Whether to store the digests as raw bytes, see
+            compact_digests.
 
     Returns:
         BuildInfo:
 
     """
-    data: Any = loads(value)
+    with phase("load.parse"):
+        data: Any = loads(value)
     transformable_data: Mapping[str, Any] = (
         cast(dict, data) if isinstance(data, dict) else vars(data)
     )
-    return load_from_dict(transformable_data)
+    return load_from_dict(transformable_data, compact)
 
 
-def load_from_dict(data: Mapping[str, Any]) -> BuildInfo:
+def load_from_dict(
+    data: Mapping[str, Any], compact: bool = False
+) -> BuildInfo:
     """
 
     Args:
         data (Mapping[str, Any]):
+        compact (bool): Whether to store the digests as raw bytes, see
+            compact_digests.
 
     Returns:
         BuildInfo:
@@ -114,7 +132,13 @@ def load_from_dict(data: Mapping[str, Any]) -> BuildInfo:
     cfg.strict = True
     cfg.strict_unions_match = True
 
-    return from_dict(BuildInfo, data, cfg)
+    with phase("load.convert"):
+        result: BuildInfo = from_dict(BuildInfo, data, cfg)
+    if compact:
+        with phase("load.compact"):
+            result = compact_digests(result)
+    count("modules.loaded", len(result.modules or ()))
+    return result
 
 
 def save_to_file(bi: BuildInfo, path: PathLike) -> None:
@@ -128,7 +152,7 @@ def save_to_file(bi: BuildInfo, path: PathLike) -> None:
         None:
 
     """
-    with open(path, "w+", encoding="utf-8") as buffer:
+    with phase("save"), open(path, "w+", encoding="utf-8") as buffer:
         save_to_buffer(bi, buffer)
 
 
@@ -144,7 +168,9 @@ def save_to_text_buffer(bi: BuildInfo, buffer: TextIO) -> None:
 
     """
     data: str = transform_to_str(bi)
-    buffer.write(data)
+    with phase("save.write"):
+        buffer.write(data)
+    count("bytes.written", len(data))
 
 
 def save_to_buffer(bi: BuildInfo, buffer: IO[AnyStr]) -> None:
@@ -159,7 +185,9 @@ def save_to_buffer(bi: BuildInfo, buffer: IO[AnyStr]) -> None:
 
     """
     data: str = transform_to_str(bi)
-    buffer.write(data)
+    with phase("save.write"):
+        buffer.write(data)
+    count("bytes.written", len(data))
 
 
 def transform_to_str(bi: BuildInfo) -> str:
@@ -173,7 +201,8 @@ def transform_to_str(bi: BuildInfo) -> str:
 
     """
     data: Mapping[str, Any] = transform_to_mapping(bi)
-    return dumps(data)
+    with phase("save.serialize"):
+        return dumps(data)
 
 
 def _remove_empty_values(data: Mapping[str, Any]) -> Mapping[str, Any]:
@@ -200,6 +229,26 @@ def transform_to_mapping(bi: BuildInfo) -> Mapping[str, Any]:
         Mapping[str, Any]:
 
     """
-    data: Mapping[str, Any] = asdict(bi)
-    _remove_empty_values(data)
+    with phase("save.asdict"):
+        data: Mapping[str, Any] = asdict(bi)
+    with phase("save.prune"):
+        _remove_empty_values(data)
     return data
+
+
+def fingerprint_build_info(bi: BuildInfo) -> str:
+    """
+    Calculates a fingerprint of the content of the build info. Two build
+    infos have the same fingerprint, if they are saved to the same
+    document regardless of the order of their properties.
+
+    Args:
+        bi (BuildInfo):
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the canonical document.
+
+    """
+    data: Mapping[str, Any] = transform_to_mapping(bi)
+    canonical: str = dumps(data, sort_keys=True, separators=(",", ":"))
+    return sha256(canonical.encode("utf-8")).hexdigest()
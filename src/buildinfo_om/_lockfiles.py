@@ -0,0 +1,465 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from os import PathLike
+from re import compile as _compile_regex
+from tomllib import load as _load_toml
+from typing import Any, Iterable, Iterator
+
+from ._model import Dependency
+
+_NAME_PATTERN = _compile_regex(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_SEPARATOR_PATTERN = _compile_regex(r"[-_.]+")
+_PINNED_PATTERN = _compile_regex(
+    r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)[^=;]*==\s*([^\s;\\]+)"
+)
+_HASH_PATTERN = _compile_regex(r"--hash[=\s]+(\w+):(\w+)")
+
+_Chains = tuple[tuple[str, ...], ...]
+_MAX_CHAINS: int = 64
+
+
+def _normalize_name(name: str) -> str:
+    """
+    Normalizes a python package name as specified by PEP 503.
+
+    Args:
+        name (str):
+
+    Returns:
+        str:
+
+    """
+    return _SEPARATOR_PATTERN.sub("-", name).lower()
+
+
+def _requirement_name(requirement: str) -> str | None:
+    """
+
+    Args:
+        requirement (str): A PEP 508 requirement.
+
+    Returns:
+        str | None: The normalized name of the required package.
+
+    """
+    match = _NAME_PATTERN.match(requirement)
+    return None if match is None else _normalize_name(match.group(1))
+
+
+def _file_type(file_name: str) -> str | None:
+    """
+
+    Args:
+        file_name (str):
+
+    Returns:
+        str | None: The type of the distribution file.
+
+    """
+    for suffix in ("whl", "tar.gz", "zip", "tar.bz2", "egg"):
+        if file_name.endswith(f".{suffix}"):
+            return suffix
+    return None
+
+
+@dataclass
+class _Package:
+    """
+    A package found in a lock file.
+    """
+
+    id: str
+    """The id of the resulting dependency"""
+    type: str | None = None
+    """The type of the resulting dependency"""
+    sha256: str | None = None
+    """The SHA-256 digest of the distribution file"""
+    scopes: tuple[str, ...] | None = None
+    """The groups the package is part of"""
+    requires: set[str] = field(default_factory=set)
+    """The normalized names of the packages required by this package"""
+    direct: bool = False
+    """Whether the package is required by the module itself"""
+
+
+class _DependencyGraph:
+    """
+    Collects the packages of a lock file and creates the dependencies with
+    their requesting chains from it. Equal scopes and chains are shared by
+    all dependencies instead of being copied for each of them.
+    """
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._packages: dict[str, _Package] = {}
+        self._scopes: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def add(self, name: str, package: _Package) -> _Package:
+        """
+        Adds a package. If a package of the same name is known, the
+        requirements of the new package are added to it.
+
+        Args:
+            name (str): The normalized name of the package.
+            package (_Package): The package.
+
+        Returns:
+            _Package: The package stored in the graph.
+
+        """
+        known: _Package | None = self._packages.get(name)
+        if known is not None:
+            known.requires.update(package.requires)
+            return known
+
+        if package.scopes is not None:
+            package.scopes = self._scopes.setdefault(
+                package.scopes, package.scopes
+            )
+        self._packages[name] = package
+        return package
+
+    def requires(self, name: str, required_name: str) -> None:
+        """
+
+        Args:
+            name (str): The normalized name of the requesting package.
+            required_name (str): The normalized name of the required one.
+
+        Returns:
+            None:
+
+        """
+        package: _Package | None = self._packages.get(name)
+        if package is not None:
+            package.requires.add(required_name)
+
+    def requires_directly(self, name: str) -> None:
+        """
+
+        Args:
+            name (str): The normalized name of the package required by the
+                module itself.
+
+        Returns:
+            None:
+
+        """
+        package: _Package | None = self._packages.get(name)
+        if package is not None:
+            package.direct = True
+
+    def _parents(self) -> dict[str, list[str]]:
+        """
+        Determines the requesting packages of every package. To ensure that
+        all chains are finite, the edges are restricted to those leading
+        from a package to a package first reached one level deeper from the
+        top-level packages.
+
+        Returns:
+            dict[str, list[str]]: The names of the requesting packages.
+
+        """
+        children: dict[str, list[str]] = {
+            name: sorted(
+                r
+                for r in package.requires
+                if r in self._packages and r != name
+            )
+            for name, package in self._packages.items()
+        }
+        required: set[str] = {r for c in children.values() for r in c}
+        depths: dict[str, int] = {}
+        pending: deque[str] = deque()
+        for name in self._packages:
+            if name not in required:
+                depths[name] = 0
+                pending.append(name)
+        for name in self._packages:
+            if len(pending) == 0 and name not in depths:
+                # every remaining package is part of a cycle
+                depths[name] = 0
+                pending.append(name)
+            while len(pending) > 0:
+                current: str = pending.popleft()
+                for child in children[current]:
+                    if child not in depths:
+                        depths[child] = depths[current] + 1
+                        pending.append(child)
+
+        parents: dict[str, list[str]] = {name: [] for name in self._packages}
+        for name, required_names in children.items():
+            for child in required_names:
+                if depths[name] < depths[child]:
+                    parents[child].append(name)
+        return parents
+
+    def dependencies(self, root_id: str | None = None) -> list[Dependency]:
+        """
+        Creates the dependencies of all packages. The chains of every
+        package are computed once and shared by all packages requested by
+        it. As the number of chains grows exponentially with the number of
+        diamonds in the graph, at most 64 chains are kept per dependency.
+
+        Args:
+            root_id (str | None): The id to end every requesting chain with,
+                usually the id of the module.
+
+        Returns:
+            list[Dependency]:
+
+        """
+        parents: dict[str, list[str]] = self._parents()
+        # a chain ending with the module, empty if the module has no id
+        root: tuple[str, ...] = () if root_id is None else (root_id,)
+        chains: dict[str, _Chains] = {}
+        shared: dict[_Chains, _Chains] = {}
+
+        def chains_of(name: str) -> _Chains:
+            known: _Chains | None = chains.get(name)
+            if known is not None:
+                return known
+            package: _Package = self._packages[name]
+            collected: list[tuple[str, ...]] = []
+            if package.direct or len(parents[name]) == 0:
+                collected.append(root)
+            for parent in parents[name]:
+                parent_id: str = self._packages[parent].id
+                for chain in chains_of(parent):
+                    if len(collected) == _MAX_CHAINS:
+                        break
+                    collected.append((parent_id, *chain))
+            result: _Chains = tuple(collected)
+            result = shared.setdefault(result, result)
+            chains[name] = result
+            return result
+
+        def requested_by(name: str) -> _Chains | None:
+            result: _Chains = chains_of(name)
+            if root_id is None:
+                result = tuple(c for c in result if len(c) > 0)
+                result = shared.setdefault(result, result)
+            return result if len(result) > 0 else None
+
+        return [
+            Dependency(
+                type=package.type,
+                id=package.id,
+                sha256=package.sha256,
+                scopes=package.scopes,
+                requestedBy=requested_by(name),
+            )
+            for name, package in self._packages.items()
+        ]
+
+
+def dependencies_from_pdm_lock(
+    path: str | PathLike, root_id: str | None = None
+) -> list[Dependency]:
+    """
+    Creates the dependencies of all packages listed in a pdm.lock file.
+
+    The id of a dependency is name:version, the scopes are the groups of
+    the package. Type and SHA-256 digest are taken from the first
+    distribution file listed for the package. The requesting chains are
+    derived from the requirements of the packages.
+
+    Args:
+        path (str | PathLike): The lock file to read.
+        root_id (str | None): The id to end every requesting chain with,
+            usually the id of the module.
+
+    Returns:
+        list[Dependency]: The dependencies in the order of the lock file.
+
+    """
+    with open(path, "rb") as file:
+        data: dict[str, Any] = _load_toml(file)
+
+    graph = _DependencyGraph()
+    for entry in data.get("package", []):
+        name: str = _normalize_name(entry["name"])
+        requires: set[str] = set()
+        for requirement in entry.get("dependencies", []):
+            required_name: str | None = _requirement_name(requirement)
+            if required_name is not None and required_name != name:
+                requires.add(required_name)
+
+        files: list[dict[str, str]] = entry.get("files", [])
+        algorithm, _, digest = (
+            files[0].get("hash", "").partition(":") if files else ("", "", "")
+        )
+        graph.add(
+            name,
+            _Package(
+                id=f"{entry['name']}:{entry['version']}",
+                type=_file_type(files[0]["file"]) if files else None,
+                sha256=digest if algorithm == "sha256" else None,
+                scopes=tuple(entry["groups"]) if "groups" in entry else None,
+                requires=requires,
+            ),
+        )
+
+    return graph.dependencies(root_id)
+
+
+def _logical_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Joins lines continued by a trailing backslash.
+
+    Args:
+        lines (Iterable[str]):
+
+    Returns:
+        Iterator[str]:
+
+    """
+    pending: list[str] = []
+    for line in lines:
+        stripped: str = line.rstrip("\r\n")
+        if stripped.endswith("\\"):
+            pending.append(stripped[:-1])
+            continue
+        pending.append(stripped)
+        yield " ".join(pending)
+        pending.clear()
+    if len(pending) > 0:
+        yield " ".join(pending)
+
+
+def dependencies_from_requirements(
+    path: str | PathLike,
+    root_id: str | None = None,
+    scopes: Iterable[str] | None = None,
+) -> list[Dependency]:
+    """
+    Creates the dependencies of all pinned requirements of a requirements
+    file, as created by pip-compile or pip freeze. The file is read line by
+    line.
+
+    The id of a dependency is name:version, the SHA-256 digest is the first
+    one specified by --hash. If the file contains the "# via" annotations
+    of pip-compile, the requesting chains are derived from them.
+
+    Args:
+        path (str | PathLike): The requirements file to read.
+        root_id (str | None): The id to end every requesting chain with,
+            usually the id of the module.
+        scopes (Iterable[str] | None): The scopes to assign to all
+            dependencies.
+
+    Returns:
+        list[Dependency]: The dependencies in the order of the file.
+
+    """
+    shared_scopes: tuple[str, ...] | None = (
+        None if scopes is None else tuple(scopes)
+    )
+    graph = _DependencyGraph()
+    via: list[tuple[str, str]] = []
+    current: str | None = None
+    in_via_list: bool = False
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in _logical_lines(file):
+            stripped: str = line.strip()
+            if stripped.startswith("#"):
+                comment: str = stripped[1:].strip()
+                if current is None:
+                    continue
+                if comment.startswith("via"):
+                    names: str = comment[3:].strip()
+                    in_via_list = len(names) == 0
+                    if len(names) > 0:
+                        via.append((names, current))
+                elif in_via_list:
+                    via.append((comment, current))
+                continue
+
+            in_via_list = False
+            match = _PINNED_PATTERN.match(stripped)
+            if match is None:
+                current = None
+                continue
+
+            name: str = _normalize_name(match.group(1))
+            digest: str | None = next(
+                (
+                    h.group(2)
+                    for h in _HASH_PATTERN.finditer(stripped)
+                    if h.group(1) == "sha256"
+                ),
+                None,
+            )
+            graph.add(
+                name,
+                _Package(
+                    id=f"{match.group(1)}:{match.group(2)}",
+                    sha256=digest,
+                    scopes=shared_scopes,
+                ),
+            )
+            current = name
+
+    for requesting, name in via:
+        # entries like "-r requirements.in" denote top-level requirements
+        if requesting.startswith("-"):
+            graph.requires_directly(name)
+            continue
+        for requester in requesting.split(","):
+            requester_name: str | None = _requirement_name(requester)
+            if requester_name is not None:
+                graph.requires(requester_name, name)
+
+    return graph.dependencies(root_id)
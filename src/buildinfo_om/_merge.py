@@ -44,13 +44,34 @@
 """
 """
 
-
+from dataclasses import asdict, replace
 from datetime import datetime, timedelta
 from enum import IntEnum, auto
-from os import pathsep
-from typing import Mapping, Sequence, TypeVar
-
-from ._model import AffectedIssue, Agent, BuildAgent, Issues, Module
+from heapq import merge as _merge_sorted
+from itertools import groupby
+from json import dumps, loads
+from os import PathLike, pathsep
+from os.path import join as _join_path
+from tempfile import TemporaryDirectory
+from typing import Any, Iterable, Iterator, Mapping, Sequence, TypeVar
+
+from ._compact import (
+    DIGEST_FIELDS,
+    CompactArtifact,
+    CompactDependency,
+    digest_to_bytes,
+    raw_digests,
+)
+from ._instrument import count, phase
+from ._model import (
+    AffectedIssue,
+    Agent,
+    Artifact,
+    BuildAgent,
+    Dependency,
+    Issues,
+    Module,
+)
 from ._vcs import VCS, BuildInfo
 
 
@@ -105,8 +126,34 @@ def merge_build_info(
 
     """
 
-    filtered_items = _verify_builds(different_data, *items)
+    with phase("merge"):
+        with phase("merge.verify"):
+            filtered_items = _verify_builds(different_data, *items)
+        with phase("merge.headers"):
+            result: BuildInfo = _merge_headers(
+                different_props, *filtered_items
+            )
+        with phase("merge.modules"):
+            result.modules = _combine_modules(*filtered_items)
+    count("modules.merged", len(result.modules or ()))
+
+    return result
+
+
+def _merge_headers(
+    different_props: NonSameSetsOfProperties, *filtered_items: BuildInfo
+) -> BuildInfo:
+    """
+    Merges everything except the modules of the already filtered items.
+
+    Args:
+        different_props (NonSameSetsOfProperties):
+        filtered_items (tuple[BuildInfo, ...]):
+
+    Returns:
+        BuildInfo:
 
+    """
     result: BuildInfo = BuildInfo()
 
     result.name = _select_name(*filtered_items)
@@ -118,7 +165,6 @@ def merge_build_info(
     result.started, result.durationMillis = _sum_up_build_duration(
         *filtered_items
     )
-    result.modules = _combine_modules(*filtered_items)
     result.url = _select_url(*filtered_items)
     result.type = _select_type(*filtered_items)
     result.issues = _combine_issues(*filtered_items)
@@ -164,26 +210,6 @@ def __unique_or_combined(*items: _T, separator: str = ", ") -> str | None:
     return separator.join({str(i) for i in items})
 
 
-def __combine_sequence(*items: Sequence[_T]) -> Sequence[_T] | None:
-    """
-
-    Args:
-        items (tuple[Sequence[_T], ...]):
-
-    Returns:
-        Sequence[_T] | None:
-
-    """
-    if len(items) == 0:
-        return None
-
-    new_items: set[_T] = set()
-    for item in items:
-        new_items = new_items.union(item)
-
-    return list(new_items)
-
-
 def _select_name(*items: BuildInfo) -> str | None:
     """
 
@@ -239,9 +265,28 @@ def _select_vcs(*items: BuildInfo) -> Sequence[VCS] | None:
         Sequence[VCS] | None:
 
     """
-    return __combine_sequence(
-        *tuple(b.vcs for b in items if b.vcs is not None)
+    vcs_lists: tuple[Sequence[VCS], ...] = tuple(
+        b.vcs for b in items if b.vcs is not None
     )
+    if len(vcs_lists) == 0:
+        return None
+
+    combined: dict[tuple[str | None, str | None, str | None], VCS] = {}
+    for vcs_list in vcs_lists:
+        for vcs in vcs_list:
+            key = (vcs.url, vcs.revision, vcs.branch)
+            existing: VCS | None = combined.get(key)
+            if existing is None:
+                combined[key] = vcs
+            elif existing.message is None and vcs.message is not None:
+                combined[key] = VCS(
+                    url=existing.url,
+                    branch=existing.branch,
+                    revision=existing.revision,
+                    message=vcs.message,
+                )
+
+    return list(combined.values())
 
 
 def _unify_build_agent(*items: BuildInfo) -> BuildAgent | None:
@@ -294,6 +339,9 @@ def _unify_agent(*items: BuildInfo) -> Agent | None:
 
 def _combine_modules(*items: BuildInfo) -> Sequence[Module] | None:
     """
+    Combines the modules of all items. Modules sharing the same id are
+    merged into a single module, their artifacts and dependencies are
+    merged by their identity keys. The order of first appearance is kept.
 
     Args:
         items (tuple[BuildInfo, ...]):
@@ -302,12 +350,315 @@ def _combine_modules(*items: BuildInfo) -> Sequence[Module] | None:
         Sequence[Module] | None:
 
     """
-    # TODO merge module inner values
-    return __combine_sequence(
-        *tuple(b.modules for b in items if b.modules is not None)
+    module_lists: tuple[Sequence[Module], ...] = tuple(
+        b.modules for b in items if b.modules is not None
+    )
+    if len(module_lists) == 0:
+        return None
+
+    combiners: dict[object, _ModuleCombiner] = {}
+    for modules in module_lists:
+        for module in modules:
+            key: object = _module_key(module)
+            if key is None:
+                key = object()
+            if key not in combiners:
+                combiners[key] = _ModuleCombiner(module)
+            combiners[key].add(module)
+
+    return [combiner.build() for combiner in combiners.values()]
+
+
+_ArtifactKey = tuple[str | None, str | None, str | None]
+_DependencyKey = tuple[str | bytes | None, ...]
+
+
+def _module_key(module: Module) -> str | None:
+    """
+    Returns the identity of a module used to detect equal modules.
+
+    Args:
+        module (Module):
+
+    Returns:
+        str | None: The key or None, if the module cannot be identified.
+
+    """
+    return module.id
+
+
+def _artifact_key(artifact: Artifact) -> _ArtifactKey:
+    """
+    Returns the identity of an artifact within its module.
+
+    Args:
+        artifact (Artifact):
+
+    Returns:
+        _ArtifactKey:
+
+    """
+    return artifact.type, artifact.name, artifact.path
+
+
+def _dependency_key(dependency: Dependency) -> _DependencyKey:
+    """
+    Returns the identity of a dependency within its module. Dependencies
+    without id are identified by their checksums, compared as raw bytes.
+
+    Args:
+        dependency (Dependency):
+
+    Returns:
+        _DependencyKey:
+
+    """
+    if dependency.id is not None:
+        return (dependency.id,)
+    return (
+        None,
+        dependency.type,
+        *(digest_to_bytes(d) for d in raw_digests(dependency)),
+    )
+
+
+def _first_set(first: _T | None, other: _T | None) -> _T | None:
+    """
+
+    Args:
+        first (_T | None):
+        other (_T | None):
+
+    Returns:
+        _T | None:
+
+    """
+    return first if first is not None else other
+
+
+def _combine_digests(
+    first: Artifact | Dependency, other: Artifact | Dependency
+) -> dict[str, Any]:
+    """
+    Combines the digests as stored, so raw digests of compact artifacts
+    and dependencies are not converted.
+
+    Args:
+        first (Artifact | Dependency):
+        other (Artifact | Dependency):
+
+    Returns:
+        dict[str, Any]: The digests by field name.
+
+    """
+    return {
+        name: _first_set(mine, theirs)
+        for name, mine, theirs in zip(
+            DIGEST_FIELDS, raw_digests(first), raw_digests(other)
+        )
+    }
+
+
+def _combine_artifact(first: Artifact, other: Artifact) -> Artifact:
+    """
+    Combines two artifacts with the same key. Values of the first artifact
+    take precedence.
+
+    Args:
+        first (Artifact):
+        other (Artifact):
+
+    Returns:
+        Artifact:
+
+    """
+    artifact_type: type[Artifact] = (
+        CompactArtifact
+        if isinstance(first, CompactArtifact)
+        or isinstance(other, CompactArtifact)
+        else Artifact
+    )
+    return artifact_type(
+        type=_first_set(first.type, other.type),
+        name=_first_set(first.name, other.name),
+        path=_first_set(first.path, other.path),
+        **_combine_digests(first, other),
     )
 
 
+def _combine_dependency(first: Dependency, other: Dependency) -> Dependency:
+    """
+    Combines two dependencies with the same key. Scalar values of the first
+    dependency take precedence, scopes and requesting chains are joined.
+
+    Args:
+        first (Dependency):
+        other (Dependency):
+
+    Returns:
+        Dependency:
+
+    """
+    scopes: list[str] | None = None
+    if first.scopes is not None or other.scopes is not None:
+        scopes = list(
+            dict.fromkeys((*(first.scopes or ()), *(other.scopes or ())))
+        )
+
+    requested_by: list[list[str]] | None = None
+    if first.requestedBy is not None or other.requestedBy is not None:
+        chains: dict[tuple[str, ...], None] = dict.fromkeys(
+            tuple(chain)
+            for chain in (
+                *(first.requestedBy or ()),
+                *(other.requestedBy or ()),
+            )
+        )
+        requested_by = [list(chain) for chain in chains]
+
+    dependency_type: type[Dependency] = (
+        CompactDependency
+        if isinstance(first, CompactDependency)
+        or isinstance(other, CompactDependency)
+        else Dependency
+    )
+    return dependency_type(
+        type=_first_set(first.type, other.type),
+        id=_first_set(first.id, other.id),
+        **_combine_digests(first, other),
+        scopes=scopes,
+        requestedBy=requested_by,
+    )
+
+
+class _ModuleHeader:
+    """
+    Accumulates the scalar values and properties of modules sharing the
+    same key.
+    """
+
+    def __init__(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module): The first module of this key.
+
+        Returns:
+            None:
+
+        """
+        self.id: str | None = module.id
+        self.type: str | None = None
+        self.properties: dict[str, str] | None = None
+        self.has_artifacts: bool = False
+        self.has_dependencies: bool = False
+
+    def add(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module):
+
+        Returns:
+            None:
+
+        """
+        self.type = _first_set(self.type, module.type)
+        if module.properties is not None:
+            if self.properties is None:
+                self.properties = {}
+            for key, value in module.properties.items():
+                self.properties.setdefault(key, value)
+        self.has_artifacts = self.has_artifacts or module.artifacts is not None
+        self.has_dependencies = (
+            self.has_dependencies or module.dependencies is not None
+        )
+
+    def build_with(
+        self,
+        artifacts: Sequence[Artifact],
+        dependencies: Sequence[Dependency],
+    ) -> Module:
+        """
+
+        Args:
+            artifacts (Sequence[Artifact]):
+            dependencies (Sequence[Dependency]):
+
+        Returns:
+            Module:
+
+        """
+        return Module(
+            properties=self.properties,
+            id=self.id,
+            type=self.type,
+            artifacts=list(artifacts) if self.has_artifacts else None,
+            dependencies=(
+                list(dependencies) if self.has_dependencies else None
+            ),
+        )
+
+
+class _ModuleCombiner(_ModuleHeader):
+    """
+    Accumulates modules sharing the same key in memory.
+    """
+
+    def __init__(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module): The first module of this key.
+
+        Returns:
+            None:
+
+        """
+        super().__init__(module)
+        self.artifacts: dict[_ArtifactKey, Artifact] = {}
+        self.dependencies: dict[_DependencyKey, Dependency] = {}
+
+    def add(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module):
+
+        Returns:
+            None:
+
+        """
+        super().add(module)
+        for artifact in module.artifacts or ():
+            artifact_key = _artifact_key(artifact)
+            existing_artifact = self.artifacts.get(artifact_key)
+            self.artifacts[artifact_key] = (
+                artifact
+                if existing_artifact is None
+                else _combine_artifact(existing_artifact, artifact)
+            )
+        for dependency in module.dependencies or ():
+            dependency_key = _dependency_key(dependency)
+            existing_dependency = self.dependencies.get(dependency_key)
+            self.dependencies[dependency_key] = (
+                dependency
+                if existing_dependency is None
+                else _combine_dependency(existing_dependency, dependency)
+            )
+
+    def build(self) -> Module:
+        """
+
+        Returns:
+            Module:
+
+        """
+        return self.build_with(
+            tuple(self.artifacts.values()), tuple(self.dependencies.values())
+        )
+
+
 def _select_url(*items: BuildInfo) -> str | None:
     """
 
@@ -352,17 +703,19 @@ def _combine_issues(*items: BuildInfo) -> Issues | None:
         return None
 
     issues: Issues = Issues()
-    issue_list: list[AffectedIssue] = []
+    issue_index: dict[object, AffectedIssue] = {}
     status_list: set[str] = set()
 
     for item in items:
         if item.issues is not None:
-            __push_to_new_issue(issues, item.issues, issue_list, status_list)
+            __push_to_new_issue(issues, item.issues, issue_index, status_list)
 
     issues.aggregationBuildStatus = (
         "\n".join(status_list) if len(status_list) > 0 else None
     )
-    issues.affectedIssues = issue_list if len(issue_list) > 0 else None
+    issues.affectedIssues = (
+        list(issue_index.values()) if len(issue_index) > 0 else None
+    )
 
     return issues
 
@@ -370,7 +723,7 @@ def _combine_issues(*items: BuildInfo) -> Issues | None:
 def __push_to_new_issue(
     new_issues: Issues,
     current_issue: Issues,
-    all_affected_issues: list[AffectedIssue],
+    all_affected_issues: dict[object, AffectedIssue],
     all_aggregated_states: set[str],
 ) -> None:
     """
@@ -380,7 +733,8 @@ def __push_to_new_issue(
 
         current_issue (Issues):
 
-        all_affected_issues (list[AffectedIssue]):
+        all_affected_issues (dict[object, AffectedIssue]): The issues
+            collected so far by their key.
 
         all_aggregated_states (set[str]):
 
@@ -398,11 +752,53 @@ def __push_to_new_issue(
     if new_issues.tracker is None:
         new_issues.tracker = current_issue.tracker
     if current_issue.affectedIssues is not None:
-        all_affected_issues.extend(current_issue.affectedIssues)
+        for affected_issue in current_issue.affectedIssues:
+            key: object = (
+                affected_issue.key
+                if affected_issue.key is not None
+                else object()
+            )
+            existing: AffectedIssue | None = all_affected_issues.get(key)
+            all_affected_issues[key] = (
+                affected_issue
+                if existing is None
+                else _combine_affected_issue(existing, affected_issue)
+            )
     if current_issue.aggregationBuildStatus is not None:
         all_aggregated_states.add(current_issue.aggregationBuildStatus)
 
 
+def _combine_affected_issue(
+    first: AffectedIssue, other: AffectedIssue
+) -> AffectedIssue:
+    """
+    Combines two issues with the same key. An issue is aggregated only, if
+    it has been aggregated in all builds mentioning it.
+
+    Args:
+        first (AffectedIssue):
+        other (AffectedIssue):
+
+    Returns:
+        AffectedIssue:
+
+    """
+    aggregated: bool | None = first.aggregated
+    if other.aggregated is not None:
+        aggregated = (
+            other.aggregated and aggregated
+            if aggregated is not None
+            else other.aggregated
+        )
+
+    return AffectedIssue(
+        key=first.key,
+        url=_first_set(first.url, other.url),
+        summary=_first_set(first.summary, other.summary),
+        aggregated=aggregated,
+    )
+
+
 def _combine_properties(
     different_properties: NonSameSetsOfProperties, *items: BuildInfo
 ) -> Mapping[str, str] | None:
@@ -419,29 +815,54 @@ def _combine_properties(
     if len(items) == 0:
         return None
 
-    deleted: set[str] = set()
-    properties: dict[str, set[str]] = {}
+    values: dict[str, list[str]] = {}
     for item in items:
         if item.properties is None:
             continue
 
-        for key in item.properties.keys():
-            if key in deleted:
-                continue
+        for key, value in item.properties.items():
+            values.setdefault(key, []).append(value)
 
-            if key not in properties:
-                properties[key] = set()
-                properties[key].add(item.properties[key])
-            elif __can_combine_current_property_set(
-                different_properties,
-                key,
-                properties[key],
-                item.properties[key],
-            ):
-                deleted.add(key)
-                _ = properties.pop(key, None)
+    properties: dict[str, str] = {}
+    for key, key_values in values.items():
+        combined = _combine_property_values(
+            different_properties, key, key_values
+        )
+        if combined is not None:
+            properties[key] = combined
+        else:
+            count("properties.dropped")
 
-    return {k: pathsep.join(v) for k, v in properties.items()}
+    return properties
+
+
+def _combine_property_values(
+    different_properties: NonSameSetsOfProperties,
+    identifier: str,
+    values: Iterable[str],
+) -> str | None:
+    """
+    Combines the values of a single property in the order of the items.
+
+    Args:
+        different_properties (NonSameSetsOfProperties):
+        identifier (str):
+        values (Iterable[str]):
+
+    Returns:
+        str | None: The combined value or None, if the property is deleted.
+
+    """
+    combined: set[str] | None = None
+    for value in values:
+        if combined is None:
+            combined = {value}
+        elif __can_combine_current_property_set(
+            different_properties, identifier, combined, value
+        ):
+            return None
+
+    return pathsep.join(combined) if combined is not None else None
 
 
 def __can_combine_current_property_set(
@@ -560,6 +981,9 @@ def _verify_builds(
     Returns:
         tuple[BuildInfo, ...]:
 
+    Raises:
+        ValueError: If the builds cannot be merged with the strategy.
+
     """
     if different_builds == NonUniqueBuilds.IGNORE:
         return ()
@@ -582,9 +1006,12 @@ def _verify_builds(
     if different_builds != NonUniqueBuilds.SKIP:
         raise ValueError("Invalid configuration:", different_builds)
 
-    first_build: BuildInfo = tuple(
-        filter(lambda b: b.name is not None and b.number is not None, items)
-    )[0]
+    first_build: BuildInfo | None = next(
+        (b for b in items if b.name is not None and b.number is not None),
+        None,
+    )
+    if first_build is None:
+        raise ValueError("No build has both a name and a number")
 
     return tuple(
         build
@@ -592,3 +1019,324 @@ def _verify_builds(
         if build.name == first_build.name
         and build.number == first_build.number
     )
+
+
+def merge_build_info_external(
+    items: Iterable[BuildInfo],
+    different_data: NonUniqueBuilds = NonUniqueBuilds.SKIP,
+    different_props: NonSameSetsOfProperties = NonSameSetsOfProperties.SKIP,
+    memory_budget: int = 64 * 1024 * 1024,
+    spill_directory: str | PathLike | None = None,
+) -> BuildInfo:
+    """
+    Merges the items like merge_build_info, but keeps the index of the
+    module artifacts and dependencies within a memory budget. If the budget
+    is exceeded, the index is written as a sorted run to a temporary file.
+    All runs are k-way merged after the last item has been consumed.
+
+    The items are iterated only once, so passing a generator that loads the
+    files lazily keeps only a single input item in memory.
+
+    Args:
+        items (Iterable[BuildInfo]): The items to merge.
+        different_data (NonUniqueBuilds):
+        different_props (NonSameSetsOfProperties):
+        memory_budget (int): The approximate number of bytes the index
+            may occupy before it is spilled to disk.
+        spill_directory (str | PathLike | None): The directory to create
+            the temporary files in. Uses the system default if omitted.
+
+    Returns:
+        BuildInfo: The same result as merge_build_info.
+
+    """
+    headers: list[BuildInfo] = []
+    reference: tuple[str, str] | None = None
+    has_modules: bool = False
+
+    with phase("merge"), TemporaryDirectory(dir=spill_directory) as directory:
+        index = _SpillingModuleIndex(directory, memory_budget)
+        for item in items:
+            headers.append(replace(item, modules=None))
+            if different_data != NonUniqueBuilds.SKIP:
+                continue
+            if (
+                reference is None
+                and item.name is not None
+                and item.number is not None
+            ):
+                reference = (item.name, item.number)
+            if reference != (item.name, item.number):
+                continue
+            if item.modules is not None:
+                has_modules = True
+                for module in item.modules:
+                    index.add(module)
+
+        with phase("merge.verify"):
+            filtered_items = _verify_builds(different_data, *headers)
+        with phase("merge.headers"):
+            result: BuildInfo = _merge_headers(
+                different_props, *filtered_items
+            )
+        with phase("merge.modules"):
+            result.modules = index.build() if has_modules else None
+        count("modules.merged", len(result.modules or ()))
+
+    return result
+
+
+_Record = list[Any]
+_ARTIFACT_ENTRY: int = 0
+_DEPENDENCY_ENTRY: int = 1
+_RECORD_OVERHEAD: int = 160
+_MAX_OPEN_RUNS: int = 64
+
+
+def _spill_key(key: tuple[Any, ...]) -> str:
+    """
+    Serializes the key of an artifact or dependency for the spill runs.
+    Raw digests are hex-encoded, as JSON cannot represent bytes.
+
+    Args:
+        key (tuple[Any, ...]):
+
+    Returns:
+        str:
+
+    """
+    return dumps([k.hex() if isinstance(k, bytes) else k for k in key])
+
+
+def _record_sort_key(record: _Record) -> tuple[int, int, str, int]:
+    """
+
+    Args:
+        record (_Record):
+
+    Returns:
+        tuple[int, int, str, int]: Module position, entry kind, entry key
+            and sequence number.
+
+    """
+    return record[0], record[1], record[2], record[3]
+
+
+def _record_group_key(record: _Record) -> tuple[int, int, str]:
+    """
+
+    Args:
+        record (_Record):
+
+    Returns:
+        tuple[int, int, str]: Module position, entry kind and entry key.
+
+    """
+    return record[0], record[1], record[2]
+
+
+class _SpillingModuleIndex:
+    """
+    Index of module artifacts and dependencies, that is written to sorted
+    runs on disk, if it exceeds its memory budget.
+    """
+
+    def __init__(self, directory: str, memory_budget: int) -> None:
+        """
+
+        Args:
+            directory (str): The directory to write the runs to.
+            memory_budget (int): The size of the in-memory index in bytes.
+
+        Returns:
+            None:
+
+        """
+        self._directory: str = directory
+        self._memory_budget: int = memory_budget
+        self._headers: dict[object, _ModuleHeader] = {}
+        self._positions: dict[object, int] = {}
+        self._buffer: list[tuple[tuple[int, int, str, int], str]] = []
+        self._buffered_size: int = 0
+        self._runs: list[str] = []
+        self._run_count: int = 0
+        self._sequence: int = 0
+
+    def add(self, module: Module) -> None:
+        """
+
+        Args:
+            module (Module):
+
+        Returns:
+            None:
+
+        """
+        key: object = _module_key(module)
+        if key is None:
+            key = object()
+        if key not in self._headers:
+            self._positions[key] = len(self._headers)
+            self._headers[key] = _ModuleHeader(module)
+        self._headers[key].add(module)
+
+        position: int = self._positions[key]
+        for artifact in module.artifacts or ():
+            self._push(
+                position,
+                _ARTIFACT_ENTRY,
+                _spill_key(_artifact_key(artifact)),
+                asdict(artifact),
+            )
+        for dependency in module.dependencies or ():
+            self._push(
+                position,
+                _DEPENDENCY_ENTRY,
+                _spill_key(_dependency_key(dependency)),
+                asdict(dependency),
+            )
+
+    def _push(
+        self, position: int, kind: int, key: str, payload: Mapping[str, Any]
+    ) -> None:
+        """
+
+        Args:
+            position (int):
+            kind (int):
+            key (str):
+            payload (Mapping[str, Any]):
+
+        Returns:
+            None:
+
+        """
+        line: str = dumps([position, kind, key, self._sequence, payload])
+        self._buffer.append(((position, kind, key, self._sequence), line))
+        self._sequence += 1
+        self._buffered_size += len(line) + _RECORD_OVERHEAD
+        if self._buffered_size > self._memory_budget:
+            self._spill()
+
+    def _spill(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        with phase("merge.spill"):
+            self._buffer.sort(key=lambda entry: entry[0])
+            self._runs.append(
+                self._write_run(line for _, line in self._buffer)
+            )
+        count("runs.spilled")
+        self._buffer.clear()
+        self._buffered_size = 0
+
+    def _write_run(self, lines: Iterable[str]) -> str:
+        """
+
+        Args:
+            lines (Iterable[str]):
+
+        Returns:
+            str: The path of the new run.
+
+        """
+        path: str = _join_path(self._directory, f"run-{self._run_count}.jsonl")
+        self._run_count += 1
+        with open(path, "w", encoding="utf-8") as run:
+            for line in lines:
+                run.write(line)
+                run.write("\n")
+        return path
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[_Record]:
+        """
+
+        Args:
+            path (str):
+
+        Yields:
+            _Record:
+
+        """
+        with open(path, "r", encoding="utf-8") as run:
+            for line in run:
+                yield loads(line)
+
+    def _reduce_runs(self) -> None:
+        """
+        Merges the oldest runs until the number of runs does not exceed
+        the number of files that are opened at the same time.
+
+        Returns:
+            None:
+
+        """
+        while len(self._runs) > _MAX_OPEN_RUNS:
+            selected: list[str] = self._runs[:_MAX_OPEN_RUNS]
+            merged: Iterator[_Record] = _merge_sorted(
+                *(self._read_run(path) for path in selected),
+                key=_record_sort_key,
+            )
+            new_run: str = self._write_run(dumps(r) for r in merged)
+            self._runs = [new_run, *self._runs[_MAX_OPEN_RUNS:]]
+
+    def build(self) -> Sequence[Module]:
+        """
+        Merges all runs and creates the resulting modules.
+
+        Returns:
+            Sequence[Module]:
+
+        """
+        self._buffer.sort(key=lambda entry: entry[0])
+        in_memory: Iterator[_Record] = (
+            loads(line) for _, line in self._buffer
+        )
+        self._reduce_runs()
+
+        artifacts: list[list[tuple[int, Artifact]]] = [
+            [] for _ in self._headers
+        ]
+        dependencies: list[list[tuple[int, Dependency]]] = [
+            [] for _ in self._headers
+        ]
+
+        records: Iterator[_Record] = _merge_sorted(
+            *(self._read_run(path) for path in self._runs),
+            in_memory,
+            key=_record_sort_key,
+        )
+        for (position, kind, _), group in groupby(
+            records, key=_record_group_key
+        ):
+            first: _Record = next(group)
+            if kind == _ARTIFACT_ENTRY:
+                artifact: Artifact = Artifact(**first[4])
+                for record in group:
+                    artifact = _combine_artifact(
+                        artifact, Artifact(**record[4])
+                    )
+                artifacts[position].append((first[3], artifact))
+            else:
+                dependency: Dependency = Dependency(**first[4])
+                for record in group:
+                    dependency = _combine_dependency(
+                        dependency, Dependency(**record[4])
+                    )
+                dependencies[position].append((first[3], dependency))
+
+        self._buffer.clear()
+        self._buffered_size = 0
+
+        return [
+            header.build_with(
+                [a for _, a in sorted(artifacts[i], key=lambda e: e[0])],
+                [d for _, d in sorted(dependencies[i], key=lambda e: e[0])],
+            )
+            for i, header in enumerate(self._headers.values())
+        ]
@@ -0,0 +1,666 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+import sqlite3
+from dataclasses import dataclass, replace
+from itertools import islice
+from json import dumps, loads
+from os import PathLike, fspath
+from types import TracebackType
+from typing import Any, Iterable, Mapping
+
+from ._instrument import count, phase
+from ._loadsave import load_from_dict, transform_to_mapping
+from ._model import Module
+from ._vcs import BuildInfo
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    number TEXT,
+    started TEXT,
+    header TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS builds_by_name ON builds (name, number);
+CREATE INDEX IF NOT EXISTS builds_by_started ON builds (started);
+
+CREATE TABLE IF NOT EXISTS modules (
+    id INTEGER PRIMARY KEY,
+    build INTEGER NOT NULL REFERENCES builds (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    module_id TEXT,
+    header TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS modules_by_build ON modules (build, position);
+CREATE INDEX IF NOT EXISTS modules_by_id ON modules (module_id);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    module INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT,
+    name TEXT,
+    path TEXT,
+    sha256 TEXT,
+    sha1 TEXT,
+    md5 TEXT
+);
+CREATE INDEX IF NOT EXISTS artifacts_by_module ON artifacts (module);
+CREATE INDEX IF NOT EXISTS artifacts_by_sha256 ON artifacts (sha256);
+CREATE INDEX IF NOT EXISTS artifacts_by_sha1 ON artifacts (sha1);
+CREATE INDEX IF NOT EXISTS artifacts_by_md5 ON artifacts (md5);
+CREATE INDEX IF NOT EXISTS artifacts_by_name ON artifacts (name);
+
+CREATE TABLE IF NOT EXISTS dependencies (
+    module INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT,
+    dependency_id TEXT,
+    sha256 TEXT,
+    sha1 TEXT,
+    md5 TEXT,
+    scopes TEXT,
+    requested_by TEXT
+);
+CREATE INDEX IF NOT EXISTS dependencies_by_module ON dependencies (module);
+CREATE INDEX IF NOT EXISTS dependencies_by_id ON dependencies (dependency_id);
+CREATE INDEX IF NOT EXISTS dependencies_by_sha256 ON dependencies (sha256);
+
+CREATE TABLE IF NOT EXISTS properties (
+    build INTEGER NOT NULL REFERENCES builds (id) ON DELETE CASCADE,
+    module INTEGER REFERENCES modules (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS properties_by_build ON properties (build, module);
+CREATE INDEX IF NOT EXISTS properties_by_key ON properties (key, value);
+"""
+
+_BUILD_REFERENCE_COLUMNS: str = "b.name, b.number, b.started"
+
+
+@dataclass(frozen=True)
+class BuildReference:
+    """
+    Identifies a build stored in a BuildInfoStore.
+    """
+
+    name: str | None
+    """The name of the build"""
+    number: str | None
+    """The number of the build"""
+    started: str | None
+    """The start time of the build"""
+
+
+def _header(item: Any, **containers: Any) -> str:
+    """
+    Serializes the item without the normalized fields. Fields which are not
+    None are stored as empty containers, so that None and empty values are
+    restored as they have been stored.
+
+    Args:
+        item (Any): The build info or module.
+        containers (Mapping[str, Any]): The normalized fields and their
+            empty values.
+
+    Returns:
+        str:
+
+    """
+    stripped: Any = replace(
+        item,
+        **{
+            k: None if getattr(item, k) is None else v
+            for k, v in containers.items()
+        },
+    )
+    return dumps(transform_to_mapping(stripped), separators=(",", ":"))
+
+
+class _Batch:  # pylint: disable=R0903
+    """
+    The rows of a batch of build infos to insert with executemany.
+    """
+
+    def __init__(self, next_build: int, next_module: int) -> None:
+        """
+
+        Args:
+            next_build (int): The first free id of the builds table.
+            next_module (int): The first free id of the modules table.
+
+        Returns:
+            None:
+
+        """
+        self.next_build: int = next_build
+        self.next_module: int = next_module
+        self.builds: list[tuple[Any, ...]] = []
+        self.replaced: list[tuple[Any, ...]] = []
+        self.modules: list[tuple[Any, ...]] = []
+        self.artifacts: list[tuple[Any, ...]] = []
+        self.dependencies: list[tuple[Any, ...]] = []
+        self.properties: list[tuple[Any, ...]] = []
+
+    def add(self, bi: BuildInfo) -> None:
+        """
+
+        Args:
+            bi (BuildInfo):
+
+        Returns:
+            None:
+
+        """
+        build: int = self.next_build
+        self.next_build += 1
+        self.replaced.append((bi.name, bi.number))
+        self.builds.append(
+            (
+                build,
+                bi.name,
+                bi.number,
+                bi.started,
+                _header(bi, modules=[], properties={}),
+            )
+        )
+        self.properties.extend(
+            (build, None, k, v) for k, v in (bi.properties or {}).items()
+        )
+        for position, module in enumerate(bi.modules or ()):
+            self._add_module(build, position, module)
+
+    def _add_module(self, build: int, position: int, module: Module) -> None:
+        """
+
+        Args:
+            build (int):
+            position (int):
+            module (Module):
+
+        Returns:
+            None:
+
+        """
+        row: int = self.next_module
+        self.next_module += 1
+        self.modules.append(
+            (
+                row,
+                build,
+                position,
+                module.id,
+                _header(module, artifacts=[], dependencies=[], properties={}),
+            )
+        )
+        self.properties.extend(
+            (build, row, k, v) for k, v in (module.properties or {}).items()
+        )
+        self.artifacts.extend(
+            (row, i, a.type, a.name, a.path, a.sha256, a.sha1, a.md5)
+            for i, a in enumerate(module.artifacts or ())
+        )
+        self.dependencies.extend(
+            (
+                row,
+                i,
+                d.type,
+                d.id,
+                d.sha256,
+                d.sha1,
+                d.md5,
+                None if d.scopes is None else dumps(list(d.scopes)),
+                (
+                    None
+                    if d.requestedBy is None
+                    else dumps([list(c) for c in d.requestedBy])
+                ),
+            )
+            for i, d in enumerate(module.dependencies or ())
+        )
+
+
+class BuildInfoStore:
+    """
+    Stores build infos in normalized and indexed tables of a SQLite
+    database to find builds by the artifacts they produced or the
+    dependencies they used. A build is identified by its name and number;
+    adding a build with the name and number of a stored build replaces it.
+
+    The store can be used as context manager closing the database on exit.
+    """
+
+    def __init__(self, path: str | PathLike = ":memory:") -> None:
+        """
+
+        Args:
+            path (str | PathLike): The database file. By default, the
+                database is kept in memory.
+
+        Returns:
+            None:
+
+        """
+        self._connection = sqlite3.connect(fspath(path), isolation_level=None)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "BuildInfoStore":
+        """
+
+        Returns:
+            BuildInfoStore: The instance itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+
+        Args:
+            exc_type (type[BaseException] | None):
+            exc_value (BaseException | None):
+            traceback (TracebackType | None):
+
+        Returns:
+            None:
+
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of stored builds.
+
+        """
+        return self._connection.execute(
+            "SELECT count(*) FROM builds"
+        ).fetchone()[0]
+
+    def add(self, bi: BuildInfo) -> None:
+        """
+        Stores a single build info.
+
+        Args:
+            bi (BuildInfo):
+
+        Returns:
+            None:
+
+        """
+        self.add_many((bi,))
+
+    def add_many(
+        self, items: Iterable[BuildInfo], batch_size: int = 100
+    ) -> int:
+        """
+        Stores many build infos. Every batch is written in a single
+        transaction using bulk inserts.
+
+        Args:
+            items (Iterable[BuildInfo]): The build infos to store.
+            batch_size (int): The number of build infos per transaction.
+
+        Returns:
+            int: The number of stored build infos.
+
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size must be positive", batch_size)
+
+        stored: int = 0
+        iterator = iter(items)
+        while len(chunk := list(islice(iterator, batch_size))) > 0:
+            with phase("store.add"):
+                self._write_batch(chunk)
+            stored += len(chunk)
+            count("builds.stored", len(chunk))
+        return stored
+
+    def _write_batch(self, chunk: list[BuildInfo]) -> None:
+        """
+
+        Args:
+            chunk (list[BuildInfo]):
+
+        Returns:
+            None:
+
+        """
+        # a build stored twice within a batch is replaced by its last copy
+        latest: dict[tuple[str, str], int] = {
+            (bi.name, bi.number): i
+            for i, bi in enumerate(chunk)
+            if bi.name is not None and bi.number is not None
+        }
+        chunk = [
+            bi
+            for i, bi in enumerate(chunk)
+            if latest.get((bi.name, bi.number), i) == i  # type: ignore
+        ]
+
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            next_build, next_module = cursor.execute(
+                "SELECT (SELECT coalesce(max(id), 0) + 1 FROM builds), "
+                "(SELECT coalesce(max(id), 0) + 1 FROM modules)"
+            ).fetchone()
+            batch = _Batch(next_build, next_module)
+            for bi in chunk:
+                batch.add(bi)
+
+            cursor.executemany(
+                "DELETE FROM builds WHERE name IS ? AND number IS ?",
+                batch.replaced,
+            )
+            cursor.executemany(
+                "INSERT INTO builds VALUES (?, ?, ?, ?, ?)", batch.builds
+            )
+            cursor.executemany(
+                "INSERT INTO modules VALUES (?, ?, ?, ?, ?)", batch.modules
+            )
+            cursor.executemany(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                batch.artifacts,
+            )
+            cursor.executemany(
+                "INSERT INTO dependencies VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch.dependencies,
+            )
+            cursor.executemany(
+                "INSERT INTO properties VALUES (?, ?, ?, ?)", batch.properties
+            )
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    def remove(self, name: str | None, number: str | None) -> bool:
+        """
+
+        Args:
+            name (str | None): The name of the build.
+            number (str | None): The number of the build.
+
+        Returns:
+            bool: True, if the build has been stored.
+
+        """
+        cursor = self._connection.execute(
+            "DELETE FROM builds WHERE name IS ? AND number IS ?",
+            (name, number),
+        )
+        return cursor.rowcount > 0
+
+    def _references(
+        self, query: str, parameters: Iterable[Any]
+    ) -> list[BuildReference]:
+        """
+
+        Args:
+            query (str): The query selecting the build references.
+            parameters (Iterable[Any]): The parameters of the query.
+
+        Returns:
+            list[BuildReference]:
+
+        """
+        return [
+            BuildReference(*row)
+            for row in self._connection.execute(query, tuple(parameters))
+        ]
+
+    @staticmethod
+    def _conditions(
+        columns: Mapping[str, str | None],
+    ) -> tuple[str, list[str]]:
+        """
+
+        Args:
+            columns (Mapping[str, str | None]): The values of the columns to
+                filter by. Columns with None values are ignored.
+
+        Returns:
+            tuple[str, list[str]]: The condition and its parameters.
+
+        """
+        selected: dict[str, str] = {
+            k: v for k, v in columns.items() if v is not None
+        }
+        if len(selected) == 0:
+            raise ValueError("At least one criterion must be specified")
+        return " AND ".join(f"{k} = ?" for k in selected), list(
+            selected.values()
+        )
+
+    def builds(self, name: str | None = None) -> list[BuildReference]:
+        """
+
+        Args:
+            name (str | None): The name of the builds to list. If None,
+                all builds are listed.
+
+        Returns:
+            list[BuildReference]: The builds ordered by their start time.
+
+        """
+        condition: str = "" if name is None else "WHERE b.name = ?"
+        return self._references(
+            f"SELECT {_BUILD_REFERENCE_COLUMNS} FROM builds b "  # nosec B608
+            f"{condition} ORDER BY b.started, b.id",
+            () if name is None else (name,),
+        )
+
+    def builds_with_artifact(
+        self,
+        *,
+        sha256: str | None = None,
+        sha1: str | None = None,
+        md5: str | None = None,
+        name: str | None = None,
+    ) -> list[BuildReference]:
+        """
+        Finds the builds having produced a matching artifact.
+
+        Args:
+            sha256 (str | None): The SHA-256 digest of the artifact.
+            sha1 (str | None): The SHA-1 digest of the artifact.
+            md5 (str | None): The MD5 digest of the artifact.
+            name (str | None): The name of the artifact.
+
+        Returns:
+            list[BuildReference]: The builds ordered by their start time.
+
+        """
+        condition, parameters = self._conditions(
+            {"a.sha256": sha256, "a.sha1": sha1, "a.md5": md5, "a.name": name}
+        )
+        return self._references(
+            f"SELECT DISTINCT {_BUILD_REFERENCE_COLUMNS} "  # nosec B608
+            "FROM artifacts a JOIN modules m ON m.id = a.module "
+            "JOIN builds b ON b.id = m.build "
+            f"WHERE {condition} ORDER BY b.started, b.id",
+            parameters,
+        )
+
+    def builds_with_dependency(
+        self,
+        *,
+        dependency_id: str | None = None,
+        sha256: str | None = None,
+    ) -> list[BuildReference]:
+        """
+        Finds the builds having used a matching dependency.
+
+        Args:
+            dependency_id (str | None): The id of the dependency.
+            sha256 (str | None): The SHA-256 digest of the dependency.
+
+        Returns:
+            list[BuildReference]: The builds ordered by their start time.
+
+        """
+        condition, parameters = self._conditions(
+            {"d.dependency_id": dependency_id, "d.sha256": sha256}
+        )
+        return self._references(
+            f"SELECT DISTINCT {_BUILD_REFERENCE_COLUMNS} "  # nosec B608
+            "FROM dependencies d JOIN modules m ON m.id = d.module "
+            "JOIN builds b ON b.id = m.build "
+            f"WHERE {condition} ORDER BY b.started, b.id",
+            parameters,
+        )
+
+    def load(self, name: str | None, number: str | None) -> BuildInfo | None:
+        """
+        Restores a stored build info.
+
+        Args:
+            name (str | None): The name of the build.
+            number (str | None): The number of the build.
+
+        Returns:
+            BuildInfo | None: The build info or None, if it is not stored.
+
+        """
+        connection = self._connection
+        row = connection.execute(
+            "SELECT id, header FROM builds WHERE name IS ? AND number IS ?",
+            (name, number),
+        ).fetchone()
+        if row is None:
+            return None
+
+        build, header = row
+        document: dict[str, Any] = loads(header)
+        modules: dict[int, dict[str, Any]] = {}
+        for module_row, module_header in connection.execute(
+            "SELECT id, header FROM modules WHERE build = ? ORDER BY position",
+            (build,),
+        ):
+            modules[module_row] = loads(module_header)
+        if "modules" in document:
+            document["modules"] = list(modules.values())
+
+        for module_row, key, value in connection.execute(
+            "SELECT module, key, value FROM properties WHERE build = ? "
+            "ORDER BY rowid",
+            (build,),
+        ):
+            target = document if module_row is None else modules[module_row]
+            target["properties"][key] = value
+
+        for module_row, *values in connection.execute(
+            "SELECT a.module, a.type, a.name, a.path, a.sha256, a.sha1, a.md5 "
+            "FROM artifacts a JOIN modules m ON m.id = a.module "
+            "WHERE m.build = ? ORDER BY a.module, a.position",
+            (build,),
+        ):
+            modules[module_row]["artifacts"].append(
+                _without_none(
+                    ("type", "name", "path", "sha256", "sha1", "md5"), values
+                )
+            )
+
+        for module_row, *values in connection.execute(
+            "SELECT d.module, d.type, d.dependency_id, d.sha256, d.sha1, "
+            "d.md5, d.scopes, d.requested_by "
+            "FROM dependencies d JOIN modules m ON m.id = d.module "
+            "WHERE m.build = ? ORDER BY d.module, d.position",
+            (build,),
+        ):
+            values[5] = None if values[5] is None else loads(values[5])
+            values[6] = None if values[6] is None else loads(values[6])
+            modules[module_row]["dependencies"].append(
+                _without_none(
+                    (
+                        "type",
+                        "id",
+                        "sha256",
+                        "sha1",
+                        "md5",
+                        "scopes",
+                        "requestedBy",
+                    ),
+                    values,
+                )
+            )
+
+        return load_from_dict(document)
+
+
+def _without_none(
+    keys: tuple[str, ...], values: Iterable[Any]
+) -> dict[str, Any]:
+    """
+
+    Args:
+        keys (tuple[str, ...]):
+        values (Iterable[Any]):
+
+    Returns:
+        dict[str, Any]: The mapping of the keys to the values not being None.
+
+    """
+    return {k: v for k, v in zip(keys, values) if v is not None}
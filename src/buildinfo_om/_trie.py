@@ -0,0 +1,372 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from array import array
+from dataclasses import replace
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from ._model import BuildInfo, Dependency, Module
+
+_NO_NODE: int = -1
+
+
+class ChainTrie:
+    """
+    A prefix trie of the requesting chains of the dependencies of a module.
+    Chains end at the module or a direct dependency, so the trie is rooted
+    at the last entry of a chain: each node stores an id and the node of
+    the remaining chain towards the module. Chains sharing their tail,
+    e.g. all chains through the same direct dependency, share their nodes.
+    A chain is referenced by the node of its first entry.
+    """
+
+    __slots__ = ("_ids", "_parents", "_nodes")
+
+    def __init__(self) -> None:
+        """
+
+        Returns:
+            None:
+
+        """
+        self._ids: list[str] = []
+        self._parents: array = array("l")
+        self._nodes: dict[tuple[int, str], int] | None = {}
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of nodes.
+
+        """
+        return len(self._ids)
+
+    def insert(self, chain: Sequence[str]) -> int:
+        """
+
+        Args:
+            chain (Sequence[str]): The requesting chain to add.
+
+        Returns:
+            int: The reference of the chain.
+
+        """
+        if self._nodes is None:
+            self._nodes = {
+                (parent, entry): node
+                for node, (parent, entry) in enumerate(
+                    zip(self._parents, self._ids)
+                )
+            }
+        nodes: dict[tuple[int, str], int] = self._nodes
+        node: int = _NO_NODE
+        for entry in reversed(chain):
+            key: tuple[int, str] = (node, entry)
+            known: int | None = nodes.get(key)
+            if known is None:
+                known = len(self._ids)
+                nodes[key] = known
+                self._ids.append(entry)
+                self._parents.append(node)
+            node = known
+        return node
+
+    def seal(self) -> None:
+        """
+        Releases the lookup of the nodes needed to share nodes between
+        inserted chains. It is rebuilt, if further chains are inserted.
+
+        Returns:
+            None:
+
+        """
+        self._nodes = None
+
+    def expand(self, node: int) -> tuple[str, ...]:
+        """
+
+        Args:
+            node (int): The reference of a chain.
+
+        Returns:
+            tuple[str, ...]: The entries of the chain.
+
+        """
+        ids: list[str] = self._ids
+        parents: array = self._parents
+        entries: list[str] = []
+        while node != _NO_NODE:
+            entries.append(ids[node])
+            node = parents[node]
+        return tuple(entries)
+
+    def chains(self, chains: Iterable[Sequence[str]]) -> "TrieChains":
+        """
+
+        Args:
+            chains (Iterable[Sequence[str]]): The requesting chains of a
+                dependency.
+
+        Returns:
+            TrieChains: The chains stored as references into this trie.
+
+        """
+        return TrieChains(self, array("l", map(self.insert, chains)))
+
+
+class TrieChains(Sequence[Sequence[str]]):
+    """
+    The requesting chains of a dependency stored as references into a
+    ChainTrie. The chains are expanded to tuples on access. Copying the
+    chains deeply, as dataclasses.asdict does when saving, results in
+    plain lists of lists, so saved build infos are unchanged.
+    """
+
+    __slots__ = ("_trie", "_refs")
+
+    def __init__(self, trie: ChainTrie, refs: array) -> None:
+        """
+
+        Args:
+            trie (ChainTrie): The trie containing the chains.
+            refs (array): The references of the chains.
+
+        Returns:
+            None:
+
+        """
+        self._trie: ChainTrie = trie
+        self._refs: array = refs
+
+    @property
+    def trie(self) -> ChainTrie:
+        """
+        The trie containing the chains.
+        """
+        return self._trie
+
+    def __len__(self) -> int:
+        """
+
+        Returns:
+            int: The number of chains.
+
+        """
+        return len(self._refs)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[str, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[str, ...]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> tuple[str, ...] | list[tuple[str, ...]]:
+        """
+
+        Args:
+            index (int | slice):
+
+        Returns:
+            tuple[str, ...] | list[tuple[str, ...]]: The expanded chain or
+                chains.
+
+        """
+        if isinstance(index, slice):
+            return [self._trie.expand(r) for r in self._refs[index]]
+        return self._trie.expand(self._refs[index])
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        """
+
+        Returns:
+            Iterator[tuple[str, ...]]: The expanded chains.
+
+        """
+        expand = self._trie.expand
+        return (expand(r) for r in self._refs)
+
+    def __eq__(self, other: object) -> bool:
+        """
+
+        Args:
+            other (object):
+
+        Returns:
+            bool: True, if the other value contains equal chains in the
+                same order.
+
+        """
+        if isinstance(other, TrieChains) and other._trie is self._trie:
+            return self._refs == other._refs
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        if len(other) != len(self):
+            return False
+        return all(
+            tuple(mine) == tuple(theirs) for mine, theirs in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+
+        Returns:
+            str: The representation of the chains as plain lists.
+
+        """
+        return repr(self.__deepcopy__({}))
+
+    def __copy__(self) -> "TrieChains":
+        """
+
+        Returns:
+            TrieChains: The chains, as they cannot be modified.
+
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[list[str]]:
+        """
+
+        Args:
+            memo (dict[int, Any]):
+
+        Returns:
+            list[list[str]]: The chains expanded to plain lists.
+
+        """
+        return [list(chain) for chain in self]
+
+
+def compact_requested_by(module: Module) -> Module:
+    """
+    Stores the requesting chains of all dependencies of the module in a
+    single trie shared by the dependencies of the module.
+
+    Args:
+        module (Module): The module to compact.
+
+    Returns:
+        Module: A copy of the module whose dependencies keep references
+            into the trie instead of lists of chains.
+
+    """
+    if module.dependencies is None:
+        return module
+    trie = ChainTrie()
+    dependencies: list[Dependency] = [
+        (
+            d
+            if d.requestedBy is None
+            else replace(
+                d, requestedBy=trie.chains(d.requestedBy)  # type: ignore
+            )
+        )
+        for d in module.dependencies
+    ]
+    trie.seal()
+    return replace(module, dependencies=dependencies)
+
+
+def expand_requested_by(module: Module) -> Module:
+    """
+
+    Args:
+        module (Module): The module to expand.
+
+    Returns:
+        Module: A copy of the module whose dependencies store their
+            requesting chains as plain lists.
+
+    """
+    if module.dependencies is None:
+        return module
+    dependencies: list[Dependency] = [
+        (
+            replace(d, requestedBy=[list(c) for c in d.requestedBy])
+            if isinstance(d.requestedBy, TrieChains)
+            else d
+        )
+        for d in module.dependencies
+    ]
+    return replace(module, dependencies=dependencies)
+
+
+def compact_build_info(bi: BuildInfo) -> BuildInfo:
+    """
+    Stores the requesting chains of the dependencies of all modules in one
+    trie per module. See compact_requested_by.
+
+    Args:
+        bi (BuildInfo): The build info to compact.
+
+    Returns:
+        BuildInfo: The compacted copy of the build info.
+
+    """
+    if bi.modules is None:
+        return bi
+    return replace(bi, modules=[compact_requested_by(m) for m in bi.modules])
+
+
+def expand_build_info(bi: BuildInfo) -> BuildInfo:
+    """
+
+    Args:
+        bi (BuildInfo): The build info to expand.
+
+    Returns:
+        BuildInfo: A copy of the build info whose dependencies store their
+            requesting chains as plain lists.
+
+    """
+    if bi.modules is None:
+        return bi
+    return replace(bi, modules=[expand_requested_by(m) for m in bi.modules])
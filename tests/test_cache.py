@@ -0,0 +1,141 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from pathlib import Path
+from random import Random
+
+from buildinfo_om import (
+    Artifact,
+    BuildInfo,
+    Dependency,
+    MergeCache,
+    Module,
+    merge_build_info,
+    save_to_file,
+)
+
+
+def _fragment(random: Random, number: int) -> BuildInfo:
+    modules: list[Module] = []
+    for index in random.sample(range(6), 3):
+        modules.append(
+            Module(
+                id=f"module-{index}" if index > 0 else None,
+                type=random.choice([None, "python"]),
+                properties={f"p{number}": str(number)},
+                artifacts=[
+                    Artifact(
+                        type="whl",
+                        name=f"a{a}.whl",
+                        sha1=random.choice([None, f"{number:040x}"]),
+                    )
+                    for a in random.sample(range(8), 4)
+                ],
+                dependencies=[
+                    Dependency(
+                        id=f"d{d}",
+                        scopes=[f"s{number}"],
+                        requestedBy=[[f"module-{index}"], [f"r{number}"]],
+                    )
+                    for d in random.sample(range(8), 4)
+                ],
+            )
+        )
+    return BuildInfo(
+        name="build",
+        number="1",
+        properties={"shared": str(number), f"own-{number}": "1"},
+        modules=modules,
+    )
+
+
+def test_incremental_merge_equals_full_merge() -> None:
+    random = Random(27)
+    cache = MergeCache()
+    fragments: dict[str, BuildInfo] = {}
+
+    # enough fragments to span several buckets of contributions
+    for step in range(150):
+        name: str = f"fragment-{random.randrange(80)}"
+        if name in fragments and random.random() < 0.3:
+            del fragments[name]
+            assert cache.remove(name)
+        else:
+            fragments[name] = _fragment(random, step)
+            assert cache.update(name, fragments[name])
+
+        ordered = [fragments[n] for n in cache.fingerprints]
+        assert cache.merge() == merge_build_info(*ordered)
+
+
+def test_unchanged_fragment_keeps_the_result() -> None:
+    random = Random(1)
+    cache = MergeCache()
+    fragment = _fragment(random, 1)
+    cache.update("a", fragment)
+    result = cache.merge()
+
+    assert not cache.update("a", fragment)
+    assert cache.merge() is result
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    random = Random(2)
+    first, second, third = (_fragment(random, n) for n in range(3))
+    save_to_file(second, tmp_path / "second.json")
+    cache = MergeCache()
+    cache.update("first", first)
+    cache.update_from_file(tmp_path / "second.json", "second")
+    cache.merge()
+
+    cache.save(tmp_path / "cache.bin")
+    loaded = MergeCache.load(tmp_path / "cache.bin")
+    loaded.update("third", third)
+    loaded.remove("first")
+
+    assert "first" not in loaded and len(loaded) == 2
+    assert not loaded.update_from_file(tmp_path / "second.json", "second")
+    assert loaded.merge() == merge_build_info(second, third)
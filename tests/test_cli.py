@@ -0,0 +1,154 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from buildinfo_om import (
+    Artifact,
+    BuildInfo,
+    Module,
+    load_from_file,
+    save_to_file,
+)
+from buildinfo_om._cli import main
+
+
+def _save(
+    path: Path,
+    module: str = "app",
+    sha1: str = "aa" * 20,
+    name: str | None = "build",
+    number: str | None = "1",
+) -> str:
+    save_to_file(
+        BuildInfo(
+            name=name,
+            number=number,
+            modules=[
+                Module(
+                    id=module,
+                    artifacts=[
+                        Artifact(type="whl", name="app.whl", sha1=sha1)
+                    ],
+                )
+            ],
+        ),
+        path,
+    )
+    return str(path)
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_merge(tmp_path: Path, workers: str) -> None:
+    files = [_save(tmp_path / f"{i}.json", f"module-{i}") for i in range(5)]
+    target = tmp_path / "merged.json"
+
+    exit_code = main(["merge", "-j", workers, "-o", str(target), *files])
+
+    assert exit_code == 0
+    merged = load_from_file(target)
+    assert [m.id for m in merged.modules] == [f"module-{i}" for i in range(5)]
+
+
+def test_merge_without_build_name(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    files = [
+        _save(tmp_path / "a.json", name=None),
+        _save(tmp_path / "b.json", "other", number=None),
+    ]
+
+    assert main(["merge", *files]) == 2
+    assert "name and a number" in capsys.readouterr().err
+
+
+def test_invalid_file_is_reported_with_its_path(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    valid = _save(tmp_path / "valid.json")
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"modules": 1}', encoding="utf-8")
+
+    assert main(["diff", valid, str(invalid)]) == 2
+    assert str(invalid) in capsys.readouterr().err
+
+    assert main(["validate", "-q", valid, str(invalid)]) == 1
+    assert capsys.readouterr().out.startswith(f"INVALID {invalid}: ")
+
+
+def test_diff_reports_old_checksums(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    old = _save(tmp_path / "old.json")
+    new = _save(tmp_path / "new.json", sha1="bb" * 20)
+
+    assert main(["diff", old, old]) == 0
+    assert capsys.readouterr().out == ""
+
+    assert main(["diff", old, new]) == 1
+    records = [json.loads(r) for r in capsys.readouterr().out.splitlines()]
+    assert [r["scope"] for r in records] == ["MODULE", "ARTIFACT"]
+    assert records[1]["old_checksums"] == [None, "aa" * 20, None]
+
+
+def test_convert_rejects_colliding_targets(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    first = _save(tmp_path / "a" / "build.json")
+    second = _save(tmp_path / "b" / "build.json")
+    target = tmp_path / "converted"
+
+    assert main(["convert", "-d", str(target), first, second]) == 2
+    assert "would both be converted" in capsys.readouterr().err
+    assert not target.exists()
+
+    assert main(["convert", "-d", str(target), first]) == 0
+    assert load_from_file(target / "build.json") == load_from_file(Path(first))
@@ -0,0 +1,141 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from pathlib import Path
+
+import pytest
+
+from buildinfo_om import (
+    Artifact,
+    BuildInfo,
+    DeltaArchive,
+    Dependency,
+    Module,
+    apply_delta,
+    load_delta,
+    save_delta,
+    transform_to_delta,
+    transform_to_str,
+)
+
+
+def _build(number: int) -> BuildInfo:
+    return BuildInfo(
+        name="build",
+        number=str(number),
+        modules=[
+            Module(
+                id="app",
+                artifacts=[
+                    Artifact(
+                        type="whl", name=f"app-{number}.whl", sha1=f"{number}"
+                    )
+                ],
+                dependencies=[
+                    Dependency(id=f"lib:{i}", requestedBy=[["app"]])
+                    for i in range(number % 4 + 1)
+                ],
+            )
+        ],
+    )
+
+
+def test_delta_round_trip(tmp_path: Path) -> None:
+    base = _build(1)
+    bi = _build(2)
+
+    assert transform_to_str(
+        apply_delta(base, transform_to_delta(base, bi))
+    ) == transform_to_str(bi)
+
+    path = tmp_path / "build.delta.json"
+    save_delta(base, bi, path)
+    assert transform_to_str(load_delta(base, path)) == transform_to_str(bi)
+
+
+def test_archive_restores_all_builds(tmp_path: Path) -> None:
+    archive = DeltaArchive(tmp_path, snapshot_interval=3, cache_size=1)
+    builds = [_build(n) for n in range(8)]
+    for expected, bi in enumerate(builds):
+        assert archive.append(bi) == expected
+
+    assert len(archive) == len(builds)
+    assert sorted(p.name for p in tmp_path.glob("*.json"))[:4] == [
+        "00000000.json",
+        "00000001.delta.json",
+        "00000002.delta.json",
+        "00000003.json",
+    ]
+    for index in reversed(range(len(builds))):
+        assert transform_to_str(archive.load(index)) == transform_to_str(
+            builds[index]
+        )
+
+
+def test_archive_reopened_with_other_interval(tmp_path: Path) -> None:
+    builds = [_build(n) for n in range(10)]
+    archive = DeltaArchive(tmp_path, snapshot_interval=4)
+    for bi in builds[:6]:
+        archive.append(bi)
+
+    reopened = DeltaArchive(tmp_path, snapshot_interval=3)
+    for bi in builds[6:]:
+        reopened.append(bi)
+
+    assert len(reopened) == len(builds)
+    assert (tmp_path / "00000007.json").exists()
+    for index, bi in enumerate(builds):
+        assert transform_to_str(reopened.load(index)) == transform_to_str(bi)
+
+
+def test_archive_rejects_unknown_builds(tmp_path: Path) -> None:
+    archive = DeltaArchive(tmp_path)
+    archive.append(_build(1))
+
+    with pytest.raises(IndexError):
+        archive.load(1)
+    with pytest.raises(ValueError):
+        DeltaArchive(tmp_path, snapshot_interval=0)
@@ -0,0 +1,139 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from pathlib import Path
+
+from buildinfo_om import (
+    Artifact,
+    BuildInfo,
+    ChangeKind,
+    ChangeScope,
+    Dependency,
+    Module,
+    diff_build_info,
+    iter_build_info_diff,
+    load_from_str,
+    save_to_file,
+    transform_to_str,
+)
+
+
+def _build(sha1: str = "aa" * 20) -> BuildInfo:
+    return BuildInfo(
+        name="build",
+        number="1",
+        modules=[
+            Module(
+                id="app",
+                artifacts=[Artifact(type="whl", name="app.whl", sha1=sha1)],
+                dependencies=[
+                    Dependency(id="lib", requestedBy=(("app",),)),
+                    Dependency(id="base", requestedBy=(("lib", "app"),)),
+                ],
+            )
+        ],
+    )
+
+
+def test_reloaded_build_has_no_changes() -> None:
+    built = _build()
+    reloaded = load_from_str(transform_to_str(built))
+
+    assert not diff_build_info(built, reloaded)
+    assert not list(iter_build_info_diff(built, reloaded))
+
+
+def test_changed_checksum_is_reported() -> None:
+    diff = diff_build_info(_build(), _build("bb" * 20))
+
+    assert [c.key for c in diff.changed_checksums] == [
+        ("whl", "app.whl", None)
+    ]
+    assert diff.changed_checksums[0].old_checksums == (None, "aa" * 20, None)
+
+
+def test_changed_checksum_is_reported_for_files(tmp_path: Path) -> None:
+    old = tmp_path / "old.json"
+    new = tmp_path / "new.json"
+    save_to_file(_build(), old)
+    save_to_file(_build("bb" * 20), new)
+
+    changes = list(iter_build_info_diff(str(old), str(new)))
+
+    assert [(c.kind, c.scope) for c in changes] == [
+        (ChangeKind.CHANGED, ChangeScope.MODULE),
+        (ChangeKind.CHANGED, ChangeScope.ARTIFACT),
+    ]
+    assert changes[1].old is None
+    assert changes[1].old_checksums == (None, "aa" * 20, None)
+
+
+def test_unchanged_artifacts_are_not_reported_as_checksum_changes() -> None:
+    old = _build()
+    new = _build()
+    new.modules[0].dependencies = [Dependency(id="lib")]
+
+    changes = list(iter_build_info_diff(old, new))
+
+    assert [c.scope for c in changes] == [
+        ChangeScope.MODULE,
+        ChangeScope.DEPENDENCY,
+        ChangeScope.DEPENDENCY,
+    ]
+    assert not diff_build_info(old, new).changed_checksums
+
+
+def test_added_and_removed_modules() -> None:
+    old = _build()
+    new = _build()
+    new.modules = [Module(id="other")]
+
+    diff = diff_build_info(old, new)
+
+    assert [(c.kind, c.key) for c in diff.modules] == [
+        (ChangeKind.ADDED, "other"),
+        (ChangeKind.REMOVED, "app"),
+    ]
@@ -0,0 +1,80 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from buildinfo_om import (
+    ArtifactBuilder,
+    ModuleBuilder,
+    Recorder,
+    TrackerBuilder,
+    observe,
+)
+
+
+def test_build_counts_built_objects():
+    recorder = Recorder()
+    builder = (
+        ModuleBuilder()
+        .with_id("module")
+        .with_artifacts(
+            ArtifactBuilder().with_name("a.whl"),
+            ArtifactBuilder().with_name("b.whl"),
+        )
+    )
+
+    with observe(recorder):
+        TrackerBuilder().with_name("tracker").with_version("1").build()
+        builder.build()
+
+    assert recorder.counters["objects.built"] == 4
+
+
+def test_build_many_counts_built_objects():
+    recorder = Recorder()
+
+    with observe(recorder):
+        ArtifactBuilder.build_many(names=["a.whl", "b.whl", "c.whl"])
+
+    assert recorder.counters["objects.built"] == 3
@@ -0,0 +1,178 @@
+#
+#
+# SPDX-Identifier: Apache 2.0 OR MIT
+#
+# Copyright (c) 2024 Carsten Igel.
+#
+# This file is part of pdm-bump
+# (see https://github.com/carstencodes/pdm-bump).
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+#  == OR ==
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+
+"""
+"""
+
+from pathlib import Path
+
+from buildinfo_om import (
+    dependencies_from_pdm_lock,
+    dependencies_from_requirements,
+)
+
+_DIAMOND: str = """\
+a==1.0
+    # via -r requirements.in
+b==2.0
+    # via a
+c==3.0
+    # via a
+d==4.0 \\
+    --hash=sha256:abcd
+    # via
+    #   b
+    #   c
+"""
+
+
+def _requested_by(dependencies):
+    return {d.id: d.requestedBy for d in dependencies}
+
+
+def test_requirements_diamond(tmp_path: Path):
+    path = tmp_path / "requirements.txt"
+    path.write_text(_DIAMOND, encoding="utf-8")
+
+    dependencies = dependencies_from_requirements(
+        path, root_id="app:1", scopes=["runtime"]
+    )
+
+    assert [d.id for d in dependencies] == ["a:1.0", "b:2.0", "c:3.0", "d:4.0"]
+    assert _requested_by(dependencies) == {
+        "a:1.0": (("app:1",),),
+        "b:2.0": (("a:1.0", "app:1"),),
+        "c:3.0": (("a:1.0", "app:1"),),
+        "d:4.0": (
+            ("b:2.0", "a:1.0", "app:1"),
+            ("c:3.0", "a:1.0", "app:1"),
+        ),
+    }
+    assert dependencies[3].sha256 == "abcd"
+    assert dependencies[3].scopes == ("runtime",)
+
+
+def test_requirements_direct_and_transitive(tmp_path: Path):
+    path = tmp_path / "requirements.txt"
+    path.write_text(
+        "a==1.0\n"
+        "    # via -r requirements.in\n"
+        "b==2.0\n"
+        "    # via\n"
+        "    #   -r requirements.in\n"
+        "    #   a\n",
+        encoding="utf-8",
+    )
+
+    with_root = _requested_by(
+        dependencies_from_requirements(path, root_id="app:1")
+    )
+    without_root = _requested_by(dependencies_from_requirements(path))
+
+    assert with_root["b:2.0"] == (("app:1",), ("a:1.0", "app:1"))
+    assert without_root == {"a:1.0": None, "b:2.0": (("a:1.0",),)}
+
+
+def test_requirements_chains_are_capped(tmp_path: Path):
+    # a ladder of 20 diamonds has 2 ** 20 paths from top to bottom
+    lines: list[str] = ["p0==1\n"]
+    for level in range(20):
+        lines.append(f"l{level}==1\n    # via p{level}\n")
+        lines.append(f"r{level}==1\n    # via p{level}\n")
+        lines.append(f"p{level + 1}==1\n    # via l{level}, r{level}\n")
+    path = tmp_path / "requirements.txt"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    dependencies = dependencies_from_requirements(path, root_id="app:1")
+
+    bottom = dependencies[-1]
+    assert bottom.id == "p20:1"
+    assert 0 < len(bottom.requestedBy) <= 64
+    assert all(c[-1] == "app:1" for c in bottom.requestedBy)
+
+
+def test_pdm_lock(tmp_path: Path):
+    path = tmp_path / "pdm.lock"
+    path.write_text(
+        """\
+[[package]]
+name = "Top_Level"
+version = "1.0"
+groups = ["default"]
+dependencies = ["left>=1", "right; python_version > '3'"]
+files = [
+    {file = "top_level-1.0-py3-none-any.whl", hash = "sha256:1234"},
+]
+
+[[package]]
+name = "left"
+version = "2.0"
+groups = ["default"]
+dependencies = ["bottom"]
+
+[[package]]
+name = "right"
+version = "3.0"
+groups = ["default", "dev"]
+dependencies = ["bottom"]
+
+[[package]]
+name = "bottom"
+version = "4.0"
+groups = ["default"]
+files = [{file = "bottom-4.0.tar.gz", hash = "md5:5678"}]
+""",
+        encoding="utf-8",
+    )
+
+    dependencies = dependencies_from_pdm_lock(path, root_id="app:1")
+
+    top, left, right, bottom = dependencies
+    assert (top.id, top.type, top.sha256) == ("Top_Level:1.0", "whl", "1234")
+    assert (bottom.type, bottom.sha256) == ("tar.gz", None)
+    assert right.scopes == ("default", "dev")
+    assert left.requestedBy == (("Top_Level:1.0", "app:1"),)
+    assert bottom.requestedBy == (
+        ("left:2.0", "Top_Level:1.0", "app:1"),
+        ("right:3.0", "Top_Level:1.0", "app:1"),
+    )